@@ -1,9 +1,56 @@
-from . import collection, model, rdf, shared
-from .commands import update_format, update_rdf, validate
-from .io_ import (
-    get_resource_package_content,
-    load_raw_resource_description,
-    serialize_raw_resource_description,
-    serialize_raw_resource_description_to_dict,
-)
+import importlib
+import typing
+
 from .v import __version__
+
+if typing.TYPE_CHECKING:
+    from . import collection, dataset, model, rdf, shared
+    from .async_ import (
+        load_raw_resource_description_async,
+        prefetch_resources_async,
+        resolve_source_async,
+        validate_async,
+    )
+    from .commands import update_format, update_rdf, validate
+    from .io_ import (
+        get_resource_package_content,
+        load_raw_resource_description,
+        prefetch_resources,
+        serialize_raw_resource_description,
+        serialize_raw_resource_description_to_dict,
+        write_resource_package,
+    )
+
+# submodules and their members are only imported on first access (PEP 562),
+# such that importing bioimageio.spec does not build schemas of unused RDF types and format versions
+_submodules = ("async_", "collection", "commands", "dataset", "io_", "model", "partner", "rdf", "shared")
+_submodule_members = {
+    "load_raw_resource_description_async": "async_",
+    "prefetch_resources_async": "async_",
+    "resolve_source_async": "async_",
+    "validate_async": "async_",
+    "update_format": "commands",
+    "update_rdf": "commands",
+    "validate": "commands",
+    "get_resource_package_content": "io_",
+    "load_raw_resource_description": "io_",
+    "prefetch_resources": "io_",
+    "serialize_raw_resource_description": "io_",
+    "serialize_raw_resource_description_to_dict": "io_",
+    "write_resource_package": "io_",
+}
+
+
+def __getattr__(name: str):
+    if name in _submodules:
+        return importlib.import_module(f"{__name__}.{name}")
+    elif name in _submodule_members:
+        member = getattr(importlib.import_module(f"{__name__}.{_submodule_members[name]}"), name)
+        globals()[name] = member
+        return member
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_submodules) | set(_submodule_members))
@@ -1,21 +1,33 @@
+import ast
 import sys
+from importlib.util import find_spec
 from pathlib import Path
 from pprint import pprint
-from typing import Any, Callable, Dict, Optional, Union
+from typing import List, Optional
 
 import typer
 
-from bioimageio.spec import __version__, collection, commands, model, rdf
-from bioimageio.spec.shared.raw_nodes import URI
+# commands (and with them schemas, io, etc.) and the partner module are only imported when a subcommand is invoked,
+# such that, e.g., 'bioimageio --help' starts fast
+from bioimageio.spec import __version__, collection, model, rdf
 
-enrich_partial_rdf_with_imjoy_plugin: Optional[Callable[[Dict[str, Any], Union[URI, Path]], Dict[str, Any]]]
-try:
-    from bioimageio.spec.partner.utils import enrich_partial_rdf_with_imjoy_plugin
-except ImportError:
-    enrich_partial_rdf_with_imjoy_plugin = None
-    partner_help = ""
-else:
+
+def _get_commands_doc(name: str) -> Optional[str]:
+    """get docstring of a function in bioimageio.spec.commands without importing it"""
+    commands_path = Path(__file__).parent / "commands.py"
+    for node in ast.parse(commands_path.read_text(encoding="utf-8")).body:
+        if isinstance(node, ast.FunctionDef) and node.name == name:
+            return ast.get_docstring(node, clean=False)
+
+    return None
+
+
+# the partner module depends on optional lxml and requests
+partner_available = find_spec("lxml") is not None and find_spec("requests") is not None
+if partner_available:
     partner_help = f"\n+\nbioimageio.spec.partner {__version__}\nimplementing:\n\tpartner collection RDF {collection.format_version}"
+else:
+    partner_help = ""
 
 help_version = (
     f"bioimageio.spec {__version__}"
@@ -45,8 +57,13 @@ def validate(
         None, help="For collection RDFs only. Defaults to value of 'update-format'."
     ),
     verbose: bool = typer.Option(False, help="show traceback of unexpected (no ValidationError) exceptions"),
+    cache_stats: bool = typer.Option(
+        False, help="show cache hits and misses, transferred bytes and time spent downloading and extracting"
+    ),
 ):
-    summary = commands.validate(rdf_source, update_format, update_format_inner)
+    from bioimageio.spec import commands
+
+    summary = commands.validate(rdf_source, update_format, update_format_inner, cache_stats=cache_stats)
     if summary["error"] is not None:
         print(f"Error in {summary['name']}:")
         pprint(summary["error"])
@@ -62,13 +79,17 @@ def validate(
         print(f"Validation Warnings for {summary['name']}:")
         pprint(summary["warnings"])
 
+    if cache_stats:
+        print("Cache stats:")
+        pprint(summary["cache_stats"])
+
     sys.exit(ret_code)
 
 
-validate.__doc__ = commands.validate.__doc__
+validate.__doc__ = _get_commands_doc("validate")
 
 
-if enrich_partial_rdf_with_imjoy_plugin is not None:
+if partner_available:
 
     @app.command()
     def validate_partner_collection(
@@ -84,7 +105,9 @@ if enrich_partial_rdf_with_imjoy_plugin is not None:
         ),
         verbose: bool = typer.Option(False, help="show traceback of unexpected (no ValidationError) exceptions"),
     ):
-        assert enrich_partial_rdf_with_imjoy_plugin is not None
+        from bioimageio.spec import commands
+        from bioimageio.spec.partner.utils import enrich_partial_rdf_with_imjoy_plugin
+
         summary = commands.validate(
             rdf_source, update_format, update_format_inner, enrich_partial_rdf=enrich_partial_rdf_with_imjoy_plugin
         )
@@ -105,7 +128,7 @@ if enrich_partial_rdf_with_imjoy_plugin is not None:
 
         sys.exit(ret_code)
 
-    cmd_doc = commands.validate.__doc__
+    cmd_doc = _get_commands_doc("validate")
     assert cmd_doc is not None
     validate_partner_collection.__doc__ = (
         "A special version of the bioimageio validate command that enriches the RDFs defined in collections by parsing any "
@@ -119,6 +142,8 @@ def update_format(
     rdf_source: str = typer.Argument(..., help="RDF source as relative file path or URI"),
     path: str = typer.Argument(..., help="Path to save the RDF converted to the latest format"),
 ):
+    from bioimageio.spec import commands
+
     try:
         commands.update_format(rdf_source, path)
         ret_code = 0
@@ -128,7 +153,7 @@ def update_format(
     sys.exit(ret_code)
 
 
-update_format.__doc__ = commands.update_format.__doc__
+update_format.__doc__ = _get_commands_doc("update_format")
 
 
 @app.command()
@@ -139,6 +164,8 @@ def update_rdf(
     validate: bool = typer.Option(True, help="Whether or not to validate the updated RDF"),
 ):
     """Update a given RDF with a (partial) RDF-like update"""
+    from bioimageio.spec import commands
+
     try:
         commands.update_rdf(source, update, output, validate)
         ret_code = 0
@@ -148,6 +175,33 @@ def update_rdf(
     sys.exit(ret_code)
 
 
+@app.command()
+def prefetch(
+    rdf_source: str = typer.Argument(..., help="RDF source as relative file path or URI"),
+    max_workers: int = typer.Option(8, help="Maximum number of concurrent downloads"),
+    weights_priority_order: Optional[List[str]] = typer.Option(
+        None,
+        "--weights-priority-order",
+        "-wpo",
+        help="For model RDFs only. Prefetch only the first weights format present in the model "
+        "(all if none of the given formats is present).",
+    ),
+):
+    """Download all remote files of a resource (weights, test tensors, covers, etc.) concurrently into the cache"""
+    from bioimageio.spec.io_ import prefetch_resources
+
+    try:
+        local_paths = prefetch_resources(
+            rdf_source, max_workers=max_workers, weights_priority_order=weights_priority_order or None
+        )
+        print(f"prefetched {len(local_paths)} files")
+        ret_code = 0
+    except Exception as e:
+        print(f"prefetch failed with {e}")
+        ret_code = 1
+    sys.exit(ret_code)
+
+
 @app.callback()
 def callback():
     typer.echo(help_version)
@@ -0,0 +1,66 @@
+"""asyncio counterparts of the blocking source resolution, loading and validation functions
+
+The blocking work (downloads, yaml parsing, schema (de)serialization) runs in the event loop's default executor,
+sharing the download cache and the pooled HTTP connections with the synchronous functions.
+Use `loop.set_default_executor` to limit the number of concurrent workers.
+"""
+import asyncio
+import os
+import pathlib
+from functools import partial
+from typing import Any, Callable, Dict, IO, List, Optional, TypeVar, Union
+
+from bioimageio.spec.shared.common import ValidationSummary
+from bioimageio.spec.shared.raw_nodes import ResourceDescription as RawResourceDescription, URI
+
+T = TypeVar("T")
+
+
+async def _run_in_executor(func: Callable[..., T], *args, **kwargs) -> T:
+    return await asyncio.get_running_loop().run_in_executor(None, partial(func, *args, **kwargs))
+
+
+async def resolve_source_async(
+    source: Any, root_path: Union[os.PathLike, URI] = pathlib.Path(), output: Optional[os.PathLike] = None, **kwargs
+) -> Union[pathlib.Path, List[pathlib.Path]]:
+    """asyncio version of `resolve_source`; the elements of a list `source` are resolved concurrently"""
+    from bioimageio.spec.shared import resolve_source
+
+    if isinstance(source, list):
+        if output is not None:
+            raise NotImplementedError("output for list source")
+
+        return list(await asyncio.gather(*(resolve_source_async(s, root_path, **kwargs) for s in source)))
+
+    return await _run_in_executor(resolve_source, source, root_path, output, **kwargs)
+
+
+async def load_raw_resource_description_async(
+    source: Union[dict, os.PathLike, IO, str, bytes, URI, RawResourceDescription], **kwargs
+) -> RawResourceDescription:
+    """asyncio version of `load_raw_resource_description`"""
+    from bioimageio.spec.io_ import load_raw_resource_description
+
+    return await _run_in_executor(load_raw_resource_description, source, **kwargs)
+
+
+async def prefetch_resources_async(
+    raw_rd: Union[RawResourceDescription, URI, str, pathlib.Path], **kwargs
+) -> Dict[str, pathlib.Path]:
+    """asyncio version of `prefetch_resources` (downloads run concurrently in its own thread pool)"""
+    from bioimageio.spec.io_ import prefetch_resources
+
+    return await _run_in_executor(prefetch_resources, raw_rd, **kwargs)
+
+
+async def validate_async(
+    rdf_source: Union[RawResourceDescription, dict, os.PathLike, IO, str, bytes], **kwargs
+) -> ValidationSummary:
+    """asyncio version of `validate`
+
+    Note: warnings are captured per thread, such that concurrent validations run concurrently and only report their own
+    warnings.
+    """
+    from bioimageio.spec.commands import validate
+
+    return await _run_in_executor(validate, rdf_source, **kwargs)
@@ -1,6 +1,8 @@
 import os
+import threading
 import traceback
 import warnings
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Callable, Dict, IO, List, Optional, Union
 
@@ -13,12 +15,64 @@ from .io_ import (
     save_raw_resource_description,
     serialize_raw_resource_description_to_dict,
 )
-from .shared import update_nested
+from .shared import collect_cache_stats, update_nested
 from .shared.common import ValidationSummary, ValidationWarning, nested_default_dict_as_nested_dict, yaml
 from .shared.raw_nodes import ResourceDescription as RawResourceDescription, URI
 from .v import __version__
 
 
+# `warnings.catch_warnings` swaps process-global state, such that warnings of concurrent validations (e.g.
+# `validate_async`) would end up in the wrong summary (or none). Instead, while any thread captures warnings, all
+# warnings are shown (not only the first occurrence) and dispatched to the innermost capture of the warning's thread;
+# warnings of other threads are passed on to the original `warnings.showwarning`.
+_capturing = threading.local()
+_capture_lock = threading.Lock()
+_capture_count = 0
+_capture_state: Optional[warnings.catch_warnings] = None
+_original_showwarning = warnings.showwarning
+
+
+def _show_warning(message, category, filename, lineno, file=None, line=None):
+    captures = getattr(_capturing, "captures", None)
+    if captures:
+        captures[-1].append(warnings.WarningMessage(message, category, filename, lineno, file, line))
+    else:
+        _original_showwarning(message, category, filename, lineno, file, line)
+
+
+@contextmanager
+def _capture_warnings():
+    """record the warnings of the current thread (like `warnings.catch_warnings(record=True)`)"""
+    global _capture_count, _capture_state, _original_showwarning
+
+    with _capture_lock:
+        if _capture_count == 0:
+            _capture_state = warnings.catch_warnings()
+            _capture_state.__enter__()
+            _original_showwarning = warnings.showwarning
+            warnings.showwarning = _show_warning
+            warnings.simplefilter("always")
+
+        _capture_count += 1
+
+    captures = getattr(_capturing, "captures", None)
+    if captures is None:
+        captures = _capturing.captures = []
+
+    captured: List[warnings.WarningMessage] = []
+    captures.append(captured)
+    try:
+        yield captured
+    finally:
+        captures.pop()
+        with _capture_lock:
+            _capture_count -= 1
+            if _capture_count == 0:
+                assert _capture_state is not None
+                _capture_state.__exit__(None, None, None)
+                _capture_state = None
+
+
 def update_format(
     rdf_source: Union[dict, os.PathLike, IO, str, bytes],
     path: Union[os.PathLike, str],
@@ -35,6 +89,7 @@ def validate(
     update_format_inner: Optional[bool] = None,
     verbose: bool = "deprecated",  # type: ignore
     enrich_partial_rdf: Callable[[dict, Union[URI, Path]], dict] = default_enrich_partial_rdf,
+    cache_stats: bool = False,
 ) -> ValidationSummary:
     """Validate a BioImage.IO Resource Description File (RDF).
 
@@ -45,6 +100,8 @@ def validate(
         verbose: deprecated
         enrich_partial_rdf: (optional) callable to customize RDF data on the fly.
                             Don't use this if you don't know exactly what to do with it.
+        cache_stats: include the cache hits and misses, transferred bytes and time spent downloading and extracting
+                     by this validation (see `bioimageio.spec.shared.collect_cache_stats`) as 'cache_stats'
 
     Returns:
         A summary dict with keys:
@@ -56,6 +113,7 @@ def validate(
             status,
             traceback,
             warnings,
+            cache_stats (only if `cache_stats`)
     """
     if verbose != "deprecated":
         warnings.warn("'verbose' flag is deprecated")
@@ -63,10 +121,26 @@ def validate(
     if update_format_inner is None:
         update_format_inner = update_format
 
+    if not cache_stats:
+        return _validate(rdf_source, update_format, update_format_inner, enrich_partial_rdf)
+
+    with collect_cache_stats() as collector:
+        summary = _validate(rdf_source, update_format, update_format_inner, enrich_partial_rdf)
+
+    summary["cache_stats"] = collector.stats._asdict()
+    return summary
+
+
+def _validate(
+    rdf_source: Union[RawResourceDescription, dict, os.PathLike, IO, str, bytes],
+    update_format: bool,
+    update_format_inner: bool,
+    enrich_partial_rdf: Callable[[dict, Union[URI, Path]], dict],
+) -> ValidationSummary:
     error: Union[None, str, Dict[str, Any]] = None
     tb = None
     nested_errors: Dict[str, dict] = {}
-    with warnings.catch_warnings(record=True) as warnings1:
+    with _capture_warnings() as warnings1:
         if isinstance(rdf_source, RawResourceDescription):
             source_name = rdf_source.name
         else:
@@ -88,7 +162,7 @@ def validate(
     format_version = ""
     resource_type = ""
     if not error:
-        with warnings.catch_warnings(record=True) as warnings2:
+        with _capture_warnings() as warnings2:
             try:
                 raw_rd = load_raw_resource_description(rdf_source, update_to_format="latest" if update_format else None)
             except ValidationError as e:
@@ -130,7 +204,7 @@ def validate(
 
             all_warnings += warnings2 or []
 
-    return {
+    summary: ValidationSummary = {
         "bioimageio_spec_version": __version__,
         "error": error,
         "name": (
@@ -143,6 +217,7 @@ def validate(
         "traceback": tb,
         "warnings": ValidationWarning.get_warning_summary(all_warnings),
     }
+    return summary
 
 
 def update_rdf(
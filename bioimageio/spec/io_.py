@@ -4,18 +4,34 @@ which is a python dataclass
 """
 import os
 import pathlib
+import threading
+import typing
 import warnings
 import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from copy import deepcopy
 from hashlib import sha256
 from io import StringIO
-from tempfile import TemporaryDirectory
+from tempfile import SpooledTemporaryFile, TemporaryDirectory
 from types import ModuleType
-from typing import Dict, IO, Optional, Sequence, Tuple, Union
+from typing import Callable, Dict, IO, Iterable, Iterator, List, Optional, Sequence, Set, Tuple, Union
 
 from marshmallow import ValidationError, missing
 from packaging.version import Version
 
-from bioimageio.spec.shared import RDF_NAMES, raw_nodes, resolve_rdf_source, resolve_rdf_source_and_type, resolve_source
+from bioimageio.spec.shared import (
+    RDF_NAMES,
+    cache_manager,
+    raw_nodes,
+    register_expected_sha256,
+    resolve_rdf_source,
+    resolve_rdf_source_and_type,
+    resolve_source,
+    stream_source,
+)
+from bioimageio.spec.shared._zip_root import EXTRACTION_COMPLETE_MARKER, ZipRoot, materialize  # noqa
+from bioimageio.spec.shared._zip_writer import SUPPORTED_COMPRESSION, ZipWriter, compress_chunks
 from bioimageio.spec.shared.common import (
     BIOIMAGEIO_CACHE_PATH,
     BIOIMAGEIO_USE_CACHE,
@@ -24,18 +40,24 @@ from bioimageio.spec.shared.common import (
     get_latest_format_version,
     get_latest_format_version_module,
     no_cache_tmp_list,
+    tqdm,
     yaml,
 )
 from bioimageio.spec.shared.node_transformer import (
     AbsoluteToRelativePathTransformer,
+    ExpectedSha256Collector,
     GenericRawNode,
     GenericRawRD,
     RawNodePackageTransformer,
     RelativePathTransformer,
+    RemoteResourceCollector,
 )
 from bioimageio.spec.shared.raw_nodes import ResourceDescription as RawResourceDescription
 from bioimageio.spec.shared.schema import SharedBioImageIOSchema
 
+if typing.TYPE_CHECKING:
+    from bioimageio.spec.shared._cache import CachePolicy
+
 try:
     from typing import Protocol
 except ImportError:
@@ -77,67 +99,151 @@ def _get_spec_submodule(type_: str, data_version: str = LATEST) -> SpecSubmodule
     return sub_spec
 
 
+class _SchemaPool:
+    """pool of ready-to-use resource description schema instances per (type, format_version).
+
+    Building a schema (and its nested schemas on first use) is costly compared to loading a single RDF,
+    so instances are reused. A pooled instance is only ever used by one thread at a time.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._idle: Dict[Tuple[str, str], List[SharedBioImageIOSchema]] = {}
+
+    @contextmanager
+    def schema(self, type_: str, sub_spec: SpecSubmodule) -> Iterator[SharedBioImageIOSchema]:
+        key = (type_, sub_spec.format_version)
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            schema = idle.pop() if idle else None
+
+        if schema is None:
+            schema = getattr(sub_spec.schema, get_class_name_from_type(type_))()
+
+        try:
+            yield schema
+        finally:
+            with self._lock:
+                self._idle[key].append(schema)
+
+    def clear(self):
+        with self._lock:
+            self._idle.clear()
+
+
+_schema_pool = _SchemaPool()
+
+
 def extract_resource_package(
-    source: Union[os.PathLike, IO, str, bytes, raw_nodes.URI]
+    source: Union[os.PathLike, IO, str, bytes, raw_nodes.URI],
+    *,
+    full_hash: bool = False,
+    weights_priority_order: Optional[Sequence[str]] = None,  # model only
+    member_filter: Optional[Callable[[str], bool]] = None,
 ) -> Tuple[dict, str, pathlib.Path]:
-    """extract a zip source to BIOIMAGEIO_CACHE_PATH"""
+    """extract a zip source to BIOIMAGEIO_CACHE_PATH
+
+    Extractions are keyed by the package's content fingerprint (see `bioimageio.spec.shared.get_package_fingerprint`),
+    such that a package is only extracted once, regardless of its path, and a package replaced at the same path is
+    extracted anew. Loading a package (see `load_raw_resource_description`) extracts to the same location.
+    Members are only considered extracted once recorded by the extraction marker.
+    With `weights_priority_order` or `member_filter` only the RDF and the selected files are extracted; files selected
+    by a later call are added to the same extraction.
+
+    Args:
+        source: package (zip file)
+        full_hash: fingerprint the package by its full sha256 instead of its size and central directory
+        weights_priority_order: If given only the files referenced by the RDF with only the first weights format
+                                present in the model are extracted (as for `get_resource_package_content`).
+        member_filter: If given only (the RDF and) the members for which `member_filter(<member name>)` is true are
+                       extracted.
+    """
     src, source_name, root = resolve_rdf_source(source)
     if isinstance(root, bytes):
         raise NotImplementedError("package source was bytes")
 
-    if BIOIMAGEIO_USE_CACHE:
-        package_path = BIOIMAGEIO_CACHE_PATH / "extracted_packages" / sha256(str(root).encode("utf-8")).hexdigest()
-        package_path.mkdir(exist_ok=True, parents=True)
+    select = _get_member_selector(src, weights_priority_order=weights_priority_order, member_filter=member_filter)
+    if isinstance(root, raw_nodes.URI):
+        # a remote package is downloaded (or revalidated) like any other remote file
+        local_source = resolve_source(root)
     else:
-        tmp_dir = TemporaryDirectory()
-        no_cache_tmp_list.append(tmp_dir)
-        package_path = pathlib.Path(tmp_dir.name)
+        local_source = pathlib.Path(root)
 
-    if isinstance(root, raw_nodes.URI):
-        for rdf_name in RDF_NAMES:
-            if (package_path / rdf_name).exists():
-                download = None
-                break
-        else:
-            download = resolve_source(root)
+    zip_root = ZipRoot(local_source, full_hash=full_hash, origin=str(root))
+    zip_root.extract(m for m in zip_root.members if select is None or select(m))
+    if zip_root.in_cache:
+        cache_manager.touch(zip_root.path)
 
-        local_source = download
-    else:
-        download = None
-        local_source = root
+    return src, source_name, zip_root.path
 
-    if local_source is not None:
-        with zipfile.ZipFile(local_source) as zf:
-            zf.extractall(package_path)
 
-    for rdf_name in RDF_NAMES:
-        if (package_path / rdf_name).exists():
-            break
+def _filter_resource_description(raw_rd: GenericRawRD, weights_priority_order: Optional[Sequence[str]]) -> GenericRawRD:
+    sub_spec = _get_spec_submodule(raw_rd.type, raw_rd.format_version)
+    if raw_rd.type == "model":
+        filter_kwargs = dict(weights_priority_order=weights_priority_order)
     else:
-        raise FileNotFoundError(f"Missing 'rdf.yaml' in {root} extracted from {download}")
+        filter_kwargs = {}
+
+    return sub_spec.utils.filter_resource_description(raw_rd, **filter_kwargs)
 
-    if download is not None:
-        try:
-            os.remove(download)
-        except Exception as e:
-            warnings.warn(f"Could not remove download {download} due to {e}")
 
-    assert isinstance(package_path, pathlib.Path)
-    return src, source_name, package_path
+def _get_member_selector(
+    rdf: dict, *, weights_priority_order: Optional[Sequence[str]], member_filter: Optional[Callable[[str], bool]]
+) -> Optional[Callable[[str], bool]]:
+    """selects the package members to extract: the RDF and (filtered by `member_filter`) the files it references"""
+    if weights_priority_order is None and member_filter is None:
+        return None
+
+    referenced: Optional[Set[str]] = None
+    if weights_priority_order is not None:
+        # load the RDF relative to a placeholder root to find the package members it references
+        placeholder_root = pathlib.Path().resolve()
+        raw_rd = load_raw_resource_description({**deepcopy(rdf), "root_path": placeholder_root})
+        content: Dict[str, Union[pathlib.PurePath, raw_nodes.URI]] = {}
+        RawNodePackageTransformer(content, placeholder_root).transform(
+            _filter_resource_description(raw_rd, weights_priority_order)
+        )
+        referenced = set()
+        for path in content.values():
+            if isinstance(path, pathlib.Path):
+                try:
+                    referenced.add(path.relative_to(placeholder_root).as_posix())
+                except ValueError:
+                    pass  # not a package member
+
+    def select(member: str) -> bool:
+        if member in RDF_NAMES:
+            return True
+        elif referenced is not None and not any(member == r or member.startswith(f"{r}/") for r in referenced):
+            return False
+        else:
+            return member_filter is None or member_filter(member)
+
+    return select
 
 
 def load_raw_resource_description(
     source: Union[dict, os.PathLike, IO, str, bytes, raw_nodes.URI, RawResourceDescription],
     update_to_format: Optional[str] = None,
+    *,
+    weights_priority_order: Optional[Sequence[str]] = None,  # model only
+    member_filter: Optional[Callable[[str], bool]] = None,
 ) -> RawResourceDescription:
     """load a raw python representation from a BioImage.IO resource description.
     Use `bioimageio.core.load_resource_description` for a more convenient representation of the resource.
     and `bioimageio.core.load_raw_resource_description` to ensure the 'root_path' attribute of the returned object is
     a local file path.
+    The 'root_path' of a resource loaded from a package (zip file) is the directory its files are extracted to.
+    Only the RDF is extracted on load, other files are extracted when resolved, e.g. with `resolve_source`
+    (see `bioimageio.spec.shared.get_zip_root` to read them from the package in place).
 
     Args:
         source: resource description or resource description file (RDF)
         update_to_format: update resource to specific major.minor format version; ignoring patch version.
+        weights_priority_order: If given only the first weights format present in the model is kept and the files
+                                referenced by the remaining resource description are extracted from a package on load.
+        member_filter: If given the members for which `member_filter(<member name>)` is true are extracted from a
+                       package on load.
     Returns:
         raw BioImage.IO resource
     """
@@ -150,6 +256,8 @@ def load_raw_resource_description(
             # do serialization round-trip to account for 'update_to_format' but keep root_path
             root = source.root_path
             source = serialize_raw_resource_description_to_dict(source)
+        elif weights_priority_order is not None and source.type == "model":
+            return _filter_resource_description(source, weights_priority_order)
         else:
             return source
 
@@ -157,8 +265,6 @@ def load_raw_resource_description(
     if root is None:
         root = _root
 
-    class_name = get_class_name_from_type(type_)
-
     # determine submodule's format version
     original_data_version = data.get("format_version")
     if original_data_version is None:
@@ -216,11 +322,10 @@ def load_raw_resource_description(
 
         data["config"]["bioimageio"]["original_format_version"] = original_data_version
 
-    schema: SharedBioImageIOSchema = getattr(sub_spec.schema, class_name)()
-
     data = sub_spec.converters.maybe_convert(data)
     try:
-        raw_rd = schema.load(data)
+        with _schema_pool.schema(type_, sub_spec) as schema:
+            raw_rd = schema.load(data)
     except ValidationError as e:
         if downgrade_format_version:
             e.messages["format_version"] = (
@@ -233,13 +338,30 @@ def load_raw_resource_description(
     if isinstance(root, pathlib.Path):
         root = root.resolve()
         if zipfile.is_zipfile(root):
-            # set root to extracted zip package
-            _, _, root = extract_resource_package(root)
+            # read package members in place; apart from the RDF (and selected members) they are only extracted when a
+            # local path is needed
+            zip_root = ZipRoot(root)
+            select = _get_member_selector(
+                data, weights_priority_order=weights_priority_order, member_filter=member_filter
+            )
+            for member in sorted(zip_root.members):
+                if member in RDF_NAMES or select is not None and select(member):
+                    zip_root.materialize(member)
+
+            root = zip_root.path
     elif isinstance(root, bytes):
         root = pathlib.Path().resolve()
 
     raw_rd.root_path = root
     raw_rd = RelativePathTransformer(root=root).transform(raw_rd)
+    if weights_priority_order is not None and raw_rd.type == "model":
+        raw_rd = _filter_resource_description(raw_rd, weights_priority_order)
+
+    # verify downloads of remote files, e.g. weights, against their declared sha256
+    sha256_collector = ExpectedSha256Collector()
+    sha256_collector.visit(raw_rd)
+    for url, expected_sha256 in sha256_collector.expected.items():
+        register_expected_sha256(url, expected_sha256)
 
     return raw_rd
 
@@ -251,14 +373,12 @@ def serialize_raw_resource_description_to_dict(
     If 'convert_absolute_paths' all absolute paths are converted to paths relative to raw_rd.root_path before
     serialization.
     """
-    class_name = get_class_name_from_type(raw_rd.type)
     sub_spec = _get_spec_submodule(raw_rd.type, raw_rd.format_version)
-    schema: SharedBioImageIOSchema = getattr(sub_spec.schema, class_name)()
-
     if convert_absolute_paths:
         raw_rd = AbsoluteToRelativePathTransformer(root=raw_rd.root_path).transform(raw_rd)
 
-    serialized = schema.dump(raw_rd)
+    with _schema_pool.schema(raw_rd.type, sub_spec) as schema:
+        serialized = schema.dump(raw_rd)
     assert isinstance(serialized, dict)
     assert missing not in serialized.values()
 
@@ -310,17 +430,13 @@ def get_resource_package_content_wo_rdf(
     else:
         r_rd = load_raw_resource_description(raw_rd)
 
-    sub_spec = _get_spec_submodule(r_rd.type, r_rd.format_version)
-    if r_rd.type == "model":
-        filter_kwargs = dict(weights_priority_order=weights_priority_order)
-    else:
-        filter_kwargs = {}
-
-    r_rd = sub_spec.utils.filter_resource_description(r_rd, **filter_kwargs)
-
+    r_rd = _filter_resource_description(r_rd, weights_priority_order)
     content: Dict[str, Union[pathlib.PurePath, raw_nodes.URI]] = {}
     r_rd = RawNodePackageTransformer(content, r_rd.root_path).transform(r_rd)
     assert "rdf.yaml" not in content
+    for path in content.values():
+        if isinstance(path, pathlib.Path):
+            materialize(path)  # extract members of a packaged resource to be packaged again
     return r_rd, content
 
 
@@ -347,3 +463,335 @@ def get_resource_package_content(
 
     r_rd, content = get_resource_package_content_wo_rdf(raw_rd, weights_priority_order=weights_priority_order)
     return {**content, **{"rdf.yaml": serialize_raw_resource_description(r_rd)}}
+
+
+# file suffixes of package members that are already compressed or compress poorly, e.g. weights and images
+STORED_SUFFIXES = frozenset(
+    {
+        ".ckpt",
+        ".gif",
+        ".gz",
+        ".h5",
+        ".hdf5",
+        ".jpeg",
+        ".jpg",
+        ".npz",
+        ".onnx",
+        ".pb",
+        ".png",
+        ".pt",
+        ".pth",
+        ".torch",
+        ".zip",
+    }
+)
+
+
+def get_member_compression(name: str) -> int:
+    """default compression method of a package member: stored for `STORED_SUFFIXES`, deflated otherwise"""
+    if pathlib.PurePosixPath(name).suffix.lower() in STORED_SUFFIXES:
+        return zipfile.ZIP_STORED
+    else:
+        return zipfile.ZIP_DEFLATED
+
+
+def write_resource_package(
+    raw_rd: Union[raw_nodes.ResourceDescription, raw_nodes.URI, str, pathlib.Path],
+    out: Union[os.PathLike, IO[bytes]],
+    *,
+    weights_priority_order: Optional[Sequence[str]] = None,  # model only
+    max_workers: int = 8,
+    compression: Union[int, Callable[[str], int]] = get_member_compression,
+    date_time: Tuple[int, int, int, int, int, int] = (1980, 1, 1, 0, 0, 0),
+    pbar=None,
+) -> Dict[str, str]:
+    """write a reproducible resource package (zip file) with its members fetched and compressed concurrently
+
+    Remote files are not stored in the download cache. All members are compressed concurrently (remote files while they
+    are downloaded) and written to the package in a fixed order: rdf.yaml is the first member followed by all other
+    members sorted by name, and all members have the same timestamp and permissions. The member next in order is
+    written to the package as it is compressed, members after it are buffered in temporary files until it is complete.
+    The package thus does not depend on when or in which order its members are ready, and writing a package from the
+    same content twice yields identical bytes.
+
+    Args:
+        raw_rd: raw resource description
+        out: path or binary file object to write the package to
+        weights_priority_order: If given only the first weights format present in the model is included.
+                                If none of the prioritized weights formats is found all are included.
+        max_workers: maximum number of members fetched and compressed concurrently
+        compression: compression method of the package members (`zipfile.ZIP_STORED` or `zipfile.ZIP_DEFLATED`), or a
+                     callable returning the compression method of a member by name. By default already compressed or
+                     poorly compressible files (weights, images, zip files; see `STORED_SUFFIXES`) are stored, others
+                     are deflated.
+        date_time: timestamp of all members
+        pbar: progress bar factory sharing a minimal tqdm interface (see `resolve_source`);
+              all downloads are reported in one progress bar created with it. If none given, tqdm is used.
+
+    Returns:
+        sha256 of the package members keyed by member name (in package order)
+
+    Raises:
+        RuntimeError: if any download failed (after all other downloads completed)
+    """
+    if not isinstance(raw_rd, raw_nodes.ResourceDescription):
+        raw_rd = load_raw_resource_description(raw_rd)
+
+    content = get_resource_package_content(raw_rd, weights_priority_order=weights_priority_order)
+    names = sorted(content, key=lambda n: (n != "rdf.yaml", n))
+    remote = {name: uri for name, uri in content.items() if isinstance(uri, raw_nodes.URI)}
+    members: Dict[str, _PackageMember] = {}
+    for name in names:
+        zinfo = zipfile.ZipInfo(name, date_time=date_time)
+        zinfo.create_system = 3  # unix, independent of the platform writing the package
+        zinfo.external_attr = 0o644 << 16
+        zinfo.compress_type = compression(name) if callable(compression) else compression
+        if zinfo.compress_type not in SUPPORTED_COMPRESSION:
+            raise NotImplementedError(f"compression method {zinfo.compress_type} (supported: {SUPPORTED_COMPRESSION})")
+
+        members[name] = _PackageMember(zinfo)
+
+    sha256_collector = ExpectedSha256Collector()
+    sha256_collector.visit(raw_rd)
+    progress = None
+    aggregated = None
+    if remote:
+        progress = (pbar or tqdm)(total=0, unit="iB", unit_scale=True, desc=f"packaging {len(remote)} remote files")
+        aggregated = _AggregatedProgress(progress)
+
+    sha256s: Dict[str, str] = {}
+    errors: Dict[str, Exception] = {}
+    try:
+        with _open_package(out) as fp, ThreadPoolExecutor(max_workers=max_workers) as executor:
+            writer = ZipWriter(fp)
+            # compress members in package order
+            futures = {}
+            sizes: Dict[str, Optional[int]] = {}
+            for name in names:
+                source = content[name]
+                if isinstance(source, str):
+                    data = source.encode("utf-8")
+                    sizes[name] = len(data)
+                    chunks: Iterable[bytes] = [data]
+                elif isinstance(source, pathlib.PurePath):
+                    sizes[name] = pathlib.Path(source).stat().st_size
+                    chunks = _read_chunks(pathlib.Path(source))
+                else:
+                    sizes[name] = None  # unknown before the download completes
+                    chunks = stream_source(source, sha256=sha256_collector.expected.get(str(source)), pbar=aggregated)
+
+                futures[name] = executor.submit(compress_chunks, chunks, members[name].zinfo, members[name].write)
+
+            try:
+                for name in names:
+                    member = members[name]
+                    size = sizes[name]
+                    if not errors:
+                        # a remote member reaching the zip64 limit only gets zip64 sizes in its data descriptor and
+                        # the central directory (as its size is unknown when its local header is written)
+                        writer.start_member(member.zinfo, zip64=size is not None and size * 1.05 > zipfile.ZIP64_LIMIT)
+                        member.attach(writer)
+
+                    try:
+                        sha256s[name] = futures[name].result()
+                    except Exception as e:
+                        if name not in remote:
+                            raise
+
+                        errors[name] = e
+                    finally:
+                        member.close()
+
+                    if not errors:
+                        writer.end_member(member.zinfo)
+
+                if errors:
+                    raise RuntimeError(
+                        f"Failed to package {len(errors)} of {len(remote)} remote files: "
+                        + "; ".join(f"{remote[name]} ({e})" for name, e in errors.items())
+                    )
+
+                writer.close()
+            except BaseException:
+                for future in futures.values():
+                    future.cancel()
+
+                for member in members.values():
+                    member.close()  # stops running workers on their next write
+
+                raise  # after waiting for running workers when leaving the executor context
+    except Exception:
+        if isinstance(out, (str, os.PathLike)) and os.path.exists(out):
+            os.remove(out)  # remove incomplete package
+
+        raise
+    finally:
+        if progress is not None:
+            progress.close()
+
+    return sha256s
+
+
+def _read_chunks(path: pathlib.Path, chunk_size: int = 1 << 20) -> Iterator[bytes]:
+    with path.open("rb") as f:
+        yield from iter(lambda: f.read(chunk_size), b"")
+
+
+class _PackageMember:
+    """compressed data of a package member: buffered in a temporary file until attached to the package writer"""
+
+    def __init__(self, zinfo: zipfile.ZipInfo):
+        self.zinfo = zinfo
+        self._lock = threading.Lock()
+        self._buffer: Optional[IO[bytes]] = None
+        self._writer: Optional[ZipWriter] = None
+        self._closed = False
+
+    def write(self, data: bytes):
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"package member {self.zinfo.filename} is closed")
+            elif self._writer is not None:
+                self._writer.write(data)
+            else:
+                if self._buffer is None:
+                    self._buffer = SpooledTemporaryFile(max_size=16 * 1024**2)
+
+                self._buffer.write(data)
+
+    def attach(self, writer: ZipWriter):
+        """write the data buffered so far with `writer` and pass all further data directly to it"""
+        with self._lock:
+            if self._buffer is not None:
+                self._buffer.seek(0)
+                for chunk in iter(lambda: self._buffer.read(1 << 20), b""):
+                    writer.write(chunk)
+
+                self._buffer.close()
+                self._buffer = None
+
+            self._writer = writer
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+            if self._buffer is not None:
+                self._buffer.close()
+                self._buffer = None
+
+
+@contextmanager
+def _open_package(out: Union[os.PathLike, IO[bytes]]) -> Iterator[IO[bytes]]:
+    if isinstance(out, (str, os.PathLike)):
+        with open(out, "wb") as fp:
+            yield fp
+    else:
+        yield out
+
+
+class _AggregatedProgress:
+    """progress bar factory (as expected by `resolve_source`) reporting concurrent downloads in one progress bar"""
+
+    def __init__(self, pbar):
+        self.pbar = pbar
+        self.lock = threading.Lock()
+
+    def __call__(self, total: int = 0, **kwargs) -> "_AggregatedProgressPart":
+        with self.lock:
+            self.pbar.total = (self.pbar.total or 0) + total
+            if hasattr(self.pbar, "refresh"):
+                self.pbar.refresh()
+
+        return _AggregatedProgressPart(self)
+
+
+class _AggregatedProgressPart:
+    def __init__(self, aggregated: _AggregatedProgress):
+        self.aggregated = aggregated
+        self.n = 0
+
+    def update(self, n: int):
+        self.n += n
+        with self.aggregated.lock:
+            self.aggregated.pbar.update(n)
+
+    def close(self):
+        pass
+
+
+def prefetch_resources(
+    raw_rd: Union[GenericRawRD, raw_nodes.URI, str, pathlib.Path],
+    *,
+    max_workers: int = 8,
+    weights_priority_order: Optional[Sequence[str]] = None,  # model only
+    pbar=None,
+    cache_policy: Optional["CachePolicy"] = None,
+) -> Dict[str, pathlib.Path]:
+    """download all remote files of a resource (weights, test tensors, covers, documentation, etc.) concurrently
+
+    Args:
+        raw_rd: raw resource description
+        max_workers: maximum number of concurrent downloads
+        # for model resources only:
+        weights_priority_order: If given only the first weights format present in the model is prefetched.
+                                If none of the prioritized weights formats is found all are prefetched.
+        pbar: progress bar factory sharing a minimal tqdm interface (see `resolve_source`);
+              all downloads are reported in one progress bar created with it. If none given, tqdm is used.
+        cache_policy: how to use cached downloads (see `resolve_source`)
+
+    Returns:
+        Local paths of the downloaded files keyed by their URI.
+
+    Raises:
+        RuntimeError: if any download failed (after all other downloads completed)
+    """
+    if isinstance(raw_rd, raw_nodes.ResourceDescription):
+        r_rd = raw_rd
+    else:
+        r_rd = load_raw_resource_description(raw_rd)
+
+    if r_rd.type == "model":
+        r_rd = _get_spec_submodule(r_rd.type, r_rd.format_version).utils.filter_resource_description(
+            r_rd, weights_priority_order=weights_priority_order
+        )
+
+    collector = RemoteResourceCollector()
+    collector.visit(r_rd)
+    uris = list(collector.uris.values())
+    # verify downloads against the digests declared by this resource (instead of any registered for the same URL)
+    sha256_collector = ExpectedSha256Collector()
+    sha256_collector.visit(r_rd)
+    if not uris:
+        return {}
+
+    progress = (pbar or tqdm)(total=0, unit="iB", unit_scale=True, desc=f"prefetching {len(uris)} files")
+    aggregated = _AggregatedProgress(progress)
+    local_paths: Dict[str, pathlib.Path] = {}
+    errors: Dict[str, Exception] = {}
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    resolve_source,
+                    uri,
+                    pbar=aggregated,
+                    cache_policy=cache_policy,
+                    sha256=sha256_collector.expected.get(str(uri)),
+                ): str(uri)
+                for uri in uris
+            }
+            for future in as_completed(futures):
+                try:
+                    local_paths[futures[future]] = future.result()
+                except Exception as e:
+                    errors[futures[future]] = e
+    finally:
+        progress.close()
+
+    if errors:
+        raise RuntimeError(
+            f"Failed to prefetch {len(errors)} of {len(uris)} files: "
+            + "; ".join(f"{uri} ({e})" for uri, e in errors.items())
+        )
+
+    return {str(uri): local_paths[str(uri)] for uri in uris}
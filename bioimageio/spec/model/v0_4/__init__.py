@@ -1,10 +1,13 @@
-from . import converters, raw_nodes, schema, utils
+from . import raw_nodes
 from .raw_nodes import FormatVersion
+from bioimageio.spec.shared.common import lazy_submodule_getattr
 
 try:
     from typing import get_args
 except ImportError:
     from typing_extensions import get_args  # type: ignore
 
-
 format_version = get_args(FormatVersion)[-1]
+
+# converters, schema and utils are only imported on first access
+__getattr__ = lazy_submodule_getattr(__name__)
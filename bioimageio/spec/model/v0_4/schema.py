@@ -38,7 +38,7 @@ from bioimageio.spec.model.v0_3.schema import (
     _WeightsEntryBase as _WeightsEntryBase03,
 )
 from bioimageio.spec.rdf import v0_2 as rdf
-from bioimageio.spec.shared import LICENSES, field_validators, fields
+from bioimageio.spec.shared import field_validators, fields, get_license_ids
 from bioimageio.spec.shared.common import get_args, get_args_flat
 from bioimageio.spec.shared.schema import (
     ImplicitOutputShape,
@@ -426,7 +426,7 @@ is in an unsupported format version. The current format version described here i
             raise ValidationError("Duplicate input tensor names are not allowed.")
 
     license = fields.String(
-        validate=field_validators.OneOf(LICENSES),
+        validate=field_validators.LazyOneOf(get_license_ids),
         required=True,
         bioimageio_description=rdf.schema.RDF.license_bioimageio_description,
     )
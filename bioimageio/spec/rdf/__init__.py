@@ -1,8 +1,8 @@
-from . import v0_2
-
+# version submodules, e.g. 'v0_2', are only imported on first access (see __getattr__ below)
 # autogen: start
-from . import converters, raw_nodes, schema, utils
+from . import raw_nodes
 from .raw_nodes import FormatVersion
+from bioimageio.spec.shared.common import lazy_submodule_getattr
 
 try:
     from typing import get_args
@@ -11,4 +11,7 @@ except ImportError:
 
 format_version = get_args(FormatVersion)[-1]
 
+# converters, schema and utils are only imported on first access
+__getattr__ = lazy_submodule_getattr(__name__)
+
 # autogen: stop
@@ -3,13 +3,7 @@ from typing import ClassVar
 
 from marshmallow import EXCLUDE, ValidationError, validates, validates_schema
 
-from bioimageio.spec.shared import (
-    BIOIMAGEIO_SITE_CONFIG,
-    BIOIMAGEIO_SITE_CONFIG_ERROR,
-    LICENSES,
-    field_validators,
-    fields,
-)
+from bioimageio.spec.shared import bioimageio_site_config, field_validators, fields, get_license_info
 from bioimageio.spec.shared.common import get_args, get_patched_format_version
 from bioimageio.spec.shared.schema import SharedBioImageIOSchema, WithUnknown
 from bioimageio.spec.shared.utils import is_valid_orcid_id
@@ -197,21 +191,21 @@ E.g. the citation for the model architecture and/or the training data used."""
         "an Github issue to discuss your intentions with the community."
     )
     license = fields.String(  # todo: make mandatory?
-        # validate=field_validators.OneOf(LICENSES),  # enforce license id
+        # validate=field_validators.LazyOneOf(get_license_ids),  # enforce license id
         bioimageio_description=license_bioimageio_description
     )
 
     @validates("license")
     def warn_about_deprecated_spdx_license(self, value: str):
-        license_info = LICENSES.get(value)
+        license_info = get_license_info(value)
         if license_info is None:
             self.warn("license", f"{value} is not a recognized SPDX license identifier. See https://spdx.org/licenses/")
         else:
-            if license_info.get("isDeprecatedLicenseId", False):
-                self.warn("license", f"{value} ({license_info['name']}) is deprecated.")
+            if license_info.is_deprecated:
+                self.warn("license", f"{value} ({license_info.name}) is deprecated.")
 
-            if not license_info.get("isFsfLibre", False):
-                self.warn("license", f"{value} ({license_info['name']}) is not FSF Free/libre.")
+            if not license_info.is_fsf_libre:
+                self.warn("license", f"{value} ({license_info.name}) is not FSF Free/libre.")
 
     links = fields.List(fields.String(), bioimageio_description="links to other bioimage.io resources")
 
@@ -241,14 +235,13 @@ E.g. the citation for the model architecture and/or the training data used."""
 
     @validates("tags")
     def warn_about_tag_categories(self, value):
-        if BIOIMAGEIO_SITE_CONFIG is None:
-            error = BIOIMAGEIO_SITE_CONFIG_ERROR
-        else:
+        site_config, error = bioimageio_site_config.get()
+        if site_config is not None:
             missing_categories = []
             try:
-                categories = {
-                    c["type"]: c.get("tag_categories", {}) for c in BIOIMAGEIO_SITE_CONFIG["resource_categories"]
-                }.get(self.__class__.__name__.lower(), {})
+                categories = {c["type"]: c.get("tag_categories", {}) for c in site_config["resource_categories"]}.get(
+                    self.__class__.__name__.lower(), {}
+                )
                 for cat, entries in categories.items():
                     if not any(e in value for e in entries):
                         missing_categories.append({cat: entries})
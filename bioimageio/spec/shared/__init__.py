@@ -1,28 +1,120 @@
 from __future__ import annotations
 
+import importlib
 import json
+import typing
+from functools import lru_cache
 from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Tuple
 
-from ._resolve_source import (
-    BIOIMAGEIO_COLLECTION,
-    BIOIMAGEIO_COLLECTION_ERROR,
-    BIOIMAGEIO_SITE_CONFIG,
-    BIOIMAGEIO_SITE_CONFIG_ERROR,
-    DownloadCancelled,
-    RDF_NAMES,
-    _resolve_json_from_url,
-    get_resolved_source_path,
-    resolve_local_source,
-    resolve_rdf_source,
-    resolve_rdf_source_and_type,
-    resolve_source,
-    source_available,
-)
-from ._update_nested import update_nested
 from .common import get_args, yaml  # noqa
 
-_license_file = Path(__file__).parent.parent / "static" / "licenses.json"
-_license_data = json.loads(_license_file.read_text(encoding="utf-8"))
+if typing.TYPE_CHECKING:
+    from ._resolve_source import (
+        CacheStats,
+        DownloadCancelled,
+        LazyRemoteJson,
+        RDF_NAMES,
+        _resolve_json_from_url,
+        bioimageio_collection,
+        bioimageio_site_config,
+        cache_manager,
+        collect_cache_stats,
+        get_bioimageio_collection_entries,
+        get_bioimageio_ids,
+        get_cache_stats,
+        get_resolved_source_path,
+        register_expected_sha256,
+        reset_cache_stats,
+        resolve_local_source,
+        resolve_rdf_source,
+        resolve_rdf_source_and_type,
+        resolve_source,
+        source_available,
+        sources_available,
+        stream_source,
+    )
+    from ._http import OfflineError, Transport, http_client, set_offline, set_transport
+    from ._update_nested import update_nested
+    from ._zip_root import ZipRoot, get_package_fingerprint, get_zip_root
+
+# source resolution (and with it marshmallow fields, numpy, requests, etc.) is only imported on first access,
+# such that, e.g., raw nodes can be imported without it
+_resolve_source_members = (
+    "CacheStats",
+    "DownloadCancelled",
+    "LazyRemoteJson",
+    "RDF_NAMES",
+    "_resolve_json_from_url",
+    "bioimageio_collection",
+    "bioimageio_site_config",
+    "cache_manager",
+    "collect_cache_stats",
+    "get_bioimageio_collection_entries",
+    "get_bioimageio_ids",
+    "get_cache_stats",
+    "get_resolved_source_path",
+    "register_expected_sha256",
+    "reset_cache_stats",
+    "resolve_local_source",
+    "resolve_rdf_source",
+    "resolve_rdf_source_and_type",
+    "resolve_source",
+    "source_available",
+    "sources_available",
+    "stream_source",
+    # the site config and collection are only fetched on first access
+    "BIOIMAGEIO_COLLECTION",
+    "BIOIMAGEIO_COLLECTION_ENTRIES",
+    "BIOIMAGEIO_COLLECTION_ERROR",
+    "BIOIMAGEIO_SITE_CONFIG",
+    "BIOIMAGEIO_SITE_CONFIG_ERROR",
+)
+
+_license_file = Path(__file__).parent.parent / "static" / "licenses.json"  # source of truth of '_spdx_license_index'
+
+
+class LicenseInfo(NamedTuple):
+    name: str
+    is_deprecated: bool
+    is_fsf_libre: bool
+
+
+def get_license_ids() -> Dict[str, Tuple[str, bool, bool]]:
+    """all known SPDX license ids (as keys of the SPDX license index; loaded on first call)"""
+    from ._spdx_license_index import LICENSES
+
+    return LICENSES
+
+
+def get_license_info(license_id: str) -> Optional[LicenseInfo]:
+    """look up a SPDX license id (returns None for unknown license ids)"""
+    info = get_license_ids().get(license_id)
+    return None if info is None else LicenseInfo(*info)
+
+
+@lru_cache()
+def _load_full_license_data() -> Dict[str, dict]:
+    return {x["licenseId"]: x for x in json.loads(_license_file.read_text(encoding="utf-8"))["licenses"]}
+
+
+def __getattr__(name: str):
+    # license data is only loaded on first access
+    if name == "LICENSES":
+        return _load_full_license_data()
+    elif name == "LICENSE_DATA_VERSION":
+        from ._spdx_license_index import LICENSE_DATA_VERSION
+
+        return LICENSE_DATA_VERSION
+    elif name == "_resolve_source":
+        return importlib.import_module(f"{__name__}._resolve_source")
+    elif name in _resolve_source_members:
+        return getattr(importlib.import_module(f"{__name__}._resolve_source"), name)
+    elif name in ("OfflineError", "Transport", "http_client", "set_offline", "set_transport"):
+        return getattr(importlib.import_module(f"{__name__}._http"), name)
+    elif name == "update_nested":
+        return importlib.import_module(f"{__name__}._update_nested").update_nested
+    elif name in ("ZipRoot", "get_package_fingerprint", "get_zip_root"):
+        return getattr(importlib.import_module(f"{__name__}._zip_root"), name)
 
-LICENSES = {x["licenseId"]: x for x in _license_data["licenses"]}
-LICENSE_DATA_VERSION = _license_data["licenseListVersion"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,791 @@
+"""management of the bioimageio cache at BIOIMAGEIO_CACHE_PATH
+
+Downloaded files are stored content-addressed by their sha256 digest at <cache path>/sha256/<digest>/<file name>.
+An index (sqlite database) maps URLs to digests, such that identical files served from different URLs are only stored
+once. The index also records size, last access and origin URL of every cache entry (stored downloads and extracted
+packages) to keep the cache within a byte budget by evicting the least recently used entries.
+Results of resolving DOIs and listing Zenodo records are kept in the index until their time to live expires.
+Failures of urls are kept in the index as well (negative cache), such that they are only requested again after an
+exponentially growing backoff time.
+Entries are written under a file lock per entry and published by atomic renames, such that concurrent processes
+sharing a cache wait for one download or extraction instead of duplicating or corrupting it.
+Cache hits, misses, transferred bytes and time spent downloading and extracting are counted, by process (see
+`get_cache_stats`) and by context (see `collect_cache_stats`).
+"""
+import contextvars
+import email.utils
+import hashlib
+import os
+import pathlib
+import shutil
+import threading
+import time
+import typing
+import uuid
+import warnings
+from contextlib import contextmanager
+
+from .common import BIOIMAGEIO_CACHE_DEFAULT_TTL, BIOIMAGEIO_CACHE_MAX_SIZE, BIOIMAGEIO_CACHE_PATH, CacheWarning
+
+try:
+    from typing import Literal, get_args
+except ImportError:
+    from typing_extensions import Literal, get_args  # type: ignore
+
+try:
+    import fcntl
+except ImportError:  # Windows or pyodide
+    fcntl = None  # type: ignore
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None  # type: ignore
+
+# how to use a cached download:
+#   cache-first: use a cached file without any request; download only if nothing is cached
+#   revalidate: use a cached file while it is fresh, otherwise revalidate it with a conditional request
+#   network-only: always download
+CachePolicy = Literal["cache-first", "revalidate", "network-only"]
+CACHE_POLICIES: typing.Tuple[str, ...] = get_args(CachePolicy)
+# fraction of the time since a response was last modified it is considered fresh if it does not declare a lifetime
+HEURISTIC_FRESHNESS_FRACTION = 0.1
+
+# expected sha256 digests of remote files by URL,
+# e.g. as declared by the 'sha256' and 'architecture_sha256' fields of model weights entries;
+# all digests declared for a URL are kept, for at most EXPECTED_SHA256_MAX_URLS (least recently registered) URLs
+_expected_sha256: typing.Dict[str, typing.FrozenSet[str]] = {}
+_expected_sha256_lock = threading.Lock()
+EXPECTED_SHA256_MAX_URLS = 10000
+
+
+def register_expected_sha256(url: str, sha256: str):
+    """register the expected sha256 digest of the file at `url` to verify its download or cached copy against
+
+    If different digests are registered for the same URL, e.g. by two resource descriptions,
+    `get_expected_sha256` does not return any of them; pass the expected digest to `resolve_source` instead.
+    """
+    with _expected_sha256_lock:
+        expected = _expected_sha256.pop(url, frozenset()) | {sha256.lower()}
+        _expected_sha256[url] = expected
+        while len(_expected_sha256) > EXPECTED_SHA256_MAX_URLS:
+            del _expected_sha256[next(iter(_expected_sha256))]
+
+    if len(expected) > 1:
+        warnings.warn(f"Different sha256 digests registered for {url}: {', '.join(sorted(expected))}")
+
+
+def get_expected_sha256(url: str) -> typing.Optional[str]:
+    """the sha256 digest registered for `url`, unless none or conflicting digests were registered"""
+    expected = _expected_sha256.get(url, frozenset())
+    return next(iter(expected)) if len(expected) == 1 else None
+
+
+def compute_sha256(path: pathlib.Path, chunk_size: int = 1 << 20) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            h.update(chunk)
+
+    return h.hexdigest()
+
+
+def get_size(path: pathlib.Path) -> int:
+    """disk size of a file or directory in bytes (counting hard linked files once)"""
+    if path.is_file():
+        return path.stat().st_size
+
+    inodes = {}
+    for dirpath, _, file_names in os.walk(path):
+        for file_name in file_names:
+            stat = os.stat(os.path.join(dirpath, file_name))
+            inodes[(stat.st_dev, stat.st_ino)] = stat.st_size
+
+    return sum(inodes.values())
+
+
+class FileLock:
+    """exclusive lock on a lock file, held by at most one thread or process at a time"""
+
+    def __init__(self, path: pathlib.Path, *, poll_interval: float = 0.05):
+        self.path = path
+        self.poll_interval = poll_interval
+        self._file: typing.Optional[typing.IO] = None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        """acquire the lock; without `blocking` only if it is not held
+
+        Returns:
+            whether the lock was acquired
+        """
+        while True:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            f = open(self.path, "a+b")
+            try:
+                if not self._lock(f, blocking):
+                    f.close()
+                    return False
+
+                # the lock file may have been removed (see `remove`) while waiting for the lock
+                try:
+                    stat = os.stat(self.path)
+                except FileNotFoundError:
+                    stat = None
+
+                locked = os.fstat(f.fileno())
+                if stat is None or (stat.st_dev, stat.st_ino) != (locked.st_dev, locked.st_ino):
+                    self._unlock(f)
+                    f.close()
+                    continue
+            except BaseException:
+                f.close()
+                raise
+
+            self._file = f
+            return True
+
+    def _lock(self, f: typing.IO, blocking: bool) -> bool:
+        if fcntl is not None:
+            try:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                return False
+        elif msvcrt is not None:
+            while True:
+                try:
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+                    break
+                except OSError:
+                    if not blocking:
+                        return False
+
+                    time.sleep(self.poll_interval)
+
+        return True
+
+    def _unlock(self, f: typing.IO):
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        elif msvcrt is not None:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def release(self):
+        f, self._file = self._file, None
+        if f is None:
+            return
+
+        try:
+            self._unlock(f)
+        finally:
+            f.close()
+
+    def remove(self) -> bool:
+        """delete the lock file unless the lock is held
+
+        Returns:
+            whether the lock file was deleted
+        """
+        if not self.acquire(blocking=False):
+            return False
+
+        try:
+            os.remove(self.path)
+        except OSError:  # e.g. an open file cannot be deleted on Windows
+            return False
+        finally:
+            self.release()
+
+        return True
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+
+class CachedFile(typing.NamedTuple):
+    path: pathlib.Path
+    sha256: str
+    # freshness metadata of the looked up url (None if the file was only found by its sha256):
+    fetched: typing.Optional[float] = None  # time the file was last downloaded or revalidated
+    expires: typing.Optional[float] = None  # end of freshness lifetime as given by the server (Cache-Control)
+    etag: typing.Optional[str] = None
+    last_modified: typing.Optional[str] = None
+
+    def is_fresh(self, max_age: typing.Optional[float] = None) -> bool:
+        """if the file may be used without revalidation (within `max_age` seconds if given, else until `expires`)"""
+        if self.fetched is None:
+            return False
+        elif max_age is None:
+            return self.expires is not None and time.time() < self.expires
+        else:
+            return time.time() - self.fetched <= max_age
+
+
+class CacheStats(typing.NamedTuple):
+    """counters and timings of the download cache (accumulated by all threads of the process)"""
+
+    hits: int = 0  # requested files served from the cache (or an offline mirror), incl. revalidated ones
+    misses: int = 0  # requested files that had to be downloaded
+    bytes_downloaded: int = 0
+    bytes_served: int = 0  # size of files served from the cache
+    download_time: float = 0.0  # seconds spent downloading and revalidating
+    extraction_time: float = 0.0  # seconds spent extracting resource packages
+
+    def since(self, earlier: "CacheStats") -> "CacheStats":
+        """stats accumulated after `earlier`"""
+        return CacheStats(*(now - then for now, then in zip(self, earlier)))
+
+
+_cache_stats = CacheStats()
+_cache_stats_lock = threading.Lock()
+
+
+def get_cache_stats() -> CacheStats:
+    """cache hits and misses, transferred bytes and time spent downloading and extracting since the last reset"""
+    return _cache_stats
+
+
+def reset_cache_stats():
+    global _cache_stats
+    with _cache_stats_lock:
+        _cache_stats = CacheStats()
+
+
+class CacheStatsCollector:
+    """cache stats recorded while collecting (see `collect_cache_stats`)"""
+
+    def __init__(self):
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def record(self, **increments: float):
+        with self._lock:
+            self.stats = self.stats._replace(**{k: getattr(self.stats, k) + v for k, v in increments.items()})
+
+
+_cache_stats_collectors: "contextvars.ContextVar[typing.Tuple[CacheStatsCollector, ...]]" = contextvars.ContextVar(
+    "cache_stats_collectors", default=()
+)
+
+
+@contextmanager
+def collect_cache_stats() -> typing.Iterator[CacheStatsCollector]:
+    """collect the cache stats recorded in the current context only
+
+    Unlike the process-wide `get_cache_stats`, the collected stats do not include cache activity of other threads
+    (or asyncio tasks), e.g. of concurrent validations. Work submitted to other threads is only included if run in a
+    copy of the current context (see `contextvars.copy_context`).
+    """
+    collector = CacheStatsCollector()
+    token = _cache_stats_collectors.set(_cache_stats_collectors.get() + (collector,))
+    try:
+        yield collector
+    finally:
+        _cache_stats_collectors.reset(token)
+
+
+def record_cache_stats(**increments: float):
+    """add `increments` to the cache stats, e.g. `record_cache_stats(hits=1, bytes_served=size)`"""
+    global _cache_stats
+    with _cache_stats_lock:
+        _cache_stats = _cache_stats._replace(**{k: getattr(_cache_stats, k) + v for k, v in increments.items()})
+
+    for collector in _cache_stats_collectors.get():
+        collector.record(**increments)
+
+
+def get_expires(headers: typing.Mapping[str, str], now: float) -> float:
+    """end of freshness lifetime of a response
+
+    Given by its Cache-Control max-age or Expires header. Without those, a heuristic lifetime is used (RFC 9111,
+    section 4.2.2): 10% of the time since its Last-Modified date, at most BIOIMAGEIO_CACHE_DEFAULT_TTL, or
+    BIOIMAGEIO_CACHE_DEFAULT_TTL if it has no Last-Modified date either.
+    """
+    headers = {k.lower(): v for k, v in headers.items()}
+    directives = [d.strip().lower() for d in headers.get("cache-control", "").split(",")]
+    if "no-cache" in directives or "no-store" in directives:
+        return now
+
+    for d in directives:
+        if d.startswith("max-age="):
+            try:
+                return now + max(0.0, float(d[len("max-age=") :]))
+            except ValueError:
+                return now
+
+    date = _parse_http_date(headers.get("date")) or now
+    if "expires" in headers:
+        expires = _parse_http_date(headers["expires"])
+        # an invalid Expires header (e.g. "0") means already expired
+        return now + max(0.0, expires - date) if expires is not None else now
+
+    last_modified = _parse_http_date(headers.get("last-modified"))
+    if last_modified is not None:
+        return now + min(max(0.0, date - last_modified) * HEURISTIC_FRESHNESS_FRACTION, BIOIMAGEIO_CACHE_DEFAULT_TTL)
+
+    return now + BIOIMAGEIO_CACHE_DEFAULT_TTL
+
+
+def _parse_http_date(value: typing.Optional[str]) -> typing.Optional[float]:
+    if not value:
+        return None
+
+    try:
+        return email.utils.parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+
+class Failure(typing.NamedTuple):
+    """recorded failure of a url or host"""
+
+    error: str
+    count: int  # number of consecutive failures
+    retry_after: float  # no new attempt is made before this time
+
+    @property
+    def pending(self) -> bool:
+        return time.time() < self.retry_after
+
+
+class CacheEntry(typing.NamedTuple):
+    key: str  # path relative to the cache path, e.g. 'sha256/<digest>' or 'extracted_packages/<hash>'
+    size: int  # in bytes
+    last_access: float
+    origin_url: typing.Optional[str]
+
+
+class CacheManager:
+    """content-addressed file store with a persistent metadata index and a byte budget enforced by LRU eviction
+
+    Args:
+        path: cache directory
+        max_size: byte budget; 0 for no limit
+        min_age: entries accessed less than `min_age` seconds ago are never evicted,
+                 such that paths just returned to (concurrent) readers remain valid.
+    """
+
+    def __init__(self, path: pathlib.Path, *, max_size: int = 0, min_age: float = 600):
+        self.path = path
+        self.max_size = max_size
+        self.min_age = min_age
+        self._index_path = path / "index.sqlite3"
+        self._index_lock = threading.Lock()
+        self._index_initialized = False
+
+    @property
+    def tmp_dir(self) -> pathlib.Path:
+        """directory for partial downloads (on the same file system as the stored files)"""
+        return self.path / "tmp"
+
+    def get_file_dir(self, sha256: str) -> pathlib.Path:
+        return self.path / "sha256" / sha256
+
+    def lock(self, key: str) -> FileLock:
+        """lock to hold while creating the cache entry for `key`, e.g. a url or an extracted package path
+
+        The lock file is deleted when the entry is evicted or removed.
+        """
+        return FileLock(self.path / "locks" / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.lock")
+
+    def _connect(self):
+        import sqlite3
+
+        with self._index_lock:
+            if not self._index_initialized:
+                self.path.mkdir(parents=True, exist_ok=True)
+
+            conn = sqlite3.connect(str(self._index_path), timeout=60)
+            if not self._index_initialized:
+                with conn:
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS urls (url TEXT PRIMARY KEY, sha256 TEXT NOT NULL, "
+                        "file_name TEXT NOT NULL, fetched REAL NOT NULL, expires REAL, etag TEXT, last_modified TEXT)"
+                    )
+                    # add freshness metadata columns to an index created without them
+                    url_columns = {row[1] for row in conn.execute("PRAGMA table_info(urls)")}
+                    for column, column_type in (("expires", "REAL"), ("etag", "TEXT"), ("last_modified", "TEXT")):
+                        if column not in url_columns:
+                            conn.execute(f"ALTER TABLE urls ADD COLUMN {column} {column_type}")
+
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, size INTEGER NOT NULL, "
+                        "mtime_ns INTEGER, last_access REAL NOT NULL, origin_url TEXT)"
+                    )
+                    conn.execute("CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)")
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS resolved (key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                        "expires REAL NOT NULL)"
+                    )
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS failures (key TEXT PRIMARY KEY, error TEXT NOT NULL, "
+                        "count INTEGER NOT NULL, retry_after REAL NOT NULL)"
+                    )
+
+                self._index_initialized = True
+
+        return conn
+
+    def lookup(self, url: str, *, sha256: typing.Optional[str] = None, file_name: str) -> typing.Optional[CachedFile]:
+        """look up a cached and verified file downloaded from `url` or with the expected `sha256` digest
+
+        Args:
+            url: url the file was downloaded from
+            sha256: expected sha256 digest; if given, a file with this digest is returned regardless of its url
+            file_name: file name for the returned path if the file is only stored under a different name
+        """
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT sha256, file_name, fetched, expires, etag, last_modified FROM urls WHERE url = ?", (url,)
+            ).fetchone()
+            if row is not None and (sha256 is None or row[0] == sha256):
+                sha256, file_name, *freshness = row
+            elif sha256 is None:
+                return None
+            else:
+                freshness = []
+
+            path = self._get_verified(conn, sha256, file_name)
+        finally:
+            conn.close()
+
+        return None if path is None else CachedFile(path, sha256, *freshness)
+
+    def _get_verified(self, conn, sha256: str, file_name: str) -> typing.Optional[pathlib.Path]:
+        key = f"sha256/{sha256}"
+        file_dir = self.get_file_dir(sha256)
+        try:
+            stored = [
+                p for p in file_dir.iterdir() if p.is_file() and not p.name.startswith(".")
+            ]  # skip partial copies
+            if not stored:
+                return None
+
+            path = file_dir / file_name
+            stored_path = path if path in stored else stored[0]
+            stat = stored_path.stat()
+        except FileNotFoundError:  # not stored or evicted concurrently
+            return None
+
+        row = conn.execute("SELECT size, mtime_ns FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None or tuple(row) != (stat.st_size, stat.st_mtime_ns):
+            # unknown or altered on disk
+            actual_sha256 = compute_sha256(stored_path)
+            if actual_sha256 != sha256:
+                warnings.warn(
+                    f"Removing corrupted cached {stored_path} (sha256 {actual_sha256})", category=CacheWarning
+                )
+                with conn:
+                    conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+                shutil.rmtree(file_dir, ignore_errors=True)
+                return None
+
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, size, mtime_ns, last_access, origin_url) "
+                    "VALUES (?, ?, ?, ?, (SELECT origin_url FROM entries WHERE key = ?))",
+                    (key, stat.st_size, stat.st_mtime_ns, time.time(), key),
+                )
+        else:
+            with conn:
+                conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+
+        if stored_path != path:
+            # same content stored under a different file name
+            _link_or_copy(stored_path, path)
+
+        return path
+
+    def add(
+        self,
+        url: str,
+        file: pathlib.Path,
+        *,
+        sha256: str,
+        file_name: str,
+        expires: typing.Optional[float] = None,
+        etag: typing.Optional[str] = None,
+        last_modified: typing.Optional[str] = None,
+    ) -> pathlib.Path:
+        """move a downloaded `file` with (already verified) `sha256` digest into the cache
+
+        Args:
+            url: url `file` was downloaded from
+            file: downloaded file
+            sha256: sha256 digest of `file`
+            file_name: file name to store `file` as
+            expires: end of freshness lifetime of the download
+            etag: ETag header of the download's response
+            last_modified: Last-Modified header of the download's response
+        """
+        file_dir = self.get_file_dir(sha256)
+        file_dir.mkdir(parents=True, exist_ok=True)
+        path = file_dir / file_name
+        if path.exists():
+            os.remove(file)  # identical file is already stored
+        else:
+            os.replace(file, path)
+
+        stat = path.stat()
+        now = time.time()
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, size, mtime_ns, last_access, origin_url) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (f"sha256/{sha256}", stat.st_size, stat.st_mtime_ns, now, url),
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO urls (url, sha256, file_name, fetched, expires, etag, last_modified) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (url, sha256, file_name, now, expires, etag, last_modified),
+                )
+        finally:
+            conn.close()
+
+        self.evict()
+        return path
+
+    def get_resolved(self, key: str) -> typing.Optional[str]:
+        """look up an unexpired resolution result, e.g. the URL a DOI resolves to"""
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT value, expires FROM resolved WHERE key = ?", (key,)).fetchone()
+        finally:
+            conn.close()
+
+        if row is None or row[1] <= time.time():
+            return None
+
+        return row[0]
+
+    def set_resolved(self, key: str, value: str, *, ttl: float):
+        """remember a resolution result for `ttl` seconds"""
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO resolved (key, value, expires) VALUES (?, ?, ?)",
+                    (key, value, time.time() + ttl),
+                )
+        finally:
+            conn.close()
+
+    def get_failures(self, *keys: str) -> typing.Dict[str, Failure]:
+        """look up the recorded failures of `keys`, e.g. urls (see `Failure.pending`)"""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                f"SELECT key, error, count, retry_after FROM failures WHERE key IN ({', '.join('?' * len(keys))})",
+                keys,
+            ).fetchall()
+        finally:
+            conn.close()
+
+        return {key: Failure(*failure) for key, *failure in rows}
+
+    def record_failure(self, key: str, error: str, *, ttl: float, max_ttl: float) -> Failure:
+        """record a failure of `key`; it is not attempted again for `ttl` seconds, doubled for every consecutive
+        failure up to `max_ttl` seconds"""
+        conn = self._connect()
+        try:
+            with conn:
+                row = conn.execute("SELECT count FROM failures WHERE key = ?", (key,)).fetchone()
+                count = 1 if row is None else row[0] + 1
+                failure = Failure(error, count, time.time() + min(ttl * 2 ** (count - 1), max_ttl))
+                conn.execute(
+                    "INSERT OR REPLACE INTO failures (key, error, count, retry_after) VALUES (?, ?, ?, ?)",
+                    (key, *failure),
+                )
+        finally:
+            conn.close()
+
+        return failure
+
+    def clear_failures(self, *keys: str):
+        """forget recorded failures of `keys` (of all keys if none are given)"""
+        conn = self._connect()
+        try:
+            with conn:
+                if keys:
+                    conn.executemany("DELETE FROM failures WHERE key = ?", [(key,) for key in keys])
+                else:
+                    conn.execute("DELETE FROM failures")
+        finally:
+            conn.close()
+
+    def revalidated(self, url: str, *, expires: typing.Optional[float] = None):
+        """record a successful revalidation of the file cached for `url` (e.g. a '304 Not Modified' response)"""
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("UPDATE urls SET fetched = ?, expires = ? WHERE url = ?", (time.time(), expires, url))
+        finally:
+            conn.close()
+
+    def track(self, path: pathlib.Path, *, origin_url: typing.Optional[str] = None):
+        """add or update a cache entry for a file or directory in the cache, e.g. an extracted package"""
+        key = path.relative_to(self.path).as_posix()
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries (key, size, mtime_ns, last_access, origin_url) "
+                    "VALUES (?, ?, NULL, ?, ?)",
+                    (key, get_size(path), time.time(), origin_url),
+                )
+        finally:
+            conn.close()
+
+        self.evict()
+
+    def touch(self, path: pathlib.Path):
+        """record an access of the cache entry at `path`"""
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    "UPDATE entries SET last_access = ? WHERE key = ?",
+                    (time.time(), path.relative_to(self.path).as_posix()),
+                )
+        finally:
+            conn.close()
+
+    def get_entries(self) -> typing.List[CacheEntry]:
+        """all cache entries from least to most recently used"""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT key, size, last_access, origin_url FROM entries ORDER BY last_access"
+            ).fetchall()
+        finally:
+            conn.close()
+
+        return [CacheEntry(*row) for row in rows]
+
+    @property
+    def size(self) -> int:
+        """total size of all cache entries in bytes"""
+        conn = self._connect()
+        try:
+            return conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        finally:
+            conn.close()
+
+    def evict(self, max_size: typing.Optional[int] = None) -> int:
+        """evict least recently used entries (not accessed within `min_age` seconds) until the cache size
+        is within `max_size` bytes (defaults to `self.max_size`; 0 for no limit).
+
+        Entries are first removed from the index and then moved out of place before deletion,
+        such that concurrent readers never find partially deleted entries.
+
+        Returns:
+            number of evicted bytes
+        """
+        if max_size is None:
+            max_size = self.max_size
+
+        if not max_size:
+            return 0
+
+        evicted: typing.List[str] = []
+        evicted_size = 0
+        lock_keys: typing.List[str] = []
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")  # serializes eviction across processes
+            size = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if size > max_size:
+                candidates = conn.execute(
+                    "SELECT key, size FROM entries WHERE last_access < ? ORDER BY last_access",
+                    (time.time() - self.min_age,),
+                ).fetchall()
+                for key, entry_size in candidates:
+                    if size - evicted_size <= max_size:
+                        break
+
+                    lock_keys += self._delete_from_index(conn, key)
+                    evicted.append(key)
+                    evicted_size += entry_size
+
+            conn.commit()
+        finally:
+            conn.close()
+
+        self._delete(evicted, lock_keys)
+        return evicted_size
+
+    def remove(self, path: pathlib.Path):
+        """remove the cache entry containing `path`"""
+        key = "/".join(path.relative_to(self.path).parts[:2])
+        conn = self._connect()
+        try:
+            with conn:
+                lock_keys = self._delete_from_index(conn, key)
+        finally:
+            conn.close()
+
+        self._delete([key], lock_keys)
+
+    @staticmethod
+    def _delete_from_index(conn, key: str) -> typing.List[str]:
+        """remove entry `key` from the index
+
+        Returns:
+            keys of the locks held to create the entry (see `lock`): its urls or the entry key itself
+        """
+        conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+        if not key.startswith("sha256/"):
+            return [key]
+
+        sha256 = key[len("sha256/") :]
+        urls = [row[0] for row in conn.execute("SELECT url FROM urls WHERE sha256 = ?", (sha256,))]
+        conn.execute("DELETE FROM urls WHERE sha256 = ?", (sha256,))
+        return urls
+
+    def _delete(self, keys: typing.Sequence[str], lock_keys: typing.Sequence[str] = ()):
+        """delete entries (already removed from the index) by moving them out of place first, and their lock files
+
+        Lock files of locks currently held are kept.
+        """
+        trash = self.path / "trash"
+        if keys:
+            trash.mkdir(parents=True, exist_ok=True)
+
+        for key in keys:
+            trashed = trash / uuid.uuid4().hex
+            try:
+                os.replace(self.path / key, trashed)
+            except FileNotFoundError:
+                continue
+
+            if trashed.is_dir():
+                shutil.rmtree(trashed, ignore_errors=True)
+            else:
+                os.remove(trashed)
+
+        for lock_key in lock_keys:
+            self.lock(lock_key).remove()
+
+
+def _link_or_copy(src: pathlib.Path, dst: pathlib.Path):
+    try:
+        os.link(src, dst)
+    except FileExistsError:
+        pass
+    except OSError:
+        # publish the copy atomically, such that concurrent readers never see a partial file
+        tmp = dst.with_name(f".{dst.name}.{uuid.uuid4().hex}")
+        shutil.copyfile(src, tmp)
+        os.replace(tmp, dst)
+
+
+cache_manager = CacheManager(BIOIMAGEIO_CACHE_PATH, max_size=BIOIMAGEIO_CACHE_MAX_SIZE)
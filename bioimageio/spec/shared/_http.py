@@ -0,0 +1,167 @@
+"""pooled HTTP sessions shared by downloads, availability checks and DOI resolution
+
+All HTTP requests of source resolution go through `http_client`, which keeps connections alive in a pool per host,
+such that, e.g., validating a collection reuses the connections to the same few hosts instead of a new TLS handshake
+per request. `requests` is only imported when the first request is made (it is not available in pyodide).
+Requests may be routed through another `Transport` instead (see `set_transport`), e.g. to a local stand-in server.
+In offline mode (BIOIMAGEIO_OFFLINE or `set_offline`) no request is made at all; remote sources are served from the
+cache or a read-only mirror tree (BIOIMAGEIO_MIRROR_PATH) instead.
+"""
+import os
+import pathlib
+import threading
+import typing
+from urllib.parse import unquote, urlsplit
+
+from .common import (
+    BIOIMAGEIO_HTTP_MAX_CONNECTIONS_PER_HOST,
+    BIOIMAGEIO_HTTP_TIMEOUT,
+    BIOIMAGEIO_MIRROR_PATH,
+    BIOIMAGEIO_OFFLINE,
+)
+
+if typing.TYPE_CHECKING:
+    import requests
+
+
+class OfflineError(RuntimeError):
+    """a remote resource was requested in offline mode, but is neither cached nor mirrored"""
+
+
+class Transport:
+    """interface of a transport for the HTTP requests of source resolution
+
+    `request` returns a response that behaves like a `requests.Response`
+    (status_code, headers, url, raise_for_status, iter_content, json, close).
+    """
+
+    def request(self, method: str, url: str, **kwargs) -> "requests.Response":
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class HttpClient(Transport):
+    """thread-safe HTTP client with keep-alive connection pooling
+
+    Args:
+        timeout: timeout in seconds to connect and to wait for (the next chunk of) a response
+        max_connections_per_host: maximum number of open connections per host; further requests wait for a connection
+        max_pools: number of hosts to keep a connection pool for
+        max_redirects: maximum number of redirects to follow
+        offline: refuse all requests (raising `OfflineError`)
+        mirror_path: read-only mirror tree to serve remote files from in offline mode;
+                     https://<host>/<path> is mirrored at <mirror_path>/<host>/<path>
+        transport: transport to send requests with instead of the pooled `requests` session
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: typing.Optional[float] = BIOIMAGEIO_HTTP_TIMEOUT,
+        max_connections_per_host: int = BIOIMAGEIO_HTTP_MAX_CONNECTIONS_PER_HOST,
+        max_pools: int = 32,
+        max_redirects: int = 30,
+        offline: bool = BIOIMAGEIO_OFFLINE,
+        mirror_path: typing.Optional[os.PathLike] = BIOIMAGEIO_MIRROR_PATH,
+        transport: typing.Optional[Transport] = None,
+    ):
+        self.transport = transport
+        self.offline = offline
+        self.mirror_path = None if mirror_path is None else pathlib.Path(mirror_path)
+        self.timeout = timeout
+        self.max_connections_per_host = max_connections_per_host
+        self.max_pools = max_pools
+        self.max_redirects = max_redirects
+        self._session: typing.Optional["requests.Session"] = None
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> "requests.Session":
+        with self._lock:
+            if self._session is None:
+                import requests
+
+                session = requests.Session()
+                session.max_redirects = self.max_redirects
+                adapter = requests.adapters.HTTPAdapter(
+                    pool_connections=self.max_pools, pool_maxsize=self.max_connections_per_host, pool_block=True
+                )
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._session = session
+
+            return self._session
+
+    def configure(
+        self,
+        *,
+        timeout: typing.Optional[float] = None,
+        max_connections_per_host: typing.Optional[int] = None,
+        max_pools: typing.Optional[int] = None,
+        max_redirects: typing.Optional[int] = None,
+        offline: typing.Optional[bool] = None,
+        mirror_path: typing.Optional[os.PathLike] = None,
+    ):
+        """update settings (`None` keeps a setting); open connections are closed"""
+        if offline is not None:
+            self.offline = offline
+        if mirror_path is not None:
+            self.mirror_path = pathlib.Path(mirror_path)
+        if timeout is not None:
+            self.timeout = timeout
+        if max_connections_per_host is not None:
+            self.max_connections_per_host = max_connections_per_host
+        if max_pools is not None:
+            self.max_pools = max_pools
+        if max_redirects is not None:
+            self.max_redirects = max_redirects
+
+        self.close()
+
+    def close(self):
+        """close all pooled connections"""
+        with self._lock:
+            session, self._session = self._session, None
+
+        if session is not None:
+            session.close()
+
+    def get_mirrored(self, url: str) -> typing.Optional[pathlib.Path]:
+        """path of `url` in the mirror tree, if mirrored"""
+        if self.mirror_path is None:
+            return None
+
+        parts = urlsplit(url)
+        path = self.mirror_path / parts.netloc / unquote(parts.path).lstrip("/")
+        return path if path.is_file() else None
+
+    def request(self, method: str, url: str, **kwargs) -> "requests.Response":
+        if self.offline:
+            raise OfflineError(f"Cannot request {url} in offline mode.")
+
+        kwargs.setdefault("timeout", self.timeout)
+        if self.transport is not None:
+            return self.transport.request(method, url, **kwargs)
+
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> "requests.Response":
+        return self.request("GET", url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> "requests.Response":
+        return self.request("HEAD", url, **kwargs)
+
+
+http_client = HttpClient()
+
+
+def set_offline(offline: bool = True, *, mirror_path: typing.Optional[os.PathLike] = None):
+    """switch offline mode on or off, optionally with a read-only mirror tree of remote files"""
+    http_client.configure(offline=offline, mirror_path=mirror_path)
+
+
+def set_transport(transport: typing.Optional[Transport]):
+    """send all HTTP requests of source resolution with `transport` (`None` restores the pooled `requests` session)"""
+    http_client.transport = transport
@@ -1,25 +1,55 @@
+import hashlib
 import json
 import os
 import pathlib
 import re
 import shutil
+import threading
+import time
 import typing
 import warnings
 import zipfile
 from functools import singledispatch
 from io import BytesIO, StringIO
 from tempfile import TemporaryDirectory
-from urllib.request import url2pathname, urlopen
+from urllib.parse import urlsplit
+from urllib.request import url2pathname
 
 from marshmallow import ValidationError
 
 from . import fields, raw_nodes
+from ._cache import (  # noqa
+    CACHE_POLICIES,
+    CachePolicy,
+    CacheStats,
+    CachedFile,
+    Failure,
+    cache_manager,
+    collect_cache_stats,
+    compute_sha256,
+    get_cache_stats,
+    get_expected_sha256,
+    get_expires,
+    record_cache_stats,
+    register_expected_sha256,
+    reset_cache_stats,
+)
+from ._http import OfflineError, http_client
+from ._zip_root import materialize, member_exists
 from .common import (
-    BIOIMAGEIO_CACHE_PATH,
+    BIOIMAGEIO_AVAILABILITY_TTL,
     BIOIMAGEIO_CACHE_WARNINGS_LIMIT,
+    BIOIMAGEIO_COLLECTION_TTL,
     BIOIMAGEIO_COLLECTION_URL,
+    BIOIMAGEIO_DOI_TTL,
+    BIOIMAGEIO_DOWNLOAD_BACKOFF,
+    BIOIMAGEIO_DOWNLOAD_RETRIES,
+    BIOIMAGEIO_FAILURE_MAX_TTL,
+    BIOIMAGEIO_FAILURE_TTL,
+    BIOIMAGEIO_ID_OR_NICKNAME_REGEX,
     BIOIMAGEIO_SITE_CONFIG_URL,
     BIOIMAGEIO_USE_CACHE,
+    BIOIMAGEIO_ZENODO_TTL,
     DOI_REGEX,
     RDF_NAMES,
     CacheWarning,
@@ -41,8 +71,8 @@ def _is_path(s: typing.Any) -> bool:
         return False
 
     try:
-        return pathlib.Path(s).exists()
-    except OSError:
+        return member_exists(s)  # a member of a packaged resource counts as path (without extracting it)
+    except (OSError, ValueError):
         return False
 
 
@@ -71,6 +101,7 @@ def resolve_rdf_source(
         raise TypeError(f"Unexpected source type {type(source)}")
 
     if isinstance(source, pathlib.Path):
+        materialize(source)  # extract a member of a packaged resource
         source_name = str(source)
         root: typing.Union[pathlib.Path, raw_nodes.URI] = source.parent
     elif isinstance(source, dict):
@@ -100,7 +131,13 @@ def resolve_rdf_source(
     if isinstance(source, str):
         # source might be bioimageio nickname, id, doi, url or file path -> resolve to pathlib.Path
 
-        bioimageio_rdf_source: typing.Optional[str] = (BIOIMAGEIO_COLLECTION_ENTRIES or {}).get(source, (None, None))[1]
+        if not _is_path(source) and re.fullmatch(BIOIMAGEIO_ID_OR_NICKNAME_REGEX, source):
+            # only fetch the collection for sources that may be a bioimageio id or nickname
+            bioimageio_rdf_source: typing.Optional[str] = (get_bioimageio_collection_entries() or {}).get(
+                source, (None, None)
+            )[1]
+        else:
+            bioimageio_rdf_source = None
 
         if bioimageio_rdf_source is not None:
             # source is bioimageio id or bioimageio nickname
@@ -121,7 +158,7 @@ def resolve_rdf_source(
 
             if is_zenodo_doi:
                 # source is a doi pointing to a zenodo record;
-                # we'll expect an rdf.yaml file in that record and use it as source...
+                # we'll expect an rdf.yaml (or model.yaml) file in that record and use it as source...
                 record_id = source[len(zenodo_prefix) :]
                 s_count = record_id.count("/")
                 if s_count:
@@ -134,27 +171,27 @@ def resolve_rdf_source(
 
                     record_id = record_id.split("/")[-1]
 
-                source = f"{zenodo_record_api}/{record_id}/files/rdf.yaml/content"
+                source_url, source = _download_zenodo_rdf(zenodo_record_api, record_id)
+                root = source_url.parent
             else:
                 # resolve doi
                 # todo: make sure the resolved url points to a rdf.yaml or a zipped package
-                response = urlopen(f"https://doi.org/{source}?type=URL")
-                source = response.url
-                assert isinstance(source, str)
+                source = _resolve_doi(source)
                 if not (source.endswith(".yaml") or source.endswith(".zip")):
                     raise NotImplementedError(
                         f"Resolved doi {source_name} to {source}, but don't know where to find 'rdf.yaml' "
                         f"or a packaged resource zip file."
                     )
 
-        assert isinstance(source, str)
-        if source.startswith("http"):
+        assert isinstance(source, (str, pathlib.Path))
+        if isinstance(source, str) and source.startswith("http"):
             source_url = raw_nodes.URI(uri_string=source)
             source = _download_url(source_url)
             root = source_url.parent
 
         if _is_path(source):
             source = pathlib.Path(source)
+            materialize(source)  # extract a member of a packaged resource
 
     if isinstance(source, (pathlib.Path, str, bytes)):
         # source is either:
@@ -198,6 +235,78 @@ def resolve_rdf_source(
     return RDF_Source(source, source_name, root)
 
 
+def _resolve_doi(doi: str) -> str:
+    """resolve `doi` to a URL (remembered for BIOIMAGEIO_DOI_TTL seconds)"""
+    key = f"doi:{doi}"
+    if BIOIMAGEIO_USE_CACHE:
+        url = cache_manager.get_resolved(key)
+        if url is not None:
+            return url
+
+    response = http_client.get(f"https://doi.org/{doi}?type=URL", stream=True)
+    response.close()
+    response.raise_for_status()
+    url = response.url
+    assert isinstance(url, str)
+    if BIOIMAGEIO_USE_CACHE:
+        cache_manager.set_resolved(key, url, ttl=BIOIMAGEIO_DOI_TTL)
+
+    return url
+
+
+def _get_zenodo_record_files(record_api: str, record_id: str) -> typing.List[str]:
+    """list the file names of a Zenodo record (remembered for BIOIMAGEIO_ZENODO_TTL seconds)"""
+    key = f"zenodo-files:{record_api}/{record_id}"
+    if BIOIMAGEIO_USE_CACHE:
+        listing = cache_manager.get_resolved(key)
+        if listing is not None:
+            return json.loads(listing)
+
+    response = http_client.get(f"{record_api}/{record_id}/files")
+    response.raise_for_status()
+    data = response.json()
+    entries = data.get("entries", data.get("files", [])) if isinstance(data, dict) else data
+    file_names = [e.get("key", e.get("filename")) for e in entries if isinstance(e, dict)]
+    file_names = [fn for fn in file_names if isinstance(fn, str)]
+    if BIOIMAGEIO_USE_CACHE:
+        cache_manager.set_resolved(key, json.dumps(file_names), ttl=BIOIMAGEIO_ZENODO_TTL)
+
+    return file_names
+
+
+def _download_zenodo_rdf(record_api: str, record_id: str) -> typing.Tuple[raw_nodes.URI, pathlib.Path]:
+    """download the RDF of a Zenodo record; its files are only listed if it has no 'rdf.yaml'"""
+    source_url = raw_nodes.URI(uri_string=f"{record_api}/{record_id}/files/rdf.yaml/content")
+    try:
+        return source_url, _download_url(source_url)
+    except OfflineError:
+        raise
+    except Exception:
+        rdf_name = _get_zenodo_rdf_name(record_api, record_id)
+        if rdf_name == "rdf.yaml":
+            raise
+
+    source_url = raw_nodes.URI(uri_string=f"{record_api}/{record_id}/files/{rdf_name}/content")
+    return source_url, _download_url(source_url)
+
+
+def _get_zenodo_rdf_name(record_api: str, record_id: str) -> str:
+    """name of the RDF in a Zenodo record; 'rdf.yaml' if the record's files cannot be listed"""
+    try:
+        file_names = _get_zenodo_record_files(record_api, record_id)
+    except OfflineError:
+        return "rdf.yaml"
+    except Exception as e:
+        warnings.warn(f"Could not list files of Zenodo record {record_id} ({e}). Assuming 'rdf.yaml'.")
+        return "rdf.yaml"
+
+    for rdf_name in RDF_NAMES:
+        if rdf_name in file_names:
+            return rdf_name
+
+    return "rdf.yaml"
+
+
 def resolve_rdf_source_and_type(
     source: typing.Union[os.PathLike, typing.IO, bytes, str, dict, raw_nodes.URI]
 ) -> typing.Tuple[dict, str, typing.Union[pathlib.Path, raw_nodes.URI], str]:
@@ -208,7 +317,15 @@ def resolve_rdf_source_and_type(
 
 
 @singledispatch  # todo: fix type annotations
-def resolve_source(source, root_path: typing.Union[os.PathLike, URI] = pathlib.Path(), output=None, pbar=None):
+def resolve_source(
+    source,
+    root_path: typing.Union[os.PathLike, URI] = pathlib.Path(),
+    output=None,
+    pbar=None,
+    *,
+    cache_policy: typing.Optional[CachePolicy] = None,
+    sha256: typing.Optional[str] = None,
+):
     """Resolve sources to local files
 
     Args:
@@ -219,6 +336,11 @@ def resolve_source(source, root_path: typing.Union[os.PathLike, URI] = pathlib.P
           pbar is only used in the case of downloading resources. Specifying a custom pbar here
           helps adding features like progress reporting (outside the cmd) and cancellation
           (by raising DownloadCancelled).
+        cache_policy: how to use cached downloads: 'cache-first', 'revalidate' or 'network-only'
+          (see `_download_url`)
+        sha256: expected sha256 digest of a remote source to verify its download or cached copy against;
+          defaults to the digest registered for its URL (see `register_expected_sha256`).
+          For a list of sources one (optional) digest per source.
     """
     raise TypeError(type(source))
 
@@ -229,10 +351,13 @@ def _resolve_source_uri_node(
     root_path: typing.Union[os.PathLike, URI] = pathlib.Path(),
     output: typing.Optional[os.PathLike] = None,
     pbar=None,
+    *,
+    cache_policy: typing.Optional[CachePolicy] = None,
+    sha256: typing.Optional[str] = None,
 ) -> pathlib.Path:
     path_or_remote_uri = resolve_local_source(source, root_path, output)
     if isinstance(path_or_remote_uri, raw_nodes.URI):
-        local_path = _download_url(path_or_remote_uri, output, pbar=pbar)
+        local_path = _download_url(path_or_remote_uri, output, pbar=pbar, cache_policy=cache_policy, sha256=sha256)
     elif isinstance(path_or_remote_uri, pathlib.Path):
         local_path = path_or_remote_uri
     else:
@@ -247,8 +372,18 @@ def _resolve_source_str(
     root_path: typing.Union[os.PathLike, URI] = pathlib.Path(),
     output: typing.Optional[os.PathLike] = None,
     pbar=None,
+    *,
+    cache_policy: typing.Optional[CachePolicy] = None,
+    sha256: typing.Optional[str] = None,
 ) -> pathlib.Path:
-    return resolve_source(fields.Union([fields.URI(), fields.Path()]).deserialize(source), root_path, output, pbar)
+    return resolve_source(
+        fields.Union([fields.URI(), fields.Path()]).deserialize(source),
+        root_path,
+        output,
+        pbar,
+        cache_policy=cache_policy,
+        sha256=sha256,
+    )
 
 
 @resolve_source.register
@@ -257,14 +392,18 @@ def _resolve_source_path(
     root_path: typing.Union[os.PathLike, URI] = pathlib.Path(),
     output: typing.Optional[os.PathLike] = None,
     pbar=None,
+    *,
+    cache_policy: typing.Optional[CachePolicy] = None,
+    sha256: typing.Optional[str] = None,
 ) -> pathlib.Path:
     if not os.path.isabs(source):
         if isinstance(root_path, os.PathLike):
             root_path = pathlib.Path(root_path).resolve()
         source = root_path / source
         if isinstance(source, URI):
-            return resolve_source(source, output=output, pbar=pbar)
+            return resolve_source(source, output=output, pbar=pbar, cache_policy=cache_policy, sha256=sha256)
 
+    materialize(source)  # extract a member of a packaged resource
     if output is None:
         return source
     else:
@@ -281,9 +420,15 @@ def _resolve_source_resolved_importable_path(
     root_path: typing.Union[os.PathLike, URI] = pathlib.Path(),
     output: typing.Optional[os.PathLike] = None,
     pbar=None,
+    *,
+    cache_policy: typing.Optional[CachePolicy] = None,
+    sha256: typing.Optional[str] = None,
 ) -> raw_nodes.ResolvedImportableSourceFile:
     return raw_nodes.ResolvedImportableSourceFile(
-        callable_name=source.callable_name, source_file=resolve_source(source.source_file, root_path, output, pbar)
+        callable_name=source.callable_name,
+        source_file=resolve_source(
+            source.source_file, root_path, output, pbar, cache_policy=cache_policy, sha256=sha256
+        ),
     )
 
 
@@ -293,9 +438,15 @@ def _resolve_source_importable_path(
     root_path: typing.Union[os.PathLike, URI] = pathlib.Path(),
     output: typing.Optional[os.PathLike] = None,
     pbar=None,
+    *,
+    cache_policy: typing.Optional[CachePolicy] = None,
+    sha256: typing.Optional[str] = None,
 ) -> raw_nodes.ResolvedImportableSourceFile:
     return raw_nodes.ResolvedImportableSourceFile(
-        callable_name=source.callable_name, source_file=resolve_source(source.source_file, root_path, output, pbar)
+        callable_name=source.callable_name,
+        source_file=resolve_source(
+            source.source_file, root_path, output, pbar, cache_policy=cache_policy, sha256=sha256
+        ),
     )
 
 
@@ -305,12 +456,21 @@ def _resolve_source_list(
     root_path: typing.Union[os.PathLike, URI] = pathlib.Path(),
     output: typing.Optional[typing.Sequence[typing.Optional[os.PathLike]]] = None,
     pbar: typing.Optional[typing.Sequence] = None,
+    *,
+    cache_policy: typing.Optional[CachePolicy] = None,
+    sha256: typing.Optional[typing.Sequence[typing.Optional[str]]] = None,
 ) -> typing.List[pathlib.Path]:
+    if isinstance(sha256, str):
+        raise TypeError("Expected one sha256 per source (or None) to resolve a list of sources, not a single sha256")
+
     assert output is None or len(output) == len(source)
     assert pbar is None or len(pbar) == len(source)
+    assert sha256 is None or len(sha256) == len(source)
     return [
-        resolve_source(el, root_path, out, pb)
-        for el, out, pb in zip(source, output or [None] * len(source), pbar or [None] * len(source))
+        resolve_source(el, root_path, out, pb, cache_policy=cache_policy, sha256=sha)
+        for el, out, pb, sha in zip(
+            source, output or [None] * len(source), pbar or [None] * len(source), sha256 or [None] * len(source)
+        )
     ]
 
 
@@ -347,12 +507,24 @@ def resolve_local_source(
     source: typing.Union[str, os.PathLike, raw_nodes.URI],
     root_path: typing.Union[os.PathLike, URI],
     output: typing.Optional[os.PathLike] = None,
+    *,
+    extract: bool = True,
 ) -> typing.Union[pathlib.Path, raw_nodes.URI]:
+    """resolve `source` to a local path or a remote uri
+
+    Args:
+        source: local path or uri, relative to `root_path` or absolute
+        root_path: root to resolve a relative `source` against
+        output: file path to copy a local `source` to
+        extract: extract a local `source` that is a member of a packaged resource (see `ZipRoot`) to the file system;
+                 if False, a member is only checked to exist in its package
+    """
+    exists = materialize if extract or output is not None else member_exists
     if isinstance(source, os.PathLike) or isinstance(source, str):
         if isinstance(root_path, os.PathLike):
             try:  # source as relative path from root_path
                 source_from_root = pathlib.Path(root_path) / source
-                is_path_rp = source_from_root.exists()
+                is_path_rp = exists(source_from_root)
             except OSError:
                 pass
             else:
@@ -360,7 +532,7 @@ def resolve_local_source(
                     source = source_from_root
 
         source = pathlib.Path(source)
-        if not source.exists():
+        if not exists(source):
             raise FileNotFoundError(f"Could not find {source}")
 
         if output is None:
@@ -380,7 +552,7 @@ def resolve_local_source(
     assert isinstance(uri, raw_nodes.URI), uri
     if uri.scheme == "file":
         local_path_or_remote_uri: typing.Union[pathlib.Path, raw_nodes.URI] = pathlib.Path(url2pathname(uri.path))
-    elif uri.scheme in ("https", "https"):
+    elif uri.scheme in ("http", "https"):
         local_path_or_remote_uri = uri
     else:
         raise ValueError(f"Unknown uri scheme {uri.scheme}")
@@ -388,48 +560,213 @@ def resolve_local_source(
     return local_path_or_remote_uri
 
 
-def source_available(source: typing.Union[pathlib.Path, raw_nodes.URI], root_path: pathlib.Path) -> bool:
-    local_path_or_remote_uri = resolve_local_source(source, root_path)
-    if isinstance(local_path_or_remote_uri, raw_nodes.URI):
-        import requests  # not available in pyodide
-
-        response = requests.head(str(local_path_or_remote_uri))
-        for n_redirect in range(100):
-            if (
-                response.status_code in (301, 302, 307, 308)
-                and response.next is not None
-                and response.next.url is not None
-            ):
-                response = requests.head(response.next.url)
-            else:
-                break
+# short-lived cache of availability checks (url -> (available, time of check))
+# and memoized redirects (url -> final url) shared by `source_available` and `sources_available`
+_url_available: typing.Dict[str, typing.Tuple[bool, float]] = {}
+_url_redirects: typing.Dict[str, str] = {}
+_url_available_lock = threading.Lock()
+
 
+def _check_url_available(url: str, max_age: typing.Optional[float] = None) -> bool:
+    import requests  # not available in pyodide
+
+    if max_age is None:
+        max_age = BIOIMAGEIO_AVAILABILITY_TTL
+
+    if http_client.offline:
+        try:
+            _get_offline(raw_nodes.URI(uri_string=url), None)
+        except OfflineError:
+            return False
+        else:
+            return True
+
+    now = time.time()
+    with _url_available_lock:
+        final_url = _url_redirects.get(url, url)
+        for u in (url, final_url):
+            if u in _url_available and now - _url_available[u][1] < max_age:
+                return _url_available[u][0]
+
+    try:
+        failed = _check_failures(final_url)
+    except _KnownFailure:
+        return False
+
+    try:
+        response = http_client.head(final_url, allow_redirects=True)
+    except requests.TooManyRedirects:
+        available = False
+    except requests.ConnectionError as e:
+        _record_failure(final_url, e)
+        raise
+    else:
+        _clear_failures(failed)
+
+        response.close()
         available = response.status_code == 200
+        if response.url != final_url:
+            final_url = response.url
+
+    with _url_available_lock:
+        if final_url != url:
+            _url_redirects[url] = final_url
+
+        _url_available[url] = _url_available[final_url] = (available, now)
+
+    return available
+
+
+def source_available(
+    source: typing.Union[pathlib.Path, raw_nodes.URI],
+    root_path: pathlib.Path,
+    *,
+    max_age: typing.Optional[float] = None,
+) -> bool:
+    """check if `source` exists locally or remotely (with a HEAD request, following redirects)
+
+    Args:
+        source: local path or uri
+        root_path: root to resolve a relative `source` against
+        max_age: reuse the result of a check of a remote `source` up to `max_age` seconds old;
+                 defaults to BIOIMAGEIO_AVAILABILITY_TTL
+    """
+    local_path_or_remote_uri = resolve_local_source(source, root_path, extract=False)
+    if isinstance(local_path_or_remote_uri, raw_nodes.URI):
+        available = _check_url_available(str(local_path_or_remote_uri), max_age)
     elif isinstance(local_path_or_remote_uri, pathlib.Path):
-        available = local_path_or_remote_uri.exists()
+        available = member_exists(local_path_or_remote_uri)
     else:
         raise TypeError(local_path_or_remote_uri)
 
     return available
 
 
+def sources_available(
+    sources: typing.Sequence[typing.Union[pathlib.Path, raw_nodes.URI]],
+    root_path: pathlib.Path = pathlib.Path(),
+    *,
+    max_workers: int = 16,
+    per_host_limit: int = 4,
+    max_age: typing.Optional[float] = None,
+) -> typing.List[bool]:
+    """check the availability of many sources concurrently (see `source_available`)
+
+    Args:
+        sources: local paths or uris
+        root_path: root to resolve relative `sources` against
+        max_workers: maximum number of concurrent checks
+        per_host_limit: maximum number of concurrent checks per host
+        max_age: reuse results of checks up to `max_age` seconds old; defaults to BIOIMAGEIO_AVAILABILITY_TTL
+
+    Returns:
+        availability of each source; missing local files and remote sources that could not be reached
+        (e.g. due to a timeout) are unavailable
+    """
+    import requests  # not available in pyodide
+    from concurrent.futures import ThreadPoolExecutor
+
+    host_limits: typing.Dict[str, threading.BoundedSemaphore] = {}
+    host_limits_lock = threading.Lock()
+
+    def check(source: typing.Union[pathlib.Path, raw_nodes.URI]) -> bool:
+        try:
+            local_path_or_remote_uri = resolve_local_source(source, root_path, extract=False)
+        except FileNotFoundError:
+            return False
+
+        if not isinstance(local_path_or_remote_uri, raw_nodes.URI):
+            return member_exists(local_path_or_remote_uri)
+
+        with host_limits_lock:
+            host_limit = host_limits.setdefault(
+                local_path_or_remote_uri.authority, threading.BoundedSemaphore(per_host_limit)
+            )
+
+        with host_limit:
+            try:
+                return _check_url_available(str(local_path_or_remote_uri), max_age)
+            except requests.RequestException:
+                return False
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(check, sources))
+
+
 cache_warnings_count = 0
 
 
-def _download_url(uri: raw_nodes.URI, output: typing.Optional[os.PathLike] = None, pbar=None) -> pathlib.Path:
+def _get_file_name(uri: raw_nodes.URI, response=None) -> str:
+    """file name of a download from `uri`, preferring a file name given by the response's content disposition"""
+    if response is not None:
+        match = re.search(r'filename="?([^";]+)"?', response.headers.get("content-disposition", ""))
+        if match is not None:
+            file_name = pathlib.PurePosixPath(match.group(1).strip()).name
+            if file_name:
+                return file_name
+
+    return uri.path.rstrip("/").split("/")[-1] or "file"
+
+
+def _download_url(
+    uri: raw_nodes.URI,
+    output: typing.Optional[os.PathLike] = None,
+    pbar=None,
+    max_age: typing.Optional[float] = None,
+    sha256: typing.Optional[str] = None,
+    cache_policy: typing.Optional[CachePolicy] = None,
+    retries: typing.Optional[int] = None,
+    backoff: typing.Optional[float] = None,
+) -> pathlib.Path:
+    """download `uri` to `output` or the content-addressed download cache in BIOIMAGEIO_CACHE_PATH
+
+    Args:
+        uri: remote resource to download
+        output: file path to download to; defaults to a path in BIOIMAGEIO_CACHE_PATH
+        pbar: progress bar sharing a minimal tqdm interface, if none given, tqdm is used.
+        max_age: if given, a file cached for `uri` is fresh for `max_age` seconds after it was last downloaded or
+                 revalidated (instead of the freshness lifetime given by the server).
+        sha256: expected sha256 digest of the file. Defaults to the digest registered for `uri`
+                (see `register_expected_sha256`), e.g. declared by a loaded model's weights entry.
+                A cached file with this digest is used independent of the URL it was downloaded from.
+        cache_policy: One of
+                      'cache-first': use a cached file without any request,
+                      'revalidate': use a fresh cached file, otherwise revalidate it with a conditional request
+                      (If-None-Match/If-Modified-Since) and only download it again if it changed,
+                      'network-only': always download.
+                      Defaults to 'cache-first' for files with a known sha256 and to 'revalidate' otherwise.
+                      If revalidation fails, e.g. when offline, the cached file is used.
+        retries: number of retries after connection errors, timeouts or server errors (5xx);
+                 defaults to BIOIMAGEIO_DOWNLOAD_RETRIES. A retry resumes the partial download if possible.
+        backoff: delay in seconds before the first retry, doubled for every further retry;
+                 defaults to BIOIMAGEIO_DOWNLOAD_BACKOFF.
+
+    In offline mode (see `set_offline`) `uri` is only served from the cache or the mirror tree;
+    `OfflineError` is raised if it is in neither.
+    """
     global cache_warnings_count
 
-    if output is not None:
-        local_path = pathlib.Path(output)
-    elif BIOIMAGEIO_USE_CACHE:
-        # todo: proper caching
-        local_path = BIOIMAGEIO_CACHE_PATH / uri.scheme / uri.authority / uri.path.strip("/") / uri.query
+    url = str(uri)
+    if sha256 is None:
+        sha256 = get_expected_sha256(url)
     else:
-        tmp_dir = TemporaryDirectory()
-        no_cache_tmp_list.append(tmp_dir)  # keep temporary file until process ends
-        local_path = pathlib.Path(tmp_dir.name) / "file"
+        sha256 = sha256.lower()
+
+    if cache_policy is None:
+        cache_policy = "cache-first" if sha256 is not None else "revalidate"
+    elif cache_policy not in CACHE_POLICIES:
+        raise ValueError(f"Invalid cache_policy {cache_policy}. Choose from {CACHE_POLICIES}.")
+
+    if http_client.offline:
+        return _copy_to_output(_get_offline(uri, sha256), output)
+
+    cached = None
+    if BIOIMAGEIO_USE_CACHE and cache_policy != "network-only":
+        cached = cache_manager.lookup(url, sha256=sha256, file_name=_get_file_name(uri))
 
-    if local_path.exists():
+    if cached is not None and (cache_policy == "cache-first" or cached.is_fresh(max_age)):
+        local_path = cached.path
+        _record_cache_hit(local_path)
         cache_warnings_count += 1
         if cache_warnings_count <= BIOIMAGEIO_CACHE_WARNINGS_LIMIT:
             warnings.warn(f"found cached {local_path}. Skipping download of {uri}.", category=CacheWarning)
@@ -439,54 +776,427 @@ def _download_url(uri: raw_nodes.URI, output: typing.Optional[os.PathLike] = Non
                     category=CacheWarning,
                 )
 
+    elif BIOIMAGEIO_USE_CACHE:
+        # only one requester (thread or process) downloads `url` at a time; others wait and use its download
+        requested = time.time()
+        with cache_manager.lock(url):
+            cached = cache_manager.lookup(url, sha256=sha256, file_name=_get_file_name(uri))
+            if cached is not None and cached.fetched is not None and cached.fetched >= requested:
+                local_path = cached.path  # downloaded or revalidated by a concurrent requester
+                _record_cache_hit(local_path)
+            elif cache_policy == "network-only":
+                local_path = _fetch_url(uri, output, pbar, sha256, None, retries, backoff)
+            elif cached is not None and (cache_policy == "cache-first" or cached.is_fresh(max_age)):
+                local_path = cached.path
+                _record_cache_hit(local_path)
+            else:
+                local_path = _fetch_url(uri, output, pbar, sha256, cached, retries, backoff)
     else:
-        local_path.parent.mkdir(parents=True, exist_ok=True)
+        local_path = _fetch_url(uri, output, pbar, sha256, cached, retries, backoff)
 
-        import requests  # not available in pyodide
+    return _copy_to_output(local_path, output)
+
+
+def _record_cache_hit(path: pathlib.Path):
+    record_cache_stats(hits=1, bytes_served=path.stat().st_size)
 
-        try:
-            # download with tqdm adapted from:
-            # https://github.com/shaypal5/tqdl/blob/189f7fd07f265d29af796bee28e0893e1396d237/tqdl/core.py
-            # Streaming, so we can iterate over the response.
-            headers = {}
-            if os.environ.get("CI", "false").lower() in ("1", "t", "true", "yes", "y"):
-                headers["User-Agent"] = "ci"
-
-            user_agent = os.environ.get("BIOIMAGEIO_USER_AGENT")
-            if user_agent is not None:
-                headers["User-Agent"] = user_agent
-
-            r = requests.get(str(uri), stream=True, headers=headers)
-            r.raise_for_status()
-            # Total size in bytes.
-            total_size = int(r.headers.get("content-length", 0))
-            block_size = 1024  # 1 Kibibyte
-            if pbar:
-                t = pbar(total=total_size, unit="iB", unit_scale=True, desc=uri.path.split("/")[-1])
-            else:
-                t = tqdm(total=total_size, unit="iB", unit_scale=True, desc=uri.path.split("/")[-1])
-            tmp_path = local_path.with_suffix(f"{local_path.suffix}.part")
-            with tmp_path.open("wb") as f:
-                for data in r.iter_content(block_size):
-                    t.update(len(data))
-                    f.write(data)
 
+def _get_offline(uri: raw_nodes.URI, sha256: typing.Optional[str]) -> pathlib.Path:
+    """get `uri` from the cache or the mirror tree (in offline mode)"""
+    url = str(uri)
+    if BIOIMAGEIO_USE_CACHE:
+        cached = cache_manager.lookup(url, sha256=sha256, file_name=_get_file_name(uri))
+        if cached is not None:
+            _record_cache_hit(cached.path)
+            return cached.path
+
+    mirrored = http_client.get_mirrored(url)
+    if mirrored is None:
+        raise OfflineError(
+            f"{uri} is not available offline (neither cached in {cache_manager.path} "
+            f"nor mirrored in {http_client.mirror_path})."
+        )
+
+    if sha256 is not None and compute_sha256(mirrored) != sha256:
+        raise ValueError(f"sha256 of mirrored {mirrored} does not match expected sha256 {sha256}")
+
+    _record_cache_hit(mirrored)
+    return mirrored
+
+
+def stream_source(
+    uri: raw_nodes.URI,
+    *,
+    sha256: typing.Optional[str] = None,
+    pbar=None,
+    chunk_size: int = 1 << 20,
+    retries: typing.Optional[int] = None,
+    backoff: typing.Optional[float] = None,
+) -> typing.Iterator[bytes]:
+    """stream the content of the remote `uri` in chunks without storing it in the download cache
+
+    A cached copy is streamed instead if `uri` has a known sha256; in offline mode `uri` is streamed from the cache or the
+    mirror tree (see `resolve_source`).
+
+    Args:
+        uri: remote resource to stream
+        sha256: expected sha256 digest of the content. Defaults to the digest registered for `uri`
+                (see `register_expected_sha256`). The streamed content is verified once complete.
+        pbar: progress bar sharing a minimal tqdm interface, if none given, tqdm is used.
+        chunk_size: size of the streamed chunks in bytes
+        retries: number of retries of the request (before any content is streamed);
+                 defaults to BIOIMAGEIO_DOWNLOAD_RETRIES.
+        backoff: delay in seconds before the first retry, doubled for every further retry;
+                 defaults to BIOIMAGEIO_DOWNLOAD_BACKOFF.
+    """
+    url = str(uri)
+    if sha256 is None:
+        sha256 = get_expected_sha256(url)
+    else:
+        sha256 = sha256.lower()
+
+    local_path: typing.Optional[pathlib.Path] = None
+    if http_client.offline:
+        local_path = _get_offline(uri, sha256)
+    elif BIOIMAGEIO_USE_CACHE and sha256 is not None:
+        cached = cache_manager.lookup(url, sha256=sha256, file_name=_get_file_name(uri))
+        if cached is not None:
+            local_path = cached.path
+            _record_cache_hit(local_path)
+
+    if local_path is not None:
+        with local_path.open("rb") as f:
+            yield from iter(lambda: f.read(chunk_size), b"")
+
+        return
+
+    import requests  # not available in pyodide
+
+    if retries is None:
+        retries = BIOIMAGEIO_DOWNLOAD_RETRIES
+    if backoff is None:
+        backoff = BIOIMAGEIO_DOWNLOAD_BACKOFF
+
+    start = time.perf_counter()
+    try:
+        failed = _check_failures(url)
+        for attempt in range(retries + 1):
+            try:
+                r = http_client.get(url, stream=True, headers=_get_request_headers())
+                r.raise_for_status()
+                break
+            except requests.RequestException as e:
+                response = getattr(e, "response", None)
+                if attempt == retries or (response is not None and response.status_code < 500):
+                    raise
+
+                delay = backoff * 2**attempt
+                warnings.warn(f"Download of {uri} failed ({e}). Retrying in {delay}s.")
+                time.sleep(delay)
+        else:
+            raise RuntimeError("unreachable")
+
+        desc = url.split("?")[0].rstrip("/").split("/")[-1]
+        t = (pbar or tqdm)(total=int(r.headers.get("content-length", 0)), unit="iB", unit_scale=True, desc=desc)
+        h = hashlib.sha256()
+        downloaded = 0
+        try:
+            for data in r.iter_content(chunk_size):
+                t.update(len(data))
+                h.update(data)
+                downloaded += len(data)
+                yield data
+        finally:
+            record_cache_stats(bytes_downloaded=downloaded)
+            r.close()
             t.close()
-            if total_size != 0 and hasattr(t, "n") and t.n != total_size:
-                # todo: check more carefully and raise on real issue
-                warnings.warn(f"Download ({t.n}) does not have expected size ({total_size}).")
-
-            shutil.move(f.name, str(local_path))
-        except DownloadCancelled as e:
-            # let calling code handle this exception specifically -> allow for cancellation of
-            # long running downloads per user request
-            raise e
-        except Exception as e:
+
+        _clear_failures(failed)
+
+        if sha256 is not None and h.hexdigest() != sha256:
+            raise ValueError(f"sha256 of download {h.hexdigest()} does not match expected sha256 {sha256}")
+
+        record_cache_stats(misses=1)
+    except Exception as e:
+        _record_failure(url, e)
+        raise RuntimeError(f"Failed to download {uri} ({e})") from e
+    finally:
+        record_cache_stats(download_time=time.perf_counter() - start)
+
+
+def _get_request_headers() -> typing.Dict[str, str]:
+    headers = {}
+    if os.environ.get("CI", "false").lower() in ("1", "t", "true", "yes", "y"):
+        headers["User-Agent"] = "ci"
+
+    user_agent = os.environ.get("BIOIMAGEIO_USER_AGENT")
+    if user_agent is not None:
+        headers["User-Agent"] = user_agent
+
+    return headers
+
+
+def _fetch_url(
+    uri: raw_nodes.URI,
+    output: typing.Optional[os.PathLike],
+    pbar,
+    sha256: typing.Optional[str],
+    cached: typing.Optional[CachedFile],
+    retries: typing.Optional[int],
+    backoff: typing.Optional[float],
+) -> pathlib.Path:
+    """download `uri`, or revalidate the `cached` file (see `_download_url`)"""
+    url = str(uri)
+    import requests  # not available in pyodide
+
+    headers = _get_request_headers()
+    if cached is not None:
+        # conditional request to revalidate cached file
+        if cached.etag is not None:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified is not None:
+            headers["If-Modified-Since"] = cached.last_modified
+
+    # partial downloads are kept to be resumed
+    if BIOIMAGEIO_USE_CACHE:
+        tmp_path = cache_manager.tmp_dir / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.part"
+    elif output is None:
+        tmp_dir = TemporaryDirectory()
+        no_cache_tmp_list.append(tmp_dir)  # keep temporary file until process ends
+        tmp_path = pathlib.Path(tmp_dir.name) / "download.part"
+    else:
+        tmp_path = pathlib.Path(output).with_suffix(f"{pathlib.Path(output).suffix}.part")
+
+    tmp_path.parent.mkdir(parents=True, exist_ok=True)
+    if retries is None:
+        retries = BIOIMAGEIO_DOWNLOAD_RETRIES
+    if backoff is None:
+        backoff = BIOIMAGEIO_DOWNLOAD_BACKOFF
+
+    start = time.perf_counter()
+    try:
+        failed = _check_failures(url)
+        for attempt in range(retries + 1):
+            try:
+                download = _download_to_part(url, tmp_path, headers, pbar)
+                break
+            except requests.RequestException as e:
+                response = getattr(e, "response", None)
+                if attempt == retries or (response is not None and response.status_code < 500):
+                    raise
+
+                delay = backoff * 2**attempt
+                warnings.warn(f"Download of {uri} failed ({e}). Retrying in {delay}s.")
+                time.sleep(delay)
+        else:
+            raise RuntimeError("unreachable")
+
+        _clear_failures(failed)
+
+        r = download.response
+        if download.sha256 is None:  # not modified
+            assert cached is not None
+            cache_manager.revalidated(url, expires=get_expires(r.headers, download.time))
+            _record_cache_hit(cached.path)
+            return cached.path
+
+        if sha256 is not None and download.sha256 != sha256:
+            os.remove(tmp_path)
+            raise ValueError(f"sha256 of download {download.sha256} does not match expected sha256 {sha256}")
+
+        record_cache_stats(misses=1)
+        file_name = _get_file_name(uri, r)
+        if BIOIMAGEIO_USE_CACHE:
+            local_path = cache_manager.add(
+                url,
+                tmp_path,
+                sha256=download.sha256,
+                file_name=file_name,
+                expires=get_expires(r.headers, download.time),
+                etag=r.headers.get("ETag"),
+                last_modified=r.headers.get("Last-Modified"),
+            )
+        else:
+            local_path = tmp_path.with_name(file_name) if output is None else pathlib.Path(output)
+            shutil.move(str(tmp_path), str(local_path))
+    except DownloadCancelled as e:
+        # let calling code handle this exception specifically -> allow for cancellation of
+        # long running downloads per user request
+        raise e
+    except Exception as e:
+        _record_failure(url, e)
+        if cached is None:
             raise RuntimeError(f"Failed to download {uri} ({e})") from e
+        else:
+            local_path = cached.path
+            _record_cache_hit(local_path)
+            warnings.warn(f"Failed to revalidate cached {local_path} from {uri} ({e})", category=CacheWarning)
+    finally:
+        record_cache_stats(download_time=time.perf_counter() - start)
 
     return local_path
 
 
+class _KnownFailure(Exception):
+    """a url (or its host) failed recently and is not requested again yet"""
+
+
+# number of consecutive connection failures (of any of its urls) after which a host is considered unreachable
+HOST_FAILURE_THRESHOLD = 3
+
+# consecutive connection failures by host; only kept in-process, as a host may just be unreachable temporarily or
+# from the current network. An unreachable host is requested again after BIOIMAGEIO_FAILURE_TTL seconds.
+_host_failures: typing.Dict[str, Failure] = {}
+_host_failures_lock = threading.Lock()
+
+
+def _check_failures(url: str) -> typing.List[str]:
+    """raise `_KnownFailure` if `url` or its host failed recently; returns keys of earlier failures to clear on success
+
+    Failures of urls are recorded with an exponential backoff (see `BIOIMAGEIO_FAILURE_TTL`) in the cache index,
+    such that repeated runs skip dead urls instead of waiting for them to time out again.
+    """
+    if not BIOIMAGEIO_FAILURE_TTL:
+        return []
+
+    failures = cache_manager.get_failures(url) if BIOIMAGEIO_USE_CACHE else {}
+    host = urlsplit(url).netloc
+    with _host_failures_lock:
+        if host in _host_failures:
+            failures[f"host:{host}"] = _host_failures[host]
+
+    for key, failure in failures.items():
+        if failure.pending:
+            raise _KnownFailure(
+                f"{key} failed {failure.count} time(s) in a row, last with: {failure.error}. "
+                f"Not retrying before {time.ctime(failure.retry_after)}."
+            )
+
+    return list(failures)
+
+
+def _clear_failures(failed: typing.List[str]):
+    """forget earlier failures (as returned by `_check_failures`) after a successful request"""
+    if not failed:
+        return
+
+    with _host_failures_lock:
+        for key in failed:
+            if key.startswith("host:"):
+                _host_failures.pop(key[len("host:") :], None)
+
+    url_keys = [key for key in failed if not key.startswith("host:")]
+    if url_keys:
+        cache_manager.clear_failures(*url_keys)
+
+
+def _record_failure(url: str, error: Exception):
+    """record a failed request of `url` (and count a connection failure of its host)"""
+    import requests  # not available in pyodide
+
+    if not BIOIMAGEIO_FAILURE_TTL or not isinstance(error, requests.RequestException):
+        return
+
+    if isinstance(error, requests.ConnectionError):
+        host = urlsplit(url).netloc
+        with _host_failures_lock:
+            count = _host_failures[host].count + 1 if host in _host_failures else 1
+            retry_after = time.time() + BIOIMAGEIO_FAILURE_TTL if count >= HOST_FAILURE_THRESHOLD else 0.0
+            _host_failures[host] = Failure(str(error), count, retry_after)
+
+    if BIOIMAGEIO_USE_CACHE:
+        cache_manager.record_failure(url, str(error), ttl=BIOIMAGEIO_FAILURE_TTL, max_ttl=BIOIMAGEIO_FAILURE_MAX_TTL)
+
+
+class _Download(typing.NamedTuple):
+    response: typing.Any  # requests.Response with consumed content
+    sha256: typing.Optional[str]  # sha256 of the downloaded file; None if not modified (304)
+    time: float  # time of the response
+
+
+def _download_to_part(url: str, tmp_path: pathlib.Path, headers: typing.Dict[str, str], pbar=None) -> _Download:
+    """download `url` to `tmp_path`, resuming a partial download at `tmp_path` with a Range request if possible"""
+    # validator (ETag or Last-Modified) of the partial download to make sure we resume the same file
+    validator_path = tmp_path.with_suffix(".validator")
+    offset = tmp_path.stat().st_size if tmp_path.exists() else 0
+    headers = dict(headers)
+    if offset and validator_path.exists():
+        headers["Range"] = f"bytes={offset}-"
+        headers["If-Range"] = validator_path.read_text(encoding="utf-8")
+
+    # download with tqdm adapted from:
+    # https://github.com/shaypal5/tqdl/blob/189f7fd07f265d29af796bee28e0893e1396d237/tqdl/core.py
+    # Streaming, so we can iterate over the response.
+    r = http_client.get(url, stream=True, headers=headers)
+    now = time.time()
+    if r.status_code == 304:
+        r.close()
+        return _Download(r, None, now)
+    elif r.status_code == 416 and "Range" in headers:  # partial download is invalid, e.g. already complete
+        r.close()
+        os.remove(tmp_path)
+        return _download_to_part(url, tmp_path, {k: v for k, v in headers.items() if "Range" not in k}, pbar)
+
+    r.raise_for_status()
+    h = hashlib.sha256()
+    content_range = r.headers.get("content-range", "")
+    if r.status_code == 206 and re.match(rf"bytes {offset}-", content_range):
+        with tmp_path.open("rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+
+        mode = "ab"
+    else:  # (re)start download
+        offset = 0
+        mode = "wb"
+        etag = r.headers.get("ETag")
+        validator = etag if etag and not etag.startswith("W/") else r.headers.get("Last-Modified")
+        if validator:
+            validator_path.write_text(validator, encoding="utf-8")
+        elif validator_path.exists():
+            os.remove(validator_path)
+
+    # Total size in bytes.
+    total_size = offset + int(r.headers.get("content-length", 0))
+    block_size = 1024  # 1 Kibibyte
+    desc = url.split("?")[0].rstrip("/").split("/")[-1]
+    if pbar:
+        t = pbar(total=total_size, unit="iB", unit_scale=True, desc=desc)
+    else:
+        t = tqdm(total=total_size, unit="iB", unit_scale=True, desc=desc)
+
+    t.update(offset)
+    downloaded = 0
+    try:
+        with tmp_path.open(mode) as f:
+            for data in r.iter_content(block_size):
+                t.update(len(data))
+                f.write(data)
+                h.update(data)
+                downloaded += len(data)
+    finally:
+        record_cache_stats(bytes_downloaded=downloaded)
+
+    t.close()
+    if total_size != 0 and hasattr(t, "n") and t.n != total_size:
+        # todo: check more carefully and raise on real issue
+        warnings.warn(f"Download ({t.n}) does not have expected size ({total_size}).")
+
+    if validator_path.exists():
+        os.remove(validator_path)
+
+    return _Download(r, h.hexdigest(), now)
+
+
+def _copy_to_output(local_path: pathlib.Path, output: typing.Optional[os.PathLike]) -> pathlib.Path:
+    if output is None or local_path == pathlib.Path(output):
+        return local_path
+
+    pathlib.Path(output).parent.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(local_path, output)
+    return pathlib.Path(output)
+
+
 T = typing.TypeVar("T")
 
 
@@ -495,9 +1205,11 @@ def _resolve_json_from_url(
     expected_type: typing.Union[typing.Type[dict], typing.Type[T]] = dict,
     warning_msg: typing.Optional[str] = "Failed to fetch {url}: {error}",
     encoding: typing.Optional[str] = None,
+    max_age: typing.Optional[float] = None,
+    cache_policy: typing.Optional[CachePolicy] = None,
 ) -> typing.Tuple[typing.Optional[T], typing.Optional[str]]:
     try:
-        p = resolve_source(url)
+        p = _download_url(raw_nodes.URI(uri_string=url), max_age=max_age, cache_policy=cache_policy)
         with p.open(encoding=encoding) as f:
             data = json.load(f)
 
@@ -513,29 +1225,137 @@ def _resolve_json_from_url(
     return data, error
 
 
-BIOIMAGEIO_SITE_CONFIG, BIOIMAGEIO_SITE_CONFIG_ERROR = _resolve_json_from_url(
-    BIOIMAGEIO_SITE_CONFIG_URL, encoding="utf-8", warning_msg=None
-)
-BIOIMAGEIO_COLLECTION, BIOIMAGEIO_COLLECTION_ERROR = _resolve_json_from_url(
-    BIOIMAGEIO_COLLECTION_URL, encoding="utf-8", warning_msg=None
-)
-if BIOIMAGEIO_COLLECTION is None:
-    BIOIMAGEIO_COLLECTION_ENTRIES: typing.Optional[typing.Dict[str, typing.Tuple[str, str]]] = None
-else:
-    BIOIMAGEIO_COLLECTION_ENTRIES = {}
-    for cr in BIOIMAGEIO_COLLECTION.get("collection", []):
-        if "id" in cr and "rdf_source" in cr and "type" in cr:
-            entry = (cr["type"], cr["rdf_source"])
-            BIOIMAGEIO_COLLECTION_ENTRIES[cr["id"]] = entry
-
-            if "nickname" in cr:
-                BIOIMAGEIO_COLLECTION_ENTRIES[cr["nickname"]] = entry
-
-        # add resource versions explicitly
-        for cv in cr.get("versions", []):
-            BIOIMAGEIO_COLLECTION_ENTRIES[f"{cr['id']}/{cv}"] = (
-                cr["type"],
-                cr["rdf_source"].replace(
-                    f"/{cr['versions'][0]}", f"/{cv}"
-                ),  # todo: improve this replace-version-monkeypatch
-            )
+class LazyRemoteJson:
+    """JSON data of a remote url that is only fetched on first access.
+
+    The fetched data is kept for `ttl` seconds (the local cache file is reused within that time as well).
+    A failing refetch keeps previously fetched data, such that an offline process continues to work with what it has.
+    """
+
+    def __init__(self, url: str, *, ttl: float = BIOIMAGEIO_COLLECTION_TTL, encoding: typing.Optional[str] = "utf-8"):
+        self.url = url
+        self.ttl = ttl
+        self.encoding = encoding
+        self.version = 0  # incremented whenever new data is fetched
+        self._data: typing.Optional[dict] = None
+        self._error: typing.Optional[str] = None
+        self._fetched_at: typing.Optional[float] = None
+        self._lock = threading.RLock()
+
+    @property
+    def fetched(self) -> bool:
+        return self._fetched_at is not None
+
+    def get(self) -> typing.Tuple[typing.Optional[dict], typing.Optional[str]]:
+        """get data (or None) and error (or None); fetches data if not fetched yet or older than `ttl`"""
+        with self._lock:
+            if self._fetched_at is None or time.monotonic() - self._fetched_at > self.ttl:
+                self._fetch(max_age=self.ttl)
+
+            return self._data, self._error
+
+    def refresh(self) -> typing.Tuple[typing.Optional[dict], typing.Optional[str]]:
+        """fetch data regardless of its age"""
+        with self._lock:
+            self._fetch(max_age=0)
+            return self._data, self._error
+
+    def _fetch(self, max_age: float):
+        data, error = _resolve_json_from_url(self.url, encoding=self.encoding, warning_msg=None, max_age=max_age)
+        self._fetched_at = time.monotonic()
+        if data is None and self._data is not None:
+            warnings.warn(f"Failed to refresh {self.url}: {error}. Keeping previously fetched data.")
+            return
+
+        self._data = data
+        self._error = error
+        self.version += 1
+
+
+bioimageio_site_config = LazyRemoteJson(BIOIMAGEIO_SITE_CONFIG_URL)
+bioimageio_collection = LazyRemoteJson(BIOIMAGEIO_COLLECTION_URL)
+
+
+class _CollectionIndex(typing.NamedTuple):
+    version: int  # version of `bioimageio_collection` the index is built from
+    entries: typing.Optional[typing.Dict[str, typing.Tuple[str, str]]]
+    ids: typing.Optional[typing.Dict[typing.Optional[str], typing.FrozenSet[str]]]
+
+
+_collection_index = _CollectionIndex(-1, None, None)
+
+
+def _get_collection_index() -> _CollectionIndex:
+    """index of the bioimageio collection; rebuilt only if the collection has been (re)fetched"""
+    global _collection_index
+
+    collection, _ = bioimageio_collection.get()
+    index = _collection_index
+    if index.version == bioimageio_collection.version:
+        return index
+
+    if collection is None:
+        index = _CollectionIndex(bioimageio_collection.version, None, None)
+    else:
+        entries: typing.Dict[str, typing.Tuple[str, str]] = {}
+        for cr in collection.get("collection", []):
+            if "id" in cr and "rdf_source" in cr and "type" in cr:
+                entry = (cr["type"], cr["rdf_source"])
+                entries[cr["id"]] = entry
+
+                if "nickname" in cr:
+                    entries[cr["nickname"]] = entry
+
+            # add resource versions explicitly
+            for cv in cr.get("versions", []):
+                entries[f"{cr['id']}/{cv}"] = (
+                    cr["type"],
+                    cr["rdf_source"].replace(
+                        f"/{cr['versions'][0]}", f"/{cv}"
+                    ),  # todo: improve this replace-version-monkeypatch
+                )
+
+        ids: typing.Dict[typing.Optional[str], typing.Set[str]] = {None: set(entries)}
+        for id_, (type_, _) in entries.items():
+            ids.setdefault(type_, set()).add(id_)
+
+        index = _CollectionIndex(
+            bioimageio_collection.version, entries, {type_: frozenset(type_ids) for type_, type_ids in ids.items()}
+        )
+
+    _collection_index = index
+    return index
+
+
+def get_bioimageio_collection_entries() -> typing.Optional[typing.Dict[str, typing.Tuple[str, str]]]:
+    """map of bioimageio ids and nicknames to resource type and rdf source (None if the collection is unavailable)"""
+    return _get_collection_index().entries
+
+
+def get_bioimageio_ids(resource_type: typing.Optional[str] = None) -> typing.Optional[typing.FrozenSet[str]]:
+    """bioimageio ids and nicknames of the given resource type (of any type if resource_type is None)
+
+    Returns None if the collection is unavailable.
+    The index is shared and only rebuilt if the collection is refetched, e.g. by `bioimageio_collection.refresh()`.
+    """
+    ids = _get_collection_index().ids
+    if ids is None:
+        return None
+
+    return ids.get(resource_type, frozenset())
+
+
+def __getattr__(name: str):
+    # module level access to the lazily fetched site config and collection
+    if name == "BIOIMAGEIO_SITE_CONFIG":
+        return bioimageio_site_config.get()[0]
+    elif name == "BIOIMAGEIO_SITE_CONFIG_ERROR":
+        return bioimageio_site_config.get()[1]
+    elif name == "BIOIMAGEIO_COLLECTION":
+        return bioimageio_collection.get()[0]
+    elif name == "BIOIMAGEIO_COLLECTION_ERROR":
+        return bioimageio_collection.get()[1]
+    elif name == "BIOIMAGEIO_COLLECTION_ENTRIES":
+        return get_bioimageio_collection_entries()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,469 @@
+# Auto-generated by generate_license_index.py from static/licenses.json - do not modify
+
+LICENSE_DATA_VERSION = "3.13"
+
+# license id: (name, is deprecated license id, is FSF free/libre)
+# fmt: off
+LICENSES = {
+    "0BSD": ("BSD Zero Clause License", False, False),
+    "AAL": ("Attribution Assurance License", False, False),
+    "ADSL": ("Amazon Digital Services License", False, False),
+    "AFL-1.1": ("Academic Free License v1.1", False, True),
+    "AFL-1.2": ("Academic Free License v1.2", False, True),
+    "AFL-2.0": ("Academic Free License v2.0", False, True),
+    "AFL-2.1": ("Academic Free License v2.1", False, True),
+    "AFL-3.0": ("Academic Free License v3.0", False, True),
+    "AGPL-1.0": ("Affero General Public License v1.0", True, True),
+    "AGPL-1.0-only": ("Affero General Public License v1.0 only", False, False),
+    "AGPL-1.0-or-later": ("Affero General Public License v1.0 or later", False, False),
+    "AGPL-3.0": ("GNU Affero General Public License v3.0", True, True),
+    "AGPL-3.0-only": ("GNU Affero General Public License v3.0 only", False, True),
+    "AGPL-3.0-or-later": ("GNU Affero General Public License v3.0 or later", False, True),
+    "AMDPLPA": ("AMD's plpa_map.c License", False, False),
+    "AML": ("Apple MIT License", False, False),
+    "AMPAS": ("Academy of Motion Picture Arts and Sciences BSD", False, False),
+    "ANTLR-PD": ("ANTLR Software Rights Notice", False, False),
+    "ANTLR-PD-fallback": ("ANTLR Software Rights Notice with license fallback", False, False),
+    "APAFML": ("Adobe Postscript AFM License", False, False),
+    "APL-1.0": ("Adaptive Public License 1.0", False, False),
+    "APSL-1.0": ("Apple Public Source License 1.0", False, False),
+    "APSL-1.1": ("Apple Public Source License 1.1", False, False),
+    "APSL-1.2": ("Apple Public Source License 1.2", False, False),
+    "APSL-2.0": ("Apple Public Source License 2.0", False, True),
+    "Abstyles": ("Abstyles License", False, False),
+    "Adobe-2006": ("Adobe Systems Incorporated Source Code License Agreement", False, False),
+    "Adobe-Glyph": ("Adobe Glyph List License", False, False),
+    "Afmparse": ("Afmparse License", False, False),
+    "Aladdin": ("Aladdin Free Public License", False, False),
+    "Apache-1.0": ("Apache License 1.0", False, True),
+    "Apache-1.1": ("Apache License 1.1", False, True),
+    "Apache-2.0": ("Apache License 2.0", False, True),
+    "Artistic-1.0": ("Artistic License 1.0", False, False),
+    "Artistic-1.0-Perl": ("Artistic License 1.0 (Perl)", False, False),
+    "Artistic-1.0-cl8": ("Artistic License 1.0 w/clause 8", False, False),
+    "Artistic-2.0": ("Artistic License 2.0", False, True),
+    "BSD-1-Clause": ("BSD 1-Clause License", False, False),
+    "BSD-2-Clause": ("BSD 2-Clause \"Simplified\" License", False, False),
+    "BSD-2-Clause-FreeBSD": ("BSD 2-Clause FreeBSD License", True, True),
+    "BSD-2-Clause-NetBSD": ("BSD 2-Clause NetBSD License", True, False),
+    "BSD-2-Clause-Patent": ("BSD-2-Clause Plus Patent License", False, False),
+    "BSD-2-Clause-Views": ("BSD 2-Clause with views sentence", False, False),
+    "BSD-3-Clause": ("BSD 3-Clause \"New\" or \"Revised\" License", False, True),
+    "BSD-3-Clause-Attribution": ("BSD with attribution", False, False),
+    "BSD-3-Clause-Clear": ("BSD 3-Clause Clear License", False, True),
+    "BSD-3-Clause-LBNL": ("Lawrence Berkeley National Labs BSD variant license", False, False),
+    "BSD-3-Clause-Modification": ("BSD 3-Clause Modification", False, False),
+    "BSD-3-Clause-No-Military-License": ("BSD 3-Clause No Military License", False, False),
+    "BSD-3-Clause-No-Nuclear-License": ("BSD 3-Clause No Nuclear License", False, False),
+    "BSD-3-Clause-No-Nuclear-License-2014": ("BSD 3-Clause No Nuclear License 2014", False, False),
+    "BSD-3-Clause-No-Nuclear-Warranty": ("BSD 3-Clause No Nuclear Warranty", False, False),
+    "BSD-3-Clause-Open-MPI": ("BSD 3-Clause Open MPI variant", False, False),
+    "BSD-4-Clause": ("BSD 4-Clause \"Original\" or \"Old\" License", False, True),
+    "BSD-4-Clause-Shortened": ("BSD 4 Clause Shortened", False, False),
+    "BSD-4-Clause-UC": ("BSD-4-Clause (University of California-Specific)", False, False),
+    "BSD-Protection": ("BSD Protection License", False, False),
+    "BSD-Source-Code": ("BSD Source Code Attribution", False, False),
+    "BSL-1.0": ("Boost Software License 1.0", False, True),
+    "BUSL-1.1": ("Business Source License 1.1", False, False),
+    "Bahyph": ("Bahyph License", False, False),
+    "Barr": ("Barr License", False, False),
+    "Beerware": ("Beerware License", False, False),
+    "BitTorrent-1.0": ("BitTorrent Open Source License v1.0", False, False),
+    "BitTorrent-1.1": ("BitTorrent Open Source License v1.1", False, True),
+    "BlueOak-1.0.0": ("Blue Oak Model License 1.0.0", False, False),
+    "Borceux": ("Borceux license", False, False),
+    "C-UDA-1.0": ("Computational Use of Data Agreement v1.0", False, False),
+    "CAL-1.0": ("Cryptographic Autonomy License 1.0", False, False),
+    "CAL-1.0-Combined-Work-Exception": ("Cryptographic Autonomy License 1.0 (Combined Work Exception)", False, False),
+    "CATOSL-1.1": ("Computer Associates Trusted Open Source License 1.1", False, False),
+    "CC-BY-1.0": ("Creative Commons Attribution 1.0 Generic", False, False),
+    "CC-BY-2.0": ("Creative Commons Attribution 2.0 Generic", False, False),
+    "CC-BY-2.5": ("Creative Commons Attribution 2.5 Generic", False, False),
+    "CC-BY-3.0": ("Creative Commons Attribution 3.0 Unported", False, False),
+    "CC-BY-3.0-AT": ("Creative Commons Attribution 3.0 Austria", False, False),
+    "CC-BY-3.0-US": ("Creative Commons Attribution 3.0 United States", False, False),
+    "CC-BY-4.0": ("Creative Commons Attribution 4.0 International", False, True),
+    "CC-BY-NC-1.0": ("Creative Commons Attribution Non Commercial 1.0 Generic", False, False),
+    "CC-BY-NC-2.0": ("Creative Commons Attribution Non Commercial 2.0 Generic", False, False),
+    "CC-BY-NC-2.5": ("Creative Commons Attribution Non Commercial 2.5 Generic", False, False),
+    "CC-BY-NC-3.0": ("Creative Commons Attribution Non Commercial 3.0 Unported", False, False),
+    "CC-BY-NC-4.0": ("Creative Commons Attribution Non Commercial 4.0 International", False, False),
+    "CC-BY-NC-ND-1.0": ("Creative Commons Attribution Non Commercial No Derivatives 1.0 Generic", False, False),
+    "CC-BY-NC-ND-2.0": ("Creative Commons Attribution Non Commercial No Derivatives 2.0 Generic", False, False),
+    "CC-BY-NC-ND-2.5": ("Creative Commons Attribution Non Commercial No Derivatives 2.5 Generic", False, False),
+    "CC-BY-NC-ND-3.0": ("Creative Commons Attribution Non Commercial No Derivatives 3.0 Unported", False, False),
+    "CC-BY-NC-ND-3.0-IGO": ("Creative Commons Attribution Non Commercial No Derivatives 3.0 IGO", False, False),
+    "CC-BY-NC-ND-4.0": ("Creative Commons Attribution Non Commercial No Derivatives 4.0 International", False, False),
+    "CC-BY-NC-SA-1.0": ("Creative Commons Attribution Non Commercial Share Alike 1.0 Generic", False, False),
+    "CC-BY-NC-SA-2.0": ("Creative Commons Attribution Non Commercial Share Alike 2.0 Generic", False, False),
+    "CC-BY-NC-SA-2.5": ("Creative Commons Attribution Non Commercial Share Alike 2.5 Generic", False, False),
+    "CC-BY-NC-SA-3.0": ("Creative Commons Attribution Non Commercial Share Alike 3.0 Unported", False, False),
+    "CC-BY-NC-SA-4.0": ("Creative Commons Attribution Non Commercial Share Alike 4.0 International", False, False),
+    "CC-BY-ND-1.0": ("Creative Commons Attribution No Derivatives 1.0 Generic", False, False),
+    "CC-BY-ND-2.0": ("Creative Commons Attribution No Derivatives 2.0 Generic", False, False),
+    "CC-BY-ND-2.5": ("Creative Commons Attribution No Derivatives 2.5 Generic", False, False),
+    "CC-BY-ND-3.0": ("Creative Commons Attribution No Derivatives 3.0 Unported", False, False),
+    "CC-BY-ND-4.0": ("Creative Commons Attribution No Derivatives 4.0 International", False, False),
+    "CC-BY-SA-1.0": ("Creative Commons Attribution Share Alike 1.0 Generic", False, False),
+    "CC-BY-SA-2.0": ("Creative Commons Attribution Share Alike 2.0 Generic", False, False),
+    "CC-BY-SA-2.0-UK": ("Creative Commons Attribution Share Alike 2.0 England and Wales", False, False),
+    "CC-BY-SA-2.1-JP": ("Creative Commons Attribution Share Alike 2.1 Japan", False, False),
+    "CC-BY-SA-2.5": ("Creative Commons Attribution Share Alike 2.5 Generic", False, False),
+    "CC-BY-SA-3.0": ("Creative Commons Attribution Share Alike 3.0 Unported", False, False),
+    "CC-BY-SA-3.0-AT": ("Creative Commons Attribution Share Alike 3.0 Austria", False, False),
+    "CC-BY-SA-4.0": ("Creative Commons Attribution Share Alike 4.0 International", False, True),
+    "CC-PDDC": ("Creative Commons Public Domain Dedication and Certification", False, False),
+    "CC0-1.0": ("Creative Commons Zero v1.0 Universal", False, True),
+    "CDDL-1.0": ("Common Development and Distribution License 1.0", False, True),
+    "CDDL-1.1": ("Common Development and Distribution License 1.1", False, False),
+    "CDL-1.0": ("Common Documentation License 1.0", False, False),
+    "CDLA-Permissive-1.0": ("Community Data License Agreement Permissive 1.0", False, False),
+    "CDLA-Sharing-1.0": ("Community Data License Agreement Sharing 1.0", False, False),
+    "CECILL-1.0": ("CeCILL Free Software License Agreement v1.0", False, False),
+    "CECILL-1.1": ("CeCILL Free Software License Agreement v1.1", False, False),
+    "CECILL-2.0": ("CeCILL Free Software License Agreement v2.0", False, True),
+    "CECILL-2.1": ("CeCILL Free Software License Agreement v2.1", False, False),
+    "CECILL-B": ("CeCILL-B Free Software License Agreement", False, True),
+    "CECILL-C": ("CeCILL-C Free Software License Agreement", False, True),
+    "CERN-OHL-1.1": ("CERN Open Hardware Licence v1.1", False, False),
+    "CERN-OHL-1.2": ("CERN Open Hardware Licence v1.2", False, False),
+    "CERN-OHL-P-2.0": ("CERN Open Hardware Licence Version 2 - Permissive", False, False),
+    "CERN-OHL-S-2.0": ("CERN Open Hardware Licence Version 2 - Strongly Reciprocal", False, False),
+    "CERN-OHL-W-2.0": ("CERN Open Hardware Licence Version 2 - Weakly Reciprocal", False, False),
+    "CNRI-Jython": ("CNRI Jython License", False, False),
+    "CNRI-Python": ("CNRI Python License", False, False),
+    "CNRI-Python-GPL-Compatible": ("CNRI Python Open Source GPL Compatible License Agreement", False, False),
+    "CPAL-1.0": ("Common Public Attribution License 1.0", False, True),
+    "CPL-1.0": ("Common Public License 1.0", False, True),
+    "CPOL-1.02": ("Code Project Open License 1.02", False, False),
+    "CUA-OPL-1.0": ("CUA Office Public License v1.0", False, False),
+    "Caldera": ("Caldera License", False, False),
+    "ClArtistic": ("Clarified Artistic License", False, True),
+    "Condor-1.1": ("Condor Public License v1.1", False, True),
+    "Crossword": ("Crossword License", False, False),
+    "CrystalStacker": ("CrystalStacker License", False, False),
+    "Cube": ("Cube License", False, False),
+    "D-FSL-1.0": ("Deutsche Freie Software Lizenz", False, False),
+    "DOC": ("DOC License", False, False),
+    "DRL-1.0": ("Detection Rule License 1.0", False, False),
+    "DSDP": ("DSDP License", False, False),
+    "Dotseqn": ("Dotseqn License", False, False),
+    "ECL-1.0": ("Educational Community License v1.0", False, False),
+    "ECL-2.0": ("Educational Community License v2.0", False, True),
+    "EFL-1.0": ("Eiffel Forum License v1.0", False, False),
+    "EFL-2.0": ("Eiffel Forum License v2.0", False, True),
+    "EPICS": ("EPICS Open License", False, False),
+    "EPL-1.0": ("Eclipse Public License 1.0", False, True),
+    "EPL-2.0": ("Eclipse Public License 2.0", False, True),
+    "EUDatagrid": ("EU DataGrid Software License", False, True),
+    "EUPL-1.0": ("European Union Public License 1.0", False, False),
+    "EUPL-1.1": ("European Union Public License 1.1", False, True),
+    "EUPL-1.2": ("European Union Public License 1.2", False, False),
+    "Entessa": ("Entessa Public License v1.0", False, False),
+    "ErlPL-1.1": ("Erlang Public License v1.1", False, False),
+    "Eurosym": ("Eurosym License", False, False),
+    "FSFAP": ("FSF All Permissive License", False, True),
+    "FSFUL": ("FSF Unlimited License", False, False),
+    "FSFULLR": ("FSF Unlimited License (with License Retention)", False, False),
+    "FTL": ("Freetype Project License", False, True),
+    "Fair": ("Fair License", False, False),
+    "Frameworx-1.0": ("Frameworx Open License 1.0", False, False),
+    "FreeBSD-DOC": ("FreeBSD Documentation License", False, False),
+    "FreeImage": ("FreeImage Public License v1.0", False, False),
+    "GD": ("GD License", False, False),
+    "GFDL-1.1": ("GNU Free Documentation License v1.1", True, True),
+    "GFDL-1.1-invariants-only": ("GNU Free Documentation License v1.1 only - invariants", False, False),
+    "GFDL-1.1-invariants-or-later": ("GNU Free Documentation License v1.1 or later - invariants", False, False),
+    "GFDL-1.1-no-invariants-only": ("GNU Free Documentation License v1.1 only - no invariants", False, False),
+    "GFDL-1.1-no-invariants-or-later": ("GNU Free Documentation License v1.1 or later - no invariants", False, False),
+    "GFDL-1.1-only": ("GNU Free Documentation License v1.1 only", False, True),
+    "GFDL-1.1-or-later": ("GNU Free Documentation License v1.1 or later", False, True),
+    "GFDL-1.2": ("GNU Free Documentation License v1.2", True, True),
+    "GFDL-1.2-invariants-only": ("GNU Free Documentation License v1.2 only - invariants", False, False),
+    "GFDL-1.2-invariants-or-later": ("GNU Free Documentation License v1.2 or later - invariants", False, False),
+    "GFDL-1.2-no-invariants-only": ("GNU Free Documentation License v1.2 only - no invariants", False, False),
+    "GFDL-1.2-no-invariants-or-later": ("GNU Free Documentation License v1.2 or later - no invariants", False, False),
+    "GFDL-1.2-only": ("GNU Free Documentation License v1.2 only", False, True),
+    "GFDL-1.2-or-later": ("GNU Free Documentation License v1.2 or later", False, True),
+    "GFDL-1.3": ("GNU Free Documentation License v1.3", True, True),
+    "GFDL-1.3-invariants-only": ("GNU Free Documentation License v1.3 only - invariants", False, False),
+    "GFDL-1.3-invariants-or-later": ("GNU Free Documentation License v1.3 or later - invariants", False, False),
+    "GFDL-1.3-no-invariants-only": ("GNU Free Documentation License v1.3 only - no invariants", False, False),
+    "GFDL-1.3-no-invariants-or-later": ("GNU Free Documentation License v1.3 or later - no invariants", False, False),
+    "GFDL-1.3-only": ("GNU Free Documentation License v1.3 only", False, True),
+    "GFDL-1.3-or-later": ("GNU Free Documentation License v1.3 or later", False, True),
+    "GL2PS": ("GL2PS License", False, False),
+    "GLWTPL": ("Good Luck With That Public License", False, False),
+    "GPL-1.0": ("GNU General Public License v1.0 only", True, False),
+    "GPL-1.0+": ("GNU General Public License v1.0 or later", True, False),
+    "GPL-1.0-only": ("GNU General Public License v1.0 only", False, False),
+    "GPL-1.0-or-later": ("GNU General Public License v1.0 or later", False, False),
+    "GPL-2.0": ("GNU General Public License v2.0 only", True, True),
+    "GPL-2.0+": ("GNU General Public License v2.0 or later", True, False),
+    "GPL-2.0-only": ("GNU General Public License v2.0 only", False, True),
+    "GPL-2.0-or-later": ("GNU General Public License v2.0 or later", False, True),
+    "GPL-2.0-with-GCC-exception": ("GNU General Public License v2.0 w/GCC Runtime Library exception", True, False),
+    "GPL-2.0-with-autoconf-exception": ("GNU General Public License v2.0 w/Autoconf exception", True, False),
+    "GPL-2.0-with-bison-exception": ("GNU General Public License v2.0 w/Bison exception", True, False),
+    "GPL-2.0-with-classpath-exception": ("GNU General Public License v2.0 w/Classpath exception", True, False),
+    "GPL-2.0-with-font-exception": ("GNU General Public License v2.0 w/Font exception", True, False),
+    "GPL-3.0": ("GNU General Public License v3.0 only", True, True),
+    "GPL-3.0+": ("GNU General Public License v3.0 or later", True, False),
+    "GPL-3.0-only": ("GNU General Public License v3.0 only", False, True),
+    "GPL-3.0-or-later": ("GNU General Public License v3.0 or later", False, True),
+    "GPL-3.0-with-GCC-exception": ("GNU General Public License v3.0 w/GCC Runtime Library exception", True, False),
+    "GPL-3.0-with-autoconf-exception": ("GNU General Public License v3.0 w/Autoconf exception", True, False),
+    "Giftware": ("Giftware License", False, False),
+    "Glide": ("3dfx Glide License", False, False),
+    "Glulxe": ("Glulxe License", False, False),
+    "HPND": ("Historical Permission Notice and Disclaimer", False, True),
+    "HPND-sell-variant": ("Historical Permission Notice and Disclaimer - sell variant", False, False),
+    "HTMLTIDY": ("HTML Tidy License", False, False),
+    "HaskellReport": ("Haskell Language Report License", False, False),
+    "Hippocratic-2.1": ("Hippocratic License 2.1", False, False),
+    "IBM-pibs": ("IBM PowerPC Initialization and Boot Software", False, False),
+    "ICU": ("ICU License", False, False),
+    "IJG": ("Independent JPEG Group License", False, True),
+    "IPA": ("IPA Font License", False, True),
+    "IPL-1.0": ("IBM Public License v1.0", False, True),
+    "ISC": ("ISC License", False, True),
+    "ImageMagick": ("ImageMagick License", False, False),
+    "Imlib2": ("Imlib2 License", False, True),
+    "Info-ZIP": ("Info-ZIP License", False, False),
+    "Intel": ("Intel Open Source License", False, True),
+    "Intel-ACPI": ("Intel ACPI Software License Agreement", False, False),
+    "Interbase-1.0": ("Interbase Public License v1.0", False, False),
+    "JPNIC": ("Japan Network Information Center License", False, False),
+    "JSON": ("JSON License", False, False),
+    "JasPer-2.0": ("JasPer License", False, False),
+    "LAL-1.2": ("Licence Art Libre 1.2", False, False),
+    "LAL-1.3": ("Licence Art Libre 1.3", False, False),
+    "LGPL-2.0": ("GNU Library General Public License v2 only", True, False),
+    "LGPL-2.0+": ("GNU Library General Public License v2 or later", True, False),
+    "LGPL-2.0-only": ("GNU Library General Public License v2 only", False, False),
+    "LGPL-2.0-or-later": ("GNU Library General Public License v2 or later", False, False),
+    "LGPL-2.1": ("GNU Lesser General Public License v2.1 only", True, True),
+    "LGPL-2.1+": ("GNU Library General Public License v2.1 or later", True, False),
+    "LGPL-2.1-only": ("GNU Lesser General Public License v2.1 only", False, True),
+    "LGPL-2.1-or-later": ("GNU Lesser General Public License v2.1 or later", False, True),
+    "LGPL-3.0": ("GNU Lesser General Public License v3.0 only", True, True),
+    "LGPL-3.0+": ("GNU Lesser General Public License v3.0 or later", True, False),
+    "LGPL-3.0-only": ("GNU Lesser General Public License v3.0 only", False, True),
+    "LGPL-3.0-or-later": ("GNU Lesser General Public License v3.0 or later", False, True),
+    "LGPLLR": ("Lesser General Public License For Linguistic Resources", False, False),
+    "LPL-1.0": ("Lucent Public License Version 1.0", False, False),
+    "LPL-1.02": ("Lucent Public License v1.02", False, True),
+    "LPPL-1.0": ("LaTeX Project Public License v1.0", False, False),
+    "LPPL-1.1": ("LaTeX Project Public License v1.1", False, False),
+    "LPPL-1.2": ("LaTeX Project Public License v1.2", False, True),
+    "LPPL-1.3a": ("LaTeX Project Public License v1.3a", False, True),
+    "LPPL-1.3c": ("LaTeX Project Public License v1.3c", False, False),
+    "Latex2e": ("Latex2e License", False, False),
+    "Leptonica": ("Leptonica License", False, False),
+    "LiLiQ-P-1.1": ("Licence Libre du Qu\u00e9bec \u2013 Permissive version 1.1", False, False),
+    "LiLiQ-R-1.1": ("Licence Libre du Qu\u00e9bec \u2013 R\u00e9ciprocit\u00e9 version 1.1", False, False),
+    "LiLiQ-Rplus-1.1": ("Licence Libre du Qu\u00e9bec \u2013 R\u00e9ciprocit\u00e9 forte version 1.1", False, False),
+    "Libpng": ("libpng License", False, False),
+    "Linux-OpenIB": ("Linux Kernel Variant of OpenIB.org license", False, False),
+    "MIT": ("MIT License", False, True),
+    "MIT-0": ("MIT No Attribution", False, False),
+    "MIT-CMU": ("CMU License", False, False),
+    "MIT-Modern-Variant": ("MIT License Modern Variant", False, False),
+    "MIT-advertising": ("Enlightenment License (e16)", False, False),
+    "MIT-enna": ("enna License", False, False),
+    "MIT-feh": ("feh License", False, False),
+    "MIT-open-group": ("MIT Open Group variant", False, False),
+    "MITNFA": ("MIT +no-false-attribs license", False, False),
+    "MPL-1.0": ("Mozilla Public License 1.0", False, False),
+    "MPL-1.1": ("Mozilla Public License 1.1", False, True),
+    "MPL-2.0": ("Mozilla Public License 2.0", False, True),
+    "MPL-2.0-no-copyleft-exception": ("Mozilla Public License 2.0 (no copyleft exception)", False, False),
+    "MS-PL": ("Microsoft Public License", False, True),
+    "MS-RL": ("Microsoft Reciprocal License", False, True),
+    "MTLL": ("Matrix Template Library License", False, False),
+    "MakeIndex": ("MakeIndex License", False, False),
+    "MirOS": ("The MirOS Licence", False, False),
+    "Motosoto": ("Motosoto License", False, False),
+    "MulanPSL-1.0": ("Mulan Permissive Software License, Version 1", False, False),
+    "MulanPSL-2.0": ("Mulan Permissive Software License, Version 2", False, False),
+    "Multics": ("Multics License", False, False),
+    "Mup": ("Mup License", False, False),
+    "NAIST-2003": ("Nara Institute of Science and Technology License (2003)", False, False),
+    "NASA-1.3": ("NASA Open Source Agreement 1.3", False, False),
+    "NBPL-1.0": ("Net Boolean Public License v1", False, False),
+    "NCGL-UK-2.0": ("Non-Commercial Government Licence", False, False),
+    "NCSA": ("University of Illinois/NCSA Open Source License", False, True),
+    "NGPL": ("Nethack General Public License", False, False),
+    "NIST-PD": ("NIST Public Domain Notice", False, False),
+    "NIST-PD-fallback": ("NIST Public Domain Notice with license fallback", False, False),
+    "NLOD-1.0": ("Norwegian Licence for Open Government Data", False, False),
+    "NLPL": ("No Limit Public License", False, False),
+    "NOSL": ("Netizen Open Source License", False, True),
+    "NPL-1.0": ("Netscape Public License v1.0", False, True),
+    "NPL-1.1": ("Netscape Public License v1.1", False, True),
+    "NPOSL-3.0": ("Non-Profit Open Software License 3.0", False, False),
+    "NRL": ("NRL License", False, False),
+    "NTP": ("NTP License", False, False),
+    "NTP-0": ("NTP No Attribution", False, False),
+    "Naumen": ("Naumen Public License", False, False),
+    "Net-SNMP": ("Net-SNMP License", False, False),
+    "NetCDF": ("NetCDF license", False, False),
+    "Newsletr": ("Newsletr License", False, False),
+    "Nokia": ("Nokia Open Source License", False, True),
+    "Noweb": ("Noweb License", False, False),
+    "Nunit": ("Nunit License", True, False),
+    "O-UDA-1.0": ("Open Use of Data Agreement v1.0", False, False),
+    "OCCT-PL": ("Open CASCADE Technology Public License", False, False),
+    "OCLC-2.0": ("OCLC Research Public License 2.0", False, False),
+    "ODC-By-1.0": ("Open Data Commons Attribution License v1.0", False, False),
+    "ODbL-1.0": ("Open Data Commons Open Database License v1.0", False, True),
+    "OFL-1.0": ("SIL Open Font License 1.0", False, False),
+    "OFL-1.0-RFN": ("SIL Open Font License 1.0 with Reserved Font Name", False, False),
+    "OFL-1.0-no-RFN": ("SIL Open Font License 1.0 with no Reserved Font Name", False, False),
+    "OFL-1.1": ("SIL Open Font License 1.1", False, True),
+    "OFL-1.1-RFN": ("SIL Open Font License 1.1 with Reserved Font Name", False, False),
+    "OFL-1.1-no-RFN": ("SIL Open Font License 1.1 with no Reserved Font Name", False, False),
+    "OGC-1.0": ("OGC Software License, Version 1.0", False, False),
+    "OGDL-Taiwan-1.0": ("Taiwan Open Government Data License, version 1.0", False, False),
+    "OGL-Canada-2.0": ("Open Government Licence - Canada", False, False),
+    "OGL-UK-1.0": ("Open Government Licence v1.0", False, False),
+    "OGL-UK-2.0": ("Open Government Licence v2.0", False, False),
+    "OGL-UK-3.0": ("Open Government Licence v3.0", False, False),
+    "OGTSL": ("Open Group Test Suite License", False, False),
+    "OLDAP-1.1": ("Open LDAP Public License v1.1", False, False),
+    "OLDAP-1.2": ("Open LDAP Public License v1.2", False, False),
+    "OLDAP-1.3": ("Open LDAP Public License v1.3", False, False),
+    "OLDAP-1.4": ("Open LDAP Public License v1.4", False, False),
+    "OLDAP-2.0": ("Open LDAP Public License v2.0 (or possibly 2.0A and 2.0B)", False, False),
+    "OLDAP-2.0.1": ("Open LDAP Public License v2.0.1", False, False),
+    "OLDAP-2.1": ("Open LDAP Public License v2.1", False, False),
+    "OLDAP-2.2": ("Open LDAP Public License v2.2", False, False),
+    "OLDAP-2.2.1": ("Open LDAP Public License v2.2.1", False, False),
+    "OLDAP-2.2.2": ("Open LDAP Public License 2.2.2", False, False),
+    "OLDAP-2.3": ("Open LDAP Public License v2.3", False, True),
+    "OLDAP-2.4": ("Open LDAP Public License v2.4", False, False),
+    "OLDAP-2.5": ("Open LDAP Public License v2.5", False, False),
+    "OLDAP-2.6": ("Open LDAP Public License v2.6", False, False),
+    "OLDAP-2.7": ("Open LDAP Public License v2.7", False, True),
+    "OLDAP-2.8": ("Open LDAP Public License v2.8", False, False),
+    "OML": ("Open Market License", False, False),
+    "OPL-1.0": ("Open Public License v1.0", False, False),
+    "OSET-PL-2.1": ("OSET Public License version 2.1", False, False),
+    "OSL-1.0": ("Open Software License 1.0", False, True),
+    "OSL-1.1": ("Open Software License 1.1", False, True),
+    "OSL-2.0": ("Open Software License 2.0", False, True),
+    "OSL-2.1": ("Open Software License 2.1", False, True),
+    "OSL-3.0": ("Open Software License 3.0", False, True),
+    "OpenSSL": ("OpenSSL License", False, True),
+    "PDDL-1.0": ("Open Data Commons Public Domain Dedication & License 1.0", False, False),
+    "PHP-3.0": ("PHP License v3.0", False, False),
+    "PHP-3.01": ("PHP License v3.01", False, True),
+    "PSF-2.0": ("Python Software Foundation License 2.0", False, False),
+    "Parity-6.0.0": ("The Parity Public License 6.0.0", False, False),
+    "Parity-7.0.0": ("The Parity Public License 7.0.0", False, False),
+    "Plexus": ("Plexus Classworlds License", False, False),
+    "PolyForm-Noncommercial-1.0.0": ("PolyForm Noncommercial License 1.0.0", False, False),
+    "PolyForm-Small-Business-1.0.0": ("PolyForm Small Business License 1.0.0", False, False),
+    "PostgreSQL": ("PostgreSQL License", False, False),
+    "Python-2.0": ("Python License 2.0", False, True),
+    "QPL-1.0": ("Q Public License 1.0", False, True),
+    "Qhull": ("Qhull License", False, False),
+    "RHeCos-1.1": ("Red Hat eCos Public License v1.1", False, False),
+    "RPL-1.1": ("Reciprocal Public License 1.1", False, False),
+    "RPL-1.5": ("Reciprocal Public License 1.5", False, False),
+    "RPSL-1.0": ("RealNetworks Public Source License v1.0", False, True),
+    "RSA-MD": ("RSA Message-Digest License", False, False),
+    "RSCPL": ("Ricoh Source Code Public License", False, False),
+    "Rdisc": ("Rdisc License", False, False),
+    "Ruby": ("Ruby License", False, True),
+    "SAX-PD": ("Sax Public Domain Notice", False, False),
+    "SCEA": ("SCEA Shared Source License", False, False),
+    "SGI-B-1.0": ("SGI Free Software License B v1.0", False, False),
+    "SGI-B-1.1": ("SGI Free Software License B v1.1", False, False),
+    "SGI-B-2.0": ("SGI Free Software License B v2.0", False, True),
+    "SHL-0.5": ("Solderpad Hardware License v0.5", False, False),
+    "SHL-0.51": ("Solderpad Hardware License, Version 0.51", False, False),
+    "SISSL": ("Sun Industry Standards Source License v1.1", False, True),
+    "SISSL-1.2": ("Sun Industry Standards Source License v1.2", False, False),
+    "SMLNJ": ("Standard ML of New Jersey License", False, True),
+    "SMPPL": ("Secure Messaging Protocol Public License", False, False),
+    "SNIA": ("SNIA Public License 1.1", False, False),
+    "SPL-1.0": ("Sun Public License v1.0", False, True),
+    "SSH-OpenSSH": ("SSH OpenSSH license", False, False),
+    "SSH-short": ("SSH short notice", False, False),
+    "SSPL-1.0": ("Server Side Public License, v 1", False, False),
+    "SWL": ("Scheme Widget Library (SWL) Software License Agreement", False, False),
+    "Saxpath": ("Saxpath License", False, False),
+    "Sendmail": ("Sendmail License", False, False),
+    "Sendmail-8.23": ("Sendmail License 8.23", False, False),
+    "SimPL-2.0": ("Simple Public License 2.0", False, False),
+    "Sleepycat": ("Sleepycat License", False, True),
+    "Spencer-86": ("Spencer License 86", False, False),
+    "Spencer-94": ("Spencer License 94", False, False),
+    "Spencer-99": ("Spencer License 99", False, False),
+    "StandardML-NJ": ("Standard ML of New Jersey License", True, False),
+    "SugarCRM-1.1.3": ("SugarCRM Public License v1.1.3", False, False),
+    "TAPR-OHL-1.0": ("TAPR Open Hardware License v1.0", False, False),
+    "TCL": ("TCL/TK License", False, False),
+    "TCP-wrappers": ("TCP Wrappers License", False, False),
+    "TMate": ("TMate Open Source License", False, False),
+    "TORQUE-1.1": ("TORQUE v2.5+ Software License v1.1", False, False),
+    "TOSL": ("Trusster Open Source License", False, False),
+    "TU-Berlin-1.0": ("Technische Universitaet Berlin License 1.0", False, False),
+    "TU-Berlin-2.0": ("Technische Universitaet Berlin License 2.0", False, False),
+    "UCL-1.0": ("Upstream Compatibility License v1.0", False, False),
+    "UPL-1.0": ("Universal Permissive License v1.0", False, True),
+    "Unicode-DFS-2015": ("Unicode License Agreement - Data Files and Software (2015)", False, False),
+    "Unicode-DFS-2016": ("Unicode License Agreement - Data Files and Software (2016)", False, False),
+    "Unicode-TOU": ("Unicode Terms of Use", False, False),
+    "Unlicense": ("The Unlicense", False, True),
+    "VOSTROM": ("VOSTROM Public License for Open Source", False, False),
+    "VSL-1.0": ("Vovida Software License v1.0", False, False),
+    "Vim": ("Vim License", False, True),
+    "W3C": ("W3C Software Notice and License (2002-12-31)", False, True),
+    "W3C-19980720": ("W3C Software Notice and License (1998-07-20)", False, False),
+    "W3C-20150513": ("W3C Software Notice and Document License (2015-05-13)", False, False),
+    "WTFPL": ("Do What The F*ck You Want To Public License", False, True),
+    "Watcom-1.0": ("Sybase Open Watcom Public License 1.0", False, False),
+    "Wsuipa": ("Wsuipa License", False, False),
+    "X11": ("X11 License", False, True),
+    "XFree86-1.1": ("XFree86 License 1.1", False, True),
+    "XSkat": ("XSkat License", False, False),
+    "Xerox": ("Xerox License", False, False),
+    "Xnet": ("X.Net License", False, False),
+    "YPL-1.0": ("Yahoo! Public License v1.0", False, False),
+    "YPL-1.1": ("Yahoo! Public License v1.1", False, True),
+    "ZPL-1.1": ("Zope Public License 1.1", False, False),
+    "ZPL-2.0": ("Zope Public License 2.0", False, True),
+    "ZPL-2.1": ("Zope Public License 2.1", False, True),
+    "Zed": ("Zed License", False, False),
+    "Zend-2.0": ("Zend License v2.0", False, True),
+    "Zimbra-1.3": ("Zimbra Public License v1.3", False, True),
+    "Zimbra-1.4": ("Zimbra Public License v1.4", False, False),
+    "Zlib": ("zlib License", False, True),
+    "blessing": ("SQLite Blessing", False, False),
+    "bzip2-1.0.5": ("bzip2 and libbzip2 License v1.0.5", False, False),
+    "bzip2-1.0.6": ("bzip2 and libbzip2 License v1.0.6", False, False),
+    "copyleft-next-0.3.0": ("copyleft-next 0.3.0", False, False),
+    "copyleft-next-0.3.1": ("copyleft-next 0.3.1", False, False),
+    "curl": ("curl License", False, False),
+    "diffmark": ("diffmark license", False, False),
+    "dvipdfm": ("dvipdfm License", False, False),
+    "eCos-2.0": ("eCos license version 2.0", True, False),
+    "eGenix": ("eGenix.com Public License 1.1.0", False, False),
+    "etalab-2.0": ("Etalab Open License 2.0", False, False),
+    "gSOAP-1.3b": ("gSOAP Public License v1.3b", False, False),
+    "gnuplot": ("gnuplot License", False, True),
+    "iMatix": ("iMatix Standard Function Library Agreement", False, True),
+    "libpng-2.0": ("PNG Reference Library version 2", False, False),
+    "libselinux-1.0": ("libselinux public domain notice", False, False),
+    "libtiff": ("libtiff License", False, False),
+    "mpich2": ("mpich2 License", False, False),
+    "psfrag": ("psfrag License", False, False),
+    "psutils": ("psutils License", False, False),
+    "wxWindows": ("wxWindows Library License", True, False),
+    "xinetd": ("xinetd License", False, True),
+    "xpp": ("XPP License", False, False),
+    "zlib-acknowledgement": ("zlib/libpng License with Acknowledgement", False, False),
+}
+# fmt: on
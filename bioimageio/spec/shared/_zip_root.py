@@ -0,0 +1,325 @@
+"""zip-backed root of packaged resources
+
+A resource description loaded from a package (zip file) gets the directory its members are extracted (materialized) to
+as `root_path`. That directory is registered with a `ZipRoot` of the package (see `get_zip_root`): members are read in
+place from the zip file (`ZipRoot.open`), and a member is only extracted when a file system path is needed, e.g. by
+`resolve_source` or `materialize`.
+Packages are extracted to BIOIMAGEIO_CACHE_PATH/extracted_packages/<package fingerprint>, whether loaded or extracted
+with `extract_resource_package`. An extraction marker in that directory records the package and its extracted
+members, such that other processes sharing the cache find and complete the same extraction.
+"""
+import collections
+import functools
+import hashlib
+import json
+import os
+import pathlib
+import shutil
+import threading
+import time
+import typing
+import uuid
+import zipfile
+from tempfile import TemporaryDirectory
+
+from ._cache import cache_manager, compute_sha256, record_cache_stats
+from .common import BIOIMAGEIO_USE_CACHE, no_cache_tmp_list
+
+# recently used zip roots by the (resolved) directory their members are materialized to
+_zip_roots: "typing.OrderedDict[pathlib.Path, ZipRoot]" = collections.OrderedDict()
+_zip_roots_lock = threading.Lock()
+ZIP_ROOTS_MAX = 128
+# directories outside the cache that zip roots of this process materialize members to (see `get_zip_root`)
+_local_zip_root_paths: typing.Set[pathlib.Path] = set()
+
+# marks an extraction directory; records the package, all its members and the extracted members
+EXTRACTION_COMPLETE_MARKER = ".bioimageio_extracted"
+
+# package fingerprints by (path, size, mtime, full_hash) of the package
+_fingerprints: typing.Dict[typing.Tuple[str, int, int, bool], str] = {}
+
+
+def get_package_fingerprint(zip_path: os.PathLike, *, full_hash: bool = False) -> str:
+    """content fingerprint of a package (zip file) to key its extraction by
+
+    By default the fingerprint is a hash of the package size and its central directory (name, CRC-32, sizes and offset
+    of every member), which only requires reading the central directory. Copies of a package share a fingerprint and a
+    package replaced at the same path gets a new one.
+    The fingerprint of a file is remembered for its size and modification time.
+
+    Args:
+        zip_path: package
+        full_hash: use the sha256 of the whole package instead
+    """
+    path = pathlib.Path(zip_path).resolve()
+    stat = path.stat()
+    memo_key = (str(path), stat.st_size, stat.st_mtime_ns, full_hash)
+    fingerprint = _fingerprints.get(memo_key)
+    if fingerprint is None:
+        if full_hash:
+            fingerprint = compute_sha256(path)
+        else:
+            h = hashlib.sha256(str(stat.st_size).encode("utf-8"))
+            with zipfile.ZipFile(path) as zf:
+                for info in zf.infolist():
+                    h.update(
+                        f"{info.filename}\0{info.CRC}\0{info.compress_size}\0{info.file_size}\0"
+                        f"{info.header_offset}\n".encode("utf-8")
+                    )
+
+            fingerprint = h.hexdigest()
+
+        _fingerprints[memo_key] = fingerprint
+
+    return fingerprint
+
+
+def extract_members(zip_path: os.PathLike, names: typing.Iterable[str], target: os.PathLike) -> None:
+    """extract the members `names` of package `zip_path` to directory `target`, each published by an atomic rename"""
+    target = pathlib.Path(target)
+    with zipfile.ZipFile(zip_path) as zf:
+        for name in names:
+            parts = pathlib.PurePosixPath(name).parts
+            if ".." in parts or name.startswith("/"):
+                raise ValueError(f"Refusing to extract {name} from {zip_path} outside of {target}")
+
+            # extract next to the member's path and publish by an atomic rename
+            member_path = target.joinpath(*parts)
+            member_path.parent.mkdir(parents=True, exist_ok=True)
+            partial = member_path.with_name(f".{member_path.name}.{uuid.uuid4().hex}")
+            try:
+                with zf.open(name) as src, partial.open("wb") as dst:
+                    shutil.copyfileobj(src, dst, 1 << 20)
+
+                os.replace(partial, member_path)
+            finally:
+                if partial.exists():
+                    os.remove(partial)
+
+
+def read_extraction_marker(path: os.PathLike) -> typing.Optional[typing.Dict[str, typing.Any]]:
+    """package ('package'), all its members ('members') and the extracted members ('extracted') of the extraction at
+    `path`; None if `path` is no (complete) extraction"""
+    try:
+        marker = json.loads((pathlib.Path(path) / EXTRACTION_COMPLETE_MARKER).read_text(encoding="utf-8"))
+        return {
+            "package": str(marker["package"]),
+            "members": set(marker["members"]),
+            "extracted": set(marker["extracted"]),
+        }
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _write_extraction_marker(
+    path: pathlib.Path, package: pathlib.Path, members: typing.AbstractSet[str], extracted: typing.AbstractSet[str]
+):
+    partial = path / f"{EXTRACTION_COMPLETE_MARKER}.{uuid.uuid4().hex}"
+    partial.write_text(
+        json.dumps({"package": str(package), "members": sorted(members), "extracted": sorted(extracted)}),
+        encoding="utf-8",
+    )
+    os.replace(partial, path / EXTRACTION_COMPLETE_MARKER)
+
+
+class ZipRoot:
+    """root of a packaged resource whose members are read in place and only extracted on demand
+
+    Args:
+        zip_path: package (zip file)
+        path: directory to materialize members to; defaults to BIOIMAGEIO_CACHE_PATH/extracted_packages/<fingerprint>
+              (see `get_package_fingerprint`)
+        full_hash: fingerprint the package by its full sha256
+        origin: origin of the package to record for the cache entry; defaults to `zip_path`
+    """
+
+    def __init__(
+        self,
+        zip_path: os.PathLike,
+        path: typing.Optional[os.PathLike] = None,
+        *,
+        full_hash: bool = False,
+        origin: typing.Optional[str] = None,
+    ):
+        self.zip_path = pathlib.Path(zip_path).resolve()
+        if path is None:
+            if BIOIMAGEIO_USE_CACHE:
+                key = get_package_fingerprint(self.zip_path, full_hash=full_hash)
+                path = cache_manager.path / "extracted_packages" / key
+            else:
+                tmp_dir = TemporaryDirectory()
+                no_cache_tmp_list.append(tmp_dir)
+                path = tmp_dir.name
+
+        self.path = pathlib.Path(path).resolve()
+        self.origin = origin or self.zip_path.as_uri()
+        with zipfile.ZipFile(self.zip_path) as zf:
+            self.members = frozenset(info.filename for info in zf.infolist() if not info.is_dir())
+
+        self._thread_lock = threading.Lock()
+        with _zip_roots_lock:
+            _zip_roots[self.path] = self
+            _zip_roots.move_to_end(self.path)
+            while len(_zip_roots) > ZIP_ROOTS_MAX:
+                _zip_roots.popitem(last=False)
+
+            if self.path.parent != _get_extracted_packages_path():
+                _local_zip_root_paths.add(self.path)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, ZipRoot) and (self.zip_path, self.path) == (other.zip_path, other.path)
+
+    def __hash__(self) -> int:
+        return hash((self.zip_path, self.path))
+
+    def __reduce__(self):
+        return functools.partial(ZipRoot, origin=self.origin), (self.zip_path, self.path)
+
+    def __repr__(self) -> str:
+        return f"ZipRoot({str(self.zip_path)!r}, {str(self.path)!r})"
+
+    @property
+    def in_cache(self) -> bool:
+        """if members are extracted to a cache entry"""
+        return cache_manager.path in self.path.parents
+
+    def open(self, member: str) -> typing.IO[bytes]:
+        """open `member` for reading in place"""
+        self._check_member(member)
+        with zipfile.ZipFile(self.zip_path) as zf:
+            return zf.open(member)  # the opened member keeps the zip file open
+
+    def read_bytes(self, member: str) -> bytes:
+        self._check_member(member)
+        with zipfile.ZipFile(self.zip_path) as zf:
+            return zf.read(member)
+
+    def read_text(self, member: str, encoding: str = "utf-8") -> str:
+        return self.read_bytes(member).decode(encoding)
+
+    def _check_member(self, member: str):
+        if member not in self.members:
+            raise FileNotFoundError(f"{member} not found in {self.zip_path}")
+
+    def get_member_names(self, member: str) -> typing.List[str]:
+        """names of the members at `member`: the member itself or the members of a directory `member`"""
+        member = member.strip("/")
+        if member in self.members:
+            return [member]
+
+        return sorted(m for m in self.members if m.startswith(f"{member}/") or not member)
+
+    def materialize(self, member: str = "") -> pathlib.Path:
+        """extract `member` (a file or directory; all members by default) unless already extracted
+
+        Returns:
+            local path of `member`
+        """
+        names = self.get_member_names(member)
+        if not names:
+            raise FileNotFoundError(f"{member} not found in {self.zip_path}")
+
+        self.extract(names)
+        return self.path / member.strip("/") if member.strip("/") else self.path
+
+    def _get_lock(self) -> typing.ContextManager:
+        if self.in_cache:
+            return cache_manager.lock(self.path.relative_to(cache_manager.path).as_posix())
+        else:
+            return self._thread_lock
+
+    def extract(self, names: typing.Iterable[str]) -> None:
+        """extract the members `names` unless already extracted (as recorded by the extraction marker)"""
+        names = sorted(names)
+        marker = read_extraction_marker(self.path)
+        if marker is not None and marker["extracted"].issuperset(names):
+            return
+
+        # only one requester (thread or process) extracts to the same directory at a time
+        with self._get_lock():
+            marker = read_extraction_marker(self.path)
+            extracted = set() if marker is None else marker["extracted"]
+            missing = [name for name in names if name not in extracted]
+            if not missing:
+                return
+
+            start = time.perf_counter()
+            self.path.mkdir(parents=True, exist_ok=True)
+            extract_members(self.zip_path, missing, self.path)
+            record_cache_stats(extraction_time=time.perf_counter() - start)
+            _write_extraction_marker(self.path, self.zip_path, self.members, extracted.union(missing))
+            if self.in_cache:
+                cache_manager.track(self.path, origin_url=self.origin)
+
+
+def _get_extracted_packages_path() -> pathlib.Path:
+    return pathlib.Path(os.path.realpath(cache_manager.path / "extracted_packages"))
+
+
+def get_zip_root(path: os.PathLike) -> typing.Optional[ZipRoot]:
+    """zip root of directory `path`, e.g. the `root_path` of a resource loaded from a package
+
+    Recently used zip roots are kept in-process. Other zip roots are recovered from the extraction marker of `path`,
+    which is only trusted for extractions in the cache (BIOIMAGEIO_CACHE_PATH/extracted_packages/<fingerprint>, e.g. of
+    another process) and directories that zip roots of this process materialize members to.
+    """
+    path = pathlib.Path(os.path.abspath(path))
+    with _zip_roots_lock:
+        root = _zip_roots.get(path)
+        if root is not None:
+            _zip_roots.move_to_end(path)
+            return root
+
+        trusted = path in _local_zip_root_paths
+
+    if trusted or path.parent == _get_extracted_packages_path():
+        marker = read_extraction_marker(path)
+        if marker is not None and os.path.exists(marker["package"]):
+            return ZipRoot(marker["package"], path)
+
+    return None
+
+
+def find_zip_member(path: os.PathLike) -> typing.Optional[typing.Tuple[ZipRoot, str]]:
+    """zip root and member name of `path` if `path` is (a directory of) a member of a zip root"""
+    path = pathlib.Path(os.path.abspath(path))
+    extracted_packages = _get_extracted_packages_path()
+    with _zip_roots_lock:
+        candidates = [p for p in path.parents if p in _zip_roots or p in _local_zip_root_paths]
+
+    if extracted_packages in path.parents:
+        extraction = extracted_packages / path.relative_to(extracted_packages).parts[0]
+        if extraction != path and extraction not in candidates:
+            candidates.append(extraction)
+
+    for parent in candidates:
+        root = get_zip_root(parent)
+        if root is not None:
+            member = path.relative_to(parent).as_posix()
+            return (root, member) if root.get_member_names(member) else None
+
+    return None
+
+
+def member_exists(path: os.PathLike) -> bool:
+    """if `path` exists, either on disk or as (a member of) a zip root"""
+    return os.path.exists(path) or get_zip_root(path) is not None or find_zip_member(path) is not None
+
+
+def materialize(path: os.PathLike) -> bool:
+    """make sure `path` exists on disk, extracting it if it is a member of a zip root; returns if `path` exists"""
+    if os.path.exists(path):
+        return True
+
+    zip_root = get_zip_root(path)
+    if zip_root is not None:
+        zip_root.path.mkdir(parents=True, exist_ok=True)
+        return True
+
+    found = find_zip_member(path)
+    if found is None:
+        return False
+
+    root, member = found
+    root.materialize(member)
+    return True
@@ -0,0 +1,179 @@
+"""minimal zip file writer for members compressed outside of it
+
+`zipfile.ZipFile` compresses members itself, one at a time. `ZipWriter` instead appends data that is already compressed
+(see `compress_chunks`), such that members can be compressed concurrently and written to the zip file in a fixed
+order. Members are written with a data descriptor following their data, such that their size and CRC need not be known
+when writing starts, and the zip file is written sequentially (to any binary file object).
+"""
+import struct
+import typing
+import zipfile
+import zlib
+from hashlib import sha256
+
+# zip file format records (see https://pkware.cachefly.net/webdocs/casestudies/APPNOTE.TXT)
+_DATA_DESCRIPTOR = struct.Struct("<4sLLL")
+_DATA_DESCRIPTOR64 = struct.Struct("<4sLQQ")
+_CENTRAL_DIRECTORY_HEADER = struct.Struct("<4s4B4HL2L5H2L")
+_END_OF_CENTRAL_DIRECTORY = struct.Struct("<4s4H2LH")
+_END_OF_CENTRAL_DIRECTORY64 = struct.Struct("<4sQ2H2L4Q")
+_END_OF_CENTRAL_DIRECTORY64_LOCATOR = struct.Struct("<4sLQL")
+
+_USE_DATA_DESCRIPTOR = 0x08
+_UTF8_FILENAME = 0x800
+_ZIP64_VERSION = 45
+
+SUPPORTED_COMPRESSION = (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED)
+
+
+def compress_chunks(
+    chunks: typing.Iterable[bytes], zinfo: zipfile.ZipInfo, write: typing.Callable[[bytes], typing.Any]
+) -> str:
+    """compress `chunks` as member `zinfo` and pass the compressed data to `write`
+
+    Sets CRC, file_size and compress_size of `zinfo`. Deflated data is identical to that of `zipfile.ZipFile`.
+
+    Returns:
+        sha256 of the (uncompressed) member data
+    """
+    if zinfo.compress_type == zipfile.ZIP_DEFLATED:
+        compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    elif zinfo.compress_type == zipfile.ZIP_STORED:
+        compressor = None
+    else:
+        raise NotImplementedError(f"compression method {zinfo.compress_type} (supported: {SUPPORTED_COMPRESSION})")
+
+    crc = 0
+    file_size = 0
+    compress_size = 0
+    h = sha256()
+    for chunk in chunks:
+        crc = zlib.crc32(chunk, crc)
+        file_size += len(chunk)
+        h.update(chunk)
+        data = chunk if compressor is None else compressor.compress(chunk)
+        if data:
+            write(data)
+            compress_size += len(data)
+
+    if compressor is not None:
+        data = compressor.flush()
+        write(data)
+        compress_size += len(data)
+
+    zinfo.CRC = crc
+    zinfo.file_size = file_size
+    zinfo.compress_size = compress_size
+    return h.hexdigest()
+
+
+class ZipWriter:
+    """write a zip file member by member: `start_member`, `write` (compressed data), `end_member`, ..., `close`"""
+
+    def __init__(self, fp: typing.IO[bytes]):
+        self.fp = fp
+        self.members: typing.List[zipfile.ZipInfo] = []
+        self.offset = 0  # position relative to the start of the zip file
+        self._zip64 = False  # zip64 local header of the current member
+
+    def write(self, data: bytes):
+        self.fp.write(data)
+        self.offset += len(data)
+
+    def start_member(self, zinfo: zipfile.ZipInfo, *, zip64: bool = False):
+        """write the local header of `zinfo`; use `zip64` if its (compressed) size may reach `zipfile.ZIP64_LIMIT`"""
+        zinfo.flag_bits |= _USE_DATA_DESCRIPTOR
+        zinfo.header_offset = self.offset
+        self.write(zinfo.FileHeader(zip64=zip64))
+        self._zip64 = zip64
+
+    def end_member(self, zinfo: zipfile.ZipInfo):
+        """write the data descriptor of `zinfo` (with CRC and sizes set, e.g. by `compress_chunks`)"""
+        if self._zip64 or zinfo.file_size > zipfile.ZIP64_LIMIT or zinfo.compress_size > zipfile.ZIP64_LIMIT:
+            descriptor = _DATA_DESCRIPTOR64
+        else:
+            descriptor = _DATA_DESCRIPTOR
+
+        self.write(descriptor.pack(b"PK\x07\x08", zinfo.CRC, zinfo.compress_size, zinfo.file_size))
+        self.members.append(zinfo)
+
+    def close(self):
+        """write the central directory"""
+        start = self.offset
+        for zinfo in self.members:
+            self._write_central_directory_header(zinfo)
+
+        count = len(self.members)
+        size = self.offset - start
+        if count > zipfile.ZIP_FILECOUNT_LIMIT or start > zipfile.ZIP64_LIMIT or size > zipfile.ZIP64_LIMIT:
+            end = self.offset
+            self.write(
+                _END_OF_CENTRAL_DIRECTORY64.pack(
+                    b"PK\x06\x06", 44, _ZIP64_VERSION, _ZIP64_VERSION, 0, 0, count, count, size, start
+                )
+            )
+            self.write(_END_OF_CENTRAL_DIRECTORY64_LOCATOR.pack(b"PK\x06\x07", 0, end, 1))
+            count = min(count, 0xFFFF)
+            size = min(size, 0xFFFFFFFF)
+            start = min(start, 0xFFFFFFFF)
+
+        self.write(_END_OF_CENTRAL_DIRECTORY.pack(b"PK\x05\x06", 0, 0, count, count, size, start, 0))
+        self.fp.flush()
+
+    def _write_central_directory_header(self, zinfo: zipfile.ZipInfo):
+        zip64_fields = []
+        file_size = zinfo.file_size
+        compress_size = zinfo.compress_size
+        header_offset = zinfo.header_offset
+        if file_size > zipfile.ZIP64_LIMIT or compress_size > zipfile.ZIP64_LIMIT:
+            zip64_fields += [file_size, compress_size]
+            file_size = compress_size = 0xFFFFFFFF
+
+        if header_offset > zipfile.ZIP64_LIMIT:
+            zip64_fields.append(header_offset)
+            header_offset = 0xFFFFFFFF
+
+        extra = zinfo.extra
+        extract_version = zinfo.extract_version
+        create_version = zinfo.create_version
+        if zip64_fields:
+            extra = struct.pack(f"<HH{len(zip64_fields)}Q", 1, 8 * len(zip64_fields), *zip64_fields) + extra
+            extract_version = max(extract_version, _ZIP64_VERSION)
+            create_version = max(create_version, _ZIP64_VERSION)
+
+        try:
+            filename = zinfo.filename.encode("ascii")
+            flag_bits = zinfo.flag_bits
+        except UnicodeEncodeError:
+            filename = zinfo.filename.encode("utf-8")
+            flag_bits = zinfo.flag_bits | _UTF8_FILENAME
+
+        dt = zinfo.date_time
+        dosdate = (dt[0] - 1980) << 9 | dt[1] << 5 | dt[2]
+        dostime = dt[3] << 11 | dt[4] << 5 | (dt[5] // 2)
+        self.write(
+            _CENTRAL_DIRECTORY_HEADER.pack(
+                b"PK\x01\x02",
+                create_version,
+                zinfo.create_system,
+                extract_version,
+                zinfo.reserved,
+                flag_bits,
+                zinfo.compress_type,
+                dostime,
+                dosdate,
+                zinfo.CRC,
+                compress_size,
+                file_size,
+                len(filename),
+                len(extra),
+                len(zinfo.comment),
+                0,
+                zinfo.internal_attr,
+                zinfo.external_attr,
+                header_offset,
+            )
+        )
+        self.write(filename)
+        self.write(extra)
+        self.write(zinfo.comment)
@@ -1,7 +1,9 @@
 import getpass
+import importlib
 import os
 import pathlib
 import tempfile
+import threading
 import warnings
 from typing import Any, Dict, Generic, Iterable, List, Optional, Sequence, Union
 
@@ -19,17 +21,28 @@ else:
 
     class MyYAML(YAML):
         """add convenient improvements over YAML
+        thread-safe load and dump
         improve dump:
             - make sure to dump with utf-8 encoding. on windows encoding 'windows-1252' may otherwise be used
             - expose indentation kwargs for dump
         """
 
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self._lock = threading.RLock()
+
+        def load(self, stream):
+            # YAML instances are not thread-safe
+            with self._lock:
+                return super().load(stream)
+
         def dump(self, data, stream=None, *, transform=None):
-            if isinstance(stream, pathlib.Path):
-                with stream.open("wt", encoding="utf-8") as f:
-                    return super().dump(data, f, transform=transform)
-            else:
-                return super().dump(data, stream, transform=transform)
+            with self._lock:
+                if isinstance(stream, pathlib.Path):
+                    with stream.open("wt", encoding="utf-8") as f:
+                        return super().dump(data, f, transform=transform)
+                else:
+                    return super().dump(data, stream, transform=transform)
 
     yaml = MyYAML(typ="safe")
 
@@ -64,6 +77,33 @@ BIOIMAGEIO_CACHE_PATH = pathlib.Path(
 )
 BIOIMAGEIO_USE_CACHE = os.getenv("BIOIMAGEIO_USE_CACHE", "true").lower() in ("true", "yes", "1")
 BIOIMAGEIO_CACHE_WARNINGS_LIMIT = int(os.getenv("BIOIMAGEIO_CACHE_WARNINGS_LIMIT", 3))
+# byte budget of BIOIMAGEIO_CACHE_PATH enforced by evicting least recently used entries (0 for no limit)
+BIOIMAGEIO_CACHE_MAX_SIZE = int(float(os.getenv("BIOIMAGEIO_CACHE_MAX_SIZE", 0)))
+# number of retries of a failed download (resuming the partial download) and delay before the first retry in seconds
+BIOIMAGEIO_DOWNLOAD_RETRIES = int(os.getenv("BIOIMAGEIO_DOWNLOAD_RETRIES", 3))
+BIOIMAGEIO_DOWNLOAD_BACKOFF = float(os.getenv("BIOIMAGEIO_DOWNLOAD_BACKOFF", 1))
+# timeout (in seconds) of HTTP requests (0 for no timeout) and maximum number of open connections per host
+BIOIMAGEIO_HTTP_TIMEOUT = float(os.getenv("BIOIMAGEIO_HTTP_TIMEOUT", 30)) or None
+BIOIMAGEIO_HTTP_MAX_CONNECTIONS_PER_HOST = int(os.getenv("BIOIMAGEIO_HTTP_MAX_CONNECTIONS_PER_HOST", 10))
+# time (in seconds) results of availability checks of remote sources are reused
+BIOIMAGEIO_AVAILABILITY_TTL = float(os.getenv("BIOIMAGEIO_AVAILABILITY_TTL", 300))
+# offline mode: remote sources are only served from the cache or a read-only mirror tree (<mirror>/<host>/<path>)
+BIOIMAGEIO_OFFLINE = os.getenv("BIOIMAGEIO_OFFLINE", "false").lower() in ("true", "yes", "1")
+BIOIMAGEIO_MIRROR_PATH = (
+    pathlib.Path(os.environ["BIOIMAGEIO_MIRROR_PATH"]) if "BIOIMAGEIO_MIRROR_PATH" in os.environ else None
+)
+# time to live (in seconds) of remembered DOI resolutions and Zenodo record file listings
+BIOIMAGEIO_DOI_TTL = float(os.getenv("BIOIMAGEIO_DOI_TTL", 7 * 24 * 3600))
+BIOIMAGEIO_ZENODO_TTL = float(os.getenv("BIOIMAGEIO_ZENODO_TTL", 24 * 3600))
+# time (in seconds) a failing url (or unreachable host) is not requested again; doubled with every consecutive
+# failure up to BIOIMAGEIO_FAILURE_MAX_TTL (0 disables the negative cache)
+BIOIMAGEIO_FAILURE_TTL = float(os.getenv("BIOIMAGEIO_FAILURE_TTL", 60))
+BIOIMAGEIO_FAILURE_MAX_TTL = float(os.getenv("BIOIMAGEIO_FAILURE_MAX_TTL", 24 * 3600))
+# freshness lifetime (in seconds) of downloads whose response does not declare one (Cache-Control max-age, Expires);
+# upper limit of the heuristic lifetime derived from their Last-Modified date
+BIOIMAGEIO_CACHE_DEFAULT_TTL = float(os.getenv("BIOIMAGEIO_CACHE_DEFAULT_TTL", 3600))
+# time to live (in seconds) of the lazily fetched bioimage.io site config and collection
+BIOIMAGEIO_COLLECTION_TTL = float(os.getenv("BIOIMAGEIO_COLLECTION_TTL", 3600))
 
 # keep a reference to temporary directories and files.
 # These temporary locations are used instead of paths in BIOIMAGEIO_CACHE_PATH if BIOIMAGEIO_USE_CACHE is true,
@@ -76,6 +116,7 @@ BIOIMAGEIO_COLLECTION_URL = "https://bioimage-io.github.io/collection-bioimage-i
 
 
 DOI_REGEX = r"^10[.][0-9]{4,9}\/[-._;()\/:A-Za-z0-9]+$"
+BIOIMAGEIO_ID_OR_NICKNAME_REGEX = r"^[\w.\-/]+$"  # e.g. 'impartial-shrimp' or '10.5281/zenodo.5764892/6647674'
 RDF_NAMES = ("rdf.yaml", "model.yaml")
 
 
@@ -132,7 +173,11 @@ class ValidationWarning(UserWarning):
         return summary
 
 
-class ValidationSummary(TypedDict):
+class _OptionalValidationSummary(TypedDict, total=False):
+    cache_stats: Dict[str, float]  # only with `validate(..., cache_stats=True)`; see `CacheStats`
+
+
+class ValidationSummary(_OptionalValidationSummary):
     bioimageio_spec_version: str
     error: Union[None, str, Dict[str, Any]]
     name: str
@@ -145,15 +190,32 @@ class ValidationSummary(TypedDict):
     warnings: dict
 
 
+def lazy_submodule_getattr(module_name: str):
+    """create a module level `__getattr__` (PEP 562) that imports submodules of `module_name` on first access"""
+
+    def __getattr__(name: str):
+        submodule_name = f"{module_name}.{name}"
+        try:
+            return importlib.import_module(submodule_name)
+        except ModuleNotFoundError as e:
+            if e.name != submodule_name:
+                raise  # an existing submodule failed to import
+
+        raise AttributeError(f"module {module_name!r} has no attribute {name!r}")
+
+    return __getattr__
+
+
 def get_format_version_module(type_: str, format_version: str):
     assert "." in format_version
-    import bioimageio.spec
-
     type_ = get_spec_type_from_type(type_)
     version_mod_name = "v" + "_".join(format_version.split(".")[:2])
     try:
-        return getattr(getattr(bioimageio.spec, type_), version_mod_name)
-    except AttributeError:
+        return importlib.import_module(f"bioimageio.spec.{type_}.{version_mod_name}")
+    except ModuleNotFoundError as e:
+        if e.name != f"bioimageio.spec.{type_}.{version_mod_name}":
+            raise
+
         raise ValueError(
             f"Invalid RDF format version {format_version} for RDF type {type_}. "
             f"Submodule bioimageio.spec.{type_}.{version_mod_name} does not exist."
@@ -175,11 +237,12 @@ def get_spec_type_from_type(type_: Optional[str]):
 
 def get_latest_format_version_module(type_: str):
     type_ = get_spec_type_from_type(type_)
-    import bioimageio.spec
-
     try:
-        return getattr(bioimageio.spec, type_)
-    except AttributeError:
+        return importlib.import_module(f"bioimageio.spec.{type_}")
+    except ModuleNotFoundError as e:
+        if e.name != f"bioimageio.spec.{type_}":
+            raise
+
         raise ValueError(f"Invalid RDF type {type_}")
 
 
@@ -97,6 +97,54 @@ class Predicate(MarshmallowPredicate):
         return value
 
 
+class LazyOneOf(OneOf):
+    """extends marshmallow.OneOf by retrieving the choices only on validation.
+
+    :param get_choices: Callable returning the valid choices (a container with fast membership test, e.g. a dict).
+        If it returns None, e.g. because the choices are not available, validation is skipped.
+    :param labels: Optional sequence of labels to pair with the choices.
+    :param error: Error message to raise in case of a validation error.
+        Can be interpolated with `{input}`, `{choices}` and `{labels}`.
+    :param static: If False, the choices change over time (e.g. they are fetched online)
+        and are not exported as an enum to the JSON schema.
+    """
+
+    def __init__(
+        self,
+        get_choices: typing.Callable[[], typing.Iterable],
+        labels: typing.Optional[typing.Iterable[str]] = None,
+        *,
+        error: typing.Optional[str] = None,
+        static: bool = True,
+    ):
+        self.get_choices = get_choices
+        self.static = static
+        self.labels = labels if labels is not None else []
+        self.labels_text = ", ".join(str(label) for label in self.labels)
+        self.error = error or self.default_message  # type: str
+
+    @property
+    def choices(self) -> typing.Iterable:  # type: ignore
+        return self.get_choices()
+
+    @property
+    def choices_text(self) -> str:  # type: ignore
+        return ", ".join(str(choice) for choice in self.choices or [])
+
+    def __call__(self, value: typing.Any) -> typing.Any:
+        choices = self.get_choices()
+        if choices is None:
+            return value
+
+        try:
+            if value not in choices:
+                raise ValidationError(self._format_error(value))
+        except TypeError as error:
+            raise ValidationError(self._format_error(value)) from error
+
+        return value
+
+
 class URL(MarshmallowURL):
     def __call__(self, value: typing.Any):
         return super().__call__(str(value))  # cast value which might be a raw_nodes.URI to string
@@ -469,8 +469,6 @@ class BioImageIO_ID(String):
         ] = None,
         **super_kwargs,
     ):
-        from ._resolve_source import BIOIMAGEIO_COLLECTION_ENTRIES
-
         if validate is None:
             validate = []
 
@@ -479,23 +477,18 @@ class BioImageIO_ID(String):
         else:
             validate = [validate]
 
-        if BIOIMAGEIO_COLLECTION_ENTRIES is not None:
-            error_msg = "'{input}' is not a valid BioImage.IO ID"
-            if resource_type is not None:
-                error_msg += f" of type {resource_type}"
-
-            validate.append(
-                field_validators.OneOf(
-                    {
-                        k
-                        for k, (v_type, _) in BIOIMAGEIO_COLLECTION_ENTRIES.items()
-                        if resource_type is None or resource_type == v_type
-                    },
-                    error=error_msg,
-                )
-            )
+        error_msg = "'{input}' is not a valid BioImage.IO ID"
+        if resource_type is not None:
+            error_msg += f" of type {resource_type}"
+
+        def get_ids() -> typing.Optional[typing.FrozenSet[str]]:
+            from ._resolve_source import get_bioimageio_ids
+
+            return get_bioimageio_ids(resource_type)
+
+        validate.append(field_validators.LazyOneOf(get_ids, error=error_msg, static=False))
 
-        super().__init__(*super_args, bioimageio_description=bioimageio_description, **super_kwargs)
+        super().__init__(*super_args, bioimageio_description=bioimageio_description, validate=validate, **super_kwargs)
 
 
 class ProcMode(String):
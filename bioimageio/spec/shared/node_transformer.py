@@ -47,6 +47,51 @@ class NodeVisitor:
                 self.visit(subnode)
 
 
+class ExpectedSha256Collector(NodeVisitor):
+    """collects sha256 digests declared for remote files, e.g. by the 'sha256' of a weights entry"""
+
+    def __init__(self):
+        self.expected: typing.Dict[str, str] = {}
+
+    def generic_visit(self, node):
+        if isinstance(node, raw_nodes.RawNode):
+            for source_name, sha256_name in (
+                ("source", "sha256"),
+                ("uri", "sha256"),
+                ("architecture", "architecture_sha256"),
+            ):
+                source = getattr(node, source_name, None)
+                if isinstance(source, raw_nodes.ImportableSourceFile):
+                    source = source.source_file
+
+                sha256 = getattr(node, sha256_name, missing)
+                if isinstance(source, URI) and isinstance(sha256, str):
+                    self.expected[str(source)] = sha256
+
+        super().generic_visit(node)
+
+
+class RemoteResourceCollector(NodeVisitor):
+    """collects remote files included in a resource package (as listed by `<node>._include_in_package`)"""
+
+    def __init__(self):
+        self.uris: typing.Dict[str, URI] = {}
+
+    def _collect(self, resource: typing.Any):
+        if isinstance(resource, list):
+            for r in resource:
+                self._collect(r)
+        elif isinstance(resource, URI) and resource.scheme in ("http", "https"):
+            self.uris.setdefault(str(resource), resource)
+
+    def generic_visit(self, node):
+        if isinstance(node, raw_nodes.RawNode):
+            for incl_field in node._include_in_package:
+                self._collect(getattr(node, incl_field))
+
+        super().generic_visit(node)
+
+
 class Transformer:
     def transform(self, node: typing.Any, **kwargs) -> typing.Any:
         method = "transform_" + node.__class__.__name__
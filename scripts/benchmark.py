@@ -0,0 +1,152 @@
+"""script to benchmark performance critical code paths of bioimageio.spec"""
+import statistics
+import subprocess
+import sys
+import time
+import warnings
+from argparse import ArgumentParser
+from pathlib import Path
+
+_example_specs = Path(__file__).parent.parent / "example_specs"
+
+# blocks any network access of the benchmarked code
+_no_network = """
+import socket
+
+def no_network(*args, **kwargs):
+    raise RuntimeError("network access")
+
+socket.getaddrinfo = socket.create_connection = socket.socket.connect = no_network
+"""
+
+
+def time_in_subprocess(code: str, setup: str = "", repeat: int = 5) -> float:
+    """median of `repeat` timings of `code` in fresh python processes (in seconds)"""
+    timed = f"{_no_network}\n{setup}\nimport time\nt0 = time.perf_counter()\n{code}\nprint(time.perf_counter() - t0)"
+    timings = []
+    for _ in range(repeat):
+        ret = subprocess.run(
+            [sys.executable, "-c", timed], stdout=subprocess.PIPE, stderr=subprocess.PIPE, encoding="utf-8"
+        )
+        if ret.returncode:
+            raise RuntimeError(f"Failed to benchmark {code!r}:\n{ret.stderr}")
+
+        timings.append(float(ret.stdout.strip().split("\n")[-1]))
+
+    return statistics.median(timings)
+
+
+def benchmark_import(repeat: int):
+    """import time of common import paths of bioimageio.spec (without network access)"""
+    for code in [
+        "import bioimageio.spec",
+        "from bioimageio.spec import load_raw_resource_description",
+        "from bioimageio.spec import validate",
+        "import bioimageio.spec.model",
+    ]:
+        print(f"{code}: {time_in_subprocess(code, repeat=repeat):.3f}s")
+
+    load = "from bioimageio.spec import load_raw_resource_description\nload_raw_resource_description({!r})"
+    for rdf in [
+        _example_specs / "datasets" / "covid_if_training_data" / "rdf.yaml",
+        _example_specs / "models" / "unet2d_nuclei_broad" / "rdf.yaml",
+    ]:
+        print(
+            f"import and load {rdf.relative_to(_example_specs)}: {time_in_subprocess(load.format(str(rdf)), repeat=repeat):.3f}s"
+        )
+
+
+def time_process(code: str, repeat: int = 5) -> float:
+    """median wall time of `repeat` fresh python processes running `code` (in seconds)"""
+    timings = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        ret = subprocess.run(
+            [sys.executable, "-c", f"{_no_network}\n{code}"], stdout=subprocess.PIPE, stderr=subprocess.PIPE
+        )
+        timings.append(time.perf_counter() - t0)
+        if ret.returncode:
+            raise RuntimeError(f"Failed to benchmark {code!r}:\n{ret.stderr.decode()}")
+
+    return statistics.median(timings)
+
+
+def benchmark_cli(repeat: int):
+    """startup and run time of the bioimageio command line interface (without network access)"""
+    cli = "import sys\nfrom bioimageio.spec.__main__ import app\ntry:\n    app({})\nexcept SystemExit as e:\n    sys.exit(e.code)"
+    print(f"python interpreter startup: {time_process('pass', repeat=repeat):.3f}s")
+    for args in [
+        ["--help"],
+        ["validate", "--help"],
+        ["validate", str(_example_specs / "datasets" / "covid_if_training_data" / "rdf.yaml")],
+        ["validate", str(_example_specs / "models" / "unet2d_nuclei_broad" / "rdf.yaml")],
+    ]:
+        print(f"bioimageio {' '.join(args)}: {time_process(cli.format(args), repeat=repeat):.3f}s")
+
+
+def benchmark_load(repeat: int):
+    """per RDF load and serialization time of the example_specs models with and without reusing schema instances"""
+    exec(_no_network)
+    from bioimageio.spec import io_
+    from bioimageio.spec.shared import yaml
+
+    def time_load_and_serialize(data: dict, root: Path, reuse_schemas: bool) -> float:
+        timings = []
+        for _ in range(repeat):
+            if not reuse_schemas:
+                io_._schema_pool.clear()
+
+            t0 = time.perf_counter()
+            raw_rd = io_.load_raw_resource_description(dict(data, root_path=root))
+            io_.serialize_raw_resource_description_to_dict(raw_rd)
+            timings.append(time.perf_counter() - t0)
+
+        return statistics.median(timings)
+
+    for rdf in sorted((_example_specs / "models").glob("*/*.yaml")):
+        data = yaml.load(rdf)
+        if not isinstance(data, dict) or data.get("type") != "model":
+            continue
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            try:
+                time_load_and_serialize(data, rdf.parent, reuse_schemas=True)  # warm up
+            except Exception as e:
+                print(f"{rdf.relative_to(_example_specs)}: skipped ({type(e).__name__})")
+                continue
+
+            fresh = time_load_and_serialize(data, rdf.parent, reuse_schemas=False)
+            pooled = time_load_and_serialize(data, rdf.parent, reuse_schemas=True)
+
+        print(
+            f"{rdf.relative_to(_example_specs)}: {fresh * 1000:.2f}ms with new schemas, "
+            f"{pooled * 1000:.2f}ms with pooled schemas (saving {(fresh - pooled) * 1000:.2f}ms per RDF)"
+        )
+
+
+def parse_args():
+    p = ArgumentParser(description="script that benchmarks performance critical code paths of bioimageio.spec")
+    p.add_argument("benchmark", choices=["cli", "import", "load"])
+    p.add_argument("--repeat", type=int, default=5, help="number of repetitions (the median is reported)")
+
+    args = p.parse_args()
+    return args
+
+
+def main(args):
+    if args.benchmark == "cli":
+        benchmark_cli(args.repeat)
+    elif args.benchmark == "import":
+        benchmark_import(args.repeat)
+    elif args.benchmark == "load":
+        benchmark_load(args.repeat)
+    else:
+        raise NotImplementedError(args.benchmark)
+
+    return 0
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    sys.exit(main(args))
@@ -2,8 +2,11 @@ import json
 from pathlib import Path
 
 from marshmallow_jsonschema import JSONSchema
+from marshmallow_jsonschema.base import FIELD_VALIDATORS
+from marshmallow_jsonschema.validation import handle_one_of
 
 import bioimageio.spec
+from bioimageio.spec.shared.field_validators import LazyOneOf
 
 try:
     from typing import get_args
@@ -11,6 +14,22 @@ except ImportError:
     from typing_extensions import get_args  # type: ignore
 
 
+def handle_lazy_one_of(schema, field, validator: LazyOneOf, parent_schema):
+    # choices fetched online (e.g. bioimage.io ids) are not part of the spec
+    if not validator.static:
+        return schema
+
+    choices = validator.choices
+    if choices is None:
+        return schema
+
+    return handle_one_of(schema, field, validator, parent_schema)
+
+
+# marshmallow_jsonschema looks up validators by their exact class
+FIELD_VALIDATORS[LazyOneOf] = handle_lazy_one_of
+
+
 def export_json_schema_from_schema(folder: Path, spec):
     type_or_version = spec.__name__.split(".")[-1]
     format_version_wo_patch = "_".join(spec.format_version.split(".")[:2])
@@ -32,10 +51,7 @@ def export_json_schema_from_schema(folder: Path, spec):
         json.dump(json_schema, f, indent=4, sort_keys=True)
 
 
-if __name__ == "__main__":
-    dist = Path(__file__).parent / "../dist"
-    dist.mkdir(exist_ok=True)
-
+def generate_json_specs(dist: Path):
     import bioimageio.spec.rdf.v0_2
     import bioimageio.spec.collection.v0_2
     import bioimageio.spec.dataset.v0_2
@@ -50,3 +66,9 @@ if __name__ == "__main__":
     export_json_schema_from_schema(dist, bioimageio.spec.model)
     export_json_schema_from_schema(dist, bioimageio.spec.model.v0_3)
     export_json_schema_from_schema(dist, bioimageio.spec.model.v0_4)
+
+
+if __name__ == "__main__":
+    dist = Path(__file__).parent / "../dist"
+    dist.mkdir(exist_ok=True)
+    generate_json_specs(dist)
@@ -0,0 +1,65 @@
+import json
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+
+_script_path = Path(__file__).parent
+
+LICENSES_JSON_PATH = _script_path.parent / "bioimageio" / "spec" / "static" / "licenses.json"
+LICENSE_INDEX_PATH = _script_path.parent / "bioimageio" / "spec" / "shared" / "_spdx_license_index.py"
+
+autogen_header = "# Auto-generated by generate_license_index.py from static/licenses.json - do not modify\n"
+
+
+def get_license_index_content() -> str:
+    license_data = json.loads(LICENSES_JSON_PATH.read_text(encoding="utf-8"))
+    lines = [
+        autogen_header,
+        f"LICENSE_DATA_VERSION = {json.dumps(license_data['licenseListVersion'])}",
+        "",
+        "# license id: (name, is deprecated license id, is FSF free/libre)",
+        "# fmt: off",
+        "LICENSES = {",
+    ]
+    for lic in sorted(license_data["licenses"], key=lambda lic: lic["licenseId"]):
+        lines.append(
+            f"    {json.dumps(lic['licenseId'])}: ({json.dumps(lic['name'])}, "
+            f"{bool(lic.get('isDeprecatedLicenseId', False))}, {bool(lic.get('isFsfLibre', False))}),"
+        )
+
+    lines += ["}", "# fmt: on", ""]
+    return "\n".join(lines)
+
+
+def parse_args():
+    p = ArgumentParser(
+        description=(
+            "script that generates a compact SPDX license index as Python module from the full licenses.json, "
+            "such that license lookups do not have to parse the full license data"
+        )
+    )
+    p.add_argument("command", choices=["check", "generate"])
+
+    args = p.parse_args()
+    return args
+
+
+def main(args):
+    content = get_license_index_content()
+    if args.command == "generate":
+        LICENSE_INDEX_PATH.write_text(content, encoding="utf-8")
+    elif args.command == "check":
+        if not LICENSE_INDEX_PATH.exists() or LICENSE_INDEX_PATH.read_text(encoding="utf-8") != content:
+            print(f"{LICENSE_INDEX_PATH} is outdated, try regenerating.")
+            return 1
+
+        print("All seems fine.")
+    else:
+        raise NotImplementedError(args.command)
+
+    return 0
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    sys.exit(main(args))
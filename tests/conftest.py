@@ -111,3 +111,55 @@ def dataset_rdf():
 @pytest.fixture
 def upsamle_model_rdf():
     return pathlib.Path(__file__).parent / "../example_specs/models/upsample_test_model/rdf.yaml"
+
+
+@pytest.fixture
+def local_server():
+    """in-process stand-in for the remote hosts of source resolution (see `local_server.py`)"""
+    from local_server import LocalServer
+
+    server = LocalServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def local_transport(local_server, monkeypatch):
+    """route all HTTP requests of source resolution to `local_server`"""
+    from local_server import LocalTransport
+
+    from bioimageio.spec.shared import _resolve_source, http_client
+
+    transport = LocalTransport(local_server)
+    monkeypatch.setattr(http_client, "transport", transport)
+    monkeypatch.setattr(_resolve_source, "_url_available", {})
+    monkeypatch.setattr(_resolve_source, "_url_redirects", {})
+    yield transport
+    transport.close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(monkeypatch, tmp_path):
+    """an empty download cache (in `tmp_path`) used instead of the one at BIOIMAGEIO_CACHE_PATH
+
+    Used by all tests, such that downloads and failures recorded by one test do not affect other tests or later runs.
+    """
+    from bioimageio.spec import io_
+    from bioimageio.spec.shared import _cache, _resolve_source, _zip_root
+
+    cache = _cache.CacheManager(tmp_path / "cache")
+    monkeypatch.setattr(_resolve_source, "cache_manager", cache)
+    monkeypatch.setattr(_zip_root, "cache_manager", cache)
+    monkeypatch.setattr(io_, "cache_manager", cache)
+    monkeypatch.setattr(_cache, "_expected_sha256", {})
+    monkeypatch.setattr(_resolve_source, "_host_failures", {})
+    return cache
+
+
+@pytest.fixture(autouse=True)
+def no_retry_backoff(monkeypatch):
+    """retry failed downloads without waiting (tests of remote sources retry without network access)"""
+    from bioimageio.spec.shared import _resolve_source
+
+    monkeypatch.setattr(_resolve_source, "BIOIMAGEIO_DOWNLOAD_BACKOFF", 0)
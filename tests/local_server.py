@@ -0,0 +1,248 @@
+"""in-process stand-in for the remote hosts of source resolution
+
+`LocalServer` serves files at /<host>/<path>, the same layout as an offline mirror tree (BIOIMAGEIO_MIRROR_PATH):
+- the `example_specs` of this repository for any url containing '/example_specs/',
+  e.g. the raw.githubusercontent.com urls of the example specs,
+- fake Zenodo records (`add_zenodo_record`) with their file listing and files,
+- DOI redirects (`add_doi`),
+- synthetic files of any size (`add_large_file`) generated on the fly.
+
+Responses support ETags (If-None-Match/If-Range) and open byte ranges; `latency` (in seconds) and `bandwidth`
+(in bytes per second) can be configured to benchmark downloads and the cache reproducibly without network access.
+`LocalTransport` routes requests to any host to the server (see `bioimageio.spec.shared.set_transport`).
+"""
+import hashlib
+import json
+import pathlib
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+from urllib.parse import unquote, urlsplit
+
+from bioimageio.spec.shared import Transport
+from bioimageio.spec.shared._http import HttpClient
+
+EXAMPLE_SPECS = pathlib.Path(__file__).parent / "../example_specs"
+CHUNK_SIZE = 64 * 1024
+
+
+class SyntheticFile(NamedTuple):
+    """deterministic file content of `size` bytes, generated when served"""
+
+    size: int
+    seed: int = 0
+
+    def chunks(self, start: int = 0):
+        pattern = hashlib.sha256(str(self.seed).encode()).digest() * (CHUNK_SIZE // 32)
+        pos = start
+        while pos < self.size:
+            offset = pos % CHUNK_SIZE
+            chunk = pattern[offset : offset + min(CHUNK_SIZE - offset, self.size - pos)]
+            pos += len(chunk)
+            yield chunk
+
+    @property
+    def sha256(self) -> str:
+        h = hashlib.sha256()
+        for chunk in self.chunks():
+            h.update(chunk)
+
+        return h.hexdigest()
+
+
+Content = Union[bytes, pathlib.Path, SyntheticFile]
+
+
+class LocalServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, *, latency: float = 0.0, bandwidth: Optional[float] = None):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.files: Dict[str, Content] = {}  # served files by <host>/<path>
+        self.dois: Dict[str, str] = {}
+        self.zenodo_records: Dict[str, Dict[str, Content]] = {}
+        self.requests: List[Tuple[str, str]] = []  # (method, path) of all requests
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def local_url(self, url: str) -> str:
+        """url of the local stand-in for `url`"""
+        if url.startswith(self.url):
+            return url
+
+        parts = urlsplit(url)
+        return f"{self.url}/{parts.netloc}{parts.path}" + (f"?{parts.query}" if parts.query else "")
+
+    def add_file(self, url: str, content: Content):
+        parts = urlsplit(url)
+        self.files[f"{parts.netloc}{parts.path}"] = content
+
+    def add_large_file(self, url: str, size: int, seed: int = 0) -> str:
+        """serve `size` synthetic bytes at `url`; returns their sha256"""
+        content = SyntheticFile(size, seed)
+        self.add_file(url, content)
+        return content.sha256
+
+    def add_doi(self, doi: str, url: str):
+        self.dois[doi] = url
+
+    def add_zenodo_record(
+        self, record_id: str, files: Dict[str, Content], doi_prefix: str = "10.5281/zenodo.", host: str = "zenodo.org"
+    ):
+        self.zenodo_records[record_id] = files
+        self.add_doi(f"{doi_prefix}{record_id}", f"https://{host}/record/{record_id}")
+
+    def start(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def _log(self, method: str, path: str):
+        with self._lock:
+            self.requests.append((method, path))
+
+    def _get(self, path: str) -> Union[Content, str, None]:
+        """content at `path` (or a url to redirect to)"""
+        host, _, rest = path.lstrip("/").partition("/")
+        if f"{host}/{rest}" in self.files:
+            return self.files[f"{host}/{rest}"]
+
+        if host == "doi.org" and rest in self.dois:
+            return self.local_url(self.dois[rest])
+
+        if host.endswith("zenodo.org") and rest.startswith("api/records/"):
+            record_id, _, file_path = rest[len("api/records/") :].partition("/")
+            files = self.zenodo_records.get(record_id)
+            if files is None:
+                return None
+            elif file_path == "files":
+                return json.dumps({"entries": [{"key": name} for name in files]}).encode()
+            elif file_path.startswith("files/") and file_path.endswith("/content"):
+                return files.get(file_path[len("files/") : -len("/content")])
+
+        if "/example_specs/" in f"/{rest}":
+            local = (EXAMPLE_SPECS / f"/{rest}".split("/example_specs/", 1)[1]).resolve()
+            if local.is_file() and EXAMPLE_SPECS.resolve() in local.parents:
+                return local
+
+        return None
+
+
+def _get_size(content: Content) -> int:
+    if isinstance(content, bytes):
+        return len(content)
+    elif isinstance(content, pathlib.Path):
+        return content.stat().st_size
+    else:
+        return content.size
+
+
+def _get_etag(content: Content) -> str:
+    if isinstance(content, bytes):
+        return f'"{hashlib.sha256(content).hexdigest()[:16]}"'
+    elif isinstance(content, pathlib.Path):
+        stat = content.stat()
+        return f'"{stat.st_size}-{stat.st_mtime_ns}"'
+    else:
+        return f'"synthetic-{content.size}-{content.seed}"'
+
+
+def _iter_chunks(content: Content, start: int):
+    if isinstance(content, SyntheticFile):
+        yield from content.chunks(start)
+        return
+
+    data = content if isinstance(content, bytes) else content.read_bytes()
+    for i in range(start, len(data), CHUNK_SIZE):
+        yield data[i : i + CHUNK_SIZE]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    server: LocalServer
+
+    def do_HEAD(self):
+        self._respond(body=False)
+
+    def do_GET(self):
+        self._respond(body=True)
+
+    def _respond(self, body: bool):
+        path = unquote(self.path.split("?")[0])
+        self.server._log(self.command, path)
+        if self.server.latency:
+            time.sleep(self.server.latency)
+
+        content = self.server._get(path)
+        if content is None:
+            self._send_empty(404)
+            return
+        elif isinstance(content, str):
+            self.send_response(302)
+            self.send_header("Location", content)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        etag = _get_etag(content)
+        if self.headers.get("If-None-Match") == etag:
+            self._send_empty(304, {"ETag": etag})
+            return
+
+        size = _get_size(content)
+        start = 0
+        range_ = self.headers.get("Range", "")
+        if range_.startswith("bytes=") and range_.endswith("-") and self.headers.get("If-Range", etag) == etag:
+            start = int(range_[len("bytes=") : -1])
+            if start >= size:
+                self._send_empty(416, {"Content-Range": f"bytes */{size}"})
+                return
+
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{size - 1}/{size}")
+        else:
+            self.send_response(200)
+
+        self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(size - start))
+        self.end_headers()
+        if not body:
+            return
+
+        for chunk in _iter_chunks(content, start):
+            self.wfile.write(chunk)
+            if self.server.bandwidth:
+                time.sleep(len(chunk) / self.server.bandwidth)
+
+    def _send_empty(self, code: int, headers: Optional[Dict[str, str]] = None):
+        self.send_response(code)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LocalTransport(Transport):
+    """sends requests to any host to a `LocalServer` instead"""
+
+    def __init__(self, server: LocalServer):
+        self.server = server
+        self.client = HttpClient(timeout=10, offline=False)
+
+    def request(self, method: str, url: str, **kwargs):
+        return self.client.request(method, self.server.local_url(url), **kwargs)
+
+    def close(self):
+        self.client.close()
@@ -0,0 +1,48 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from bioimageio.spec.shared import yaml
+
+
+def test_load_raw_resource_description_async(unet2d_nuclei_broad_latest, unet2d_nuclei_broad_before_latest):
+    from bioimageio.spec import load_raw_resource_description, load_raw_resource_description_async
+
+    async def load_both():
+        return await asyncio.gather(
+            load_raw_resource_description_async(unet2d_nuclei_broad_latest),
+            load_raw_resource_description_async(unet2d_nuclei_broad_before_latest, update_to_format="latest"),
+        )
+
+    latest, updated = asyncio.run(load_both())
+    assert latest == load_raw_resource_description(unet2d_nuclei_broad_latest)
+    assert updated.format_version == latest.format_version
+
+
+def test_resolve_source_async(unet2d_nuclei_broad_latest):
+    from bioimageio.spec import resolve_source_async
+
+    assert yaml is not None
+    data = yaml.load(unet2d_nuclei_broad_latest)
+    sources = data["test_inputs"] + data["test_outputs"]
+    paths = asyncio.run(resolve_source_async(sources, unet2d_nuclei_broad_latest.parent))
+    assert paths == [(unet2d_nuclei_broad_latest.parent / s).resolve() for s in sources]
+    assert all(p.exists() for p in paths)
+
+
+def test_validate_async(unet2d_nuclei_broad_latest, invalid_rdf_v0_4_0_duplicate_tensor_names):
+    from bioimageio.spec import validate, validate_async
+
+    sources = [unet2d_nuclei_broad_latest, invalid_rdf_v0_4_0_duplicate_tensor_names] * 8
+
+    async def validate_all():
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=len(sources)))
+        return await asyncio.gather(*(validate_async(s, update_format=True) for s in sources))
+
+    summaries = asyncio.run(validate_all())
+    expected = [validate(s, update_format=True) for s in sources[:2]]
+    assert expected[0]["error"] is None
+    assert expected[0]["warnings"]  # warnings of concurrent validations must not get mixed up
+    assert expected[1]["error"] is not None
+    for i, summary in enumerate(summaries):
+        assert summary == expected[i % 2]
@@ -24,6 +24,22 @@ def test_validate_dataset(dataset_rdf):
     assert summary["status"] == "passed", summary
 
 
+def test_validate_with_cache_stats(unet2d_nuclei_broad_latest):
+    from bioimageio.spec.commands import validate
+
+    summary = validate(unet2d_nuclei_broad_latest, cache_stats=True)
+    assert summary["status"] == "passed", summary
+    assert set(summary["cache_stats"]) == {
+        "hits",
+        "misses",
+        "bytes_downloaded",
+        "bytes_served",
+        "download_time",
+        "extraction_time",
+    }
+    assert "cache_stats" not in validate(unet2d_nuclei_broad_latest)
+
+
 def test_validate_model_as_dict(unet2d_nuclei_broad_any):
     from bioimageio.spec.commands import validate
 
@@ -198,6 +214,41 @@ def test_validate_generates_warnings(unet2d_nuclei_broad_latest):
     assert summary["warnings"]
 
 
+def test_warnings_are_captured_per_thread():
+    import threading
+    import warnings
+
+    from bioimageio.spec.commands import _capture_warnings
+
+    entered = threading.Barrier(2, timeout=10)
+    captured = {}
+
+    def capture(name):
+        with _capture_warnings() as captured[name]:
+            entered.wait()  # captures of both threads are active at the same time
+            warnings.warn(name)
+            entered.wait()
+
+    threads = [threading.Thread(target=capture, args=(name,)) for name in ("a", "b")]
+    with _capture_warnings() as main_captured:
+        for t in threads:
+            t.start()
+
+        for t in threads:
+            t.join()
+
+        warnings.warn("main")
+        warnings.warn("main")  # shown again in a new capture
+
+    with _capture_warnings() as repeated:
+        warnings.warn("main")
+
+    assert [str(w.message) for w in captured["a"]] == ["a"]
+    assert [str(w.message) for w in captured["b"]] == ["b"]
+    assert [str(w.message) for w in main_captured] == ["main", "main"]
+    assert [str(w.message) for w in repeated] == ["main"]
+
+
 def test_update_format(unet2d_nuclei_broad_before_latest, tmp_path):
     from bioimageio.spec.commands import update_format
 
@@ -152,3 +152,52 @@ class TestDependencies:
 
         dep_serialized = s.dump(node)
         assert dep_serialized == dep_input
+
+
+class TestBioImageIO_ID:
+    @pytest.fixture
+    def collection(self, monkeypatch):
+        from bioimageio.spec.shared import _resolve_source
+
+        collection = _resolve_source.LazyRemoteJson("https://example.com/fake_collection.json")
+        responses = [
+            {"collection": [{"id": "10.5281/zenodo.1", "type": "model", "rdf_source": "https://example.com/m1.yaml"}]},
+            {
+                "collection": [
+                    {"id": "10.5281/zenodo.1", "type": "model", "rdf_source": "https://example.com/m1.yaml"},
+                    {"id": "10.5281/zenodo.2", "type": "dataset", "rdf_source": "https://example.com/d2.yaml"},
+                ]
+            },
+        ]
+        monkeypatch.setattr(_resolve_source, "_resolve_json_from_url", lambda url, **kwargs: (responses.pop(0), None))
+        monkeypatch.setattr(_resolve_source, "bioimageio_collection", collection)
+        monkeypatch.setattr(_resolve_source, "_collection_index", _resolve_source._CollectionIndex(-1, None, None))
+        return collection
+
+    def test_validates_against_shared_index(self, collection):
+        from bioimageio.spec.shared import get_bioimageio_ids
+
+        model_id = fields.BioImageIO_ID(resource_type="model")
+        any_id = fields.BioImageIO_ID()
+        assert model_id.deserialize("10.5281/zenodo.1") == "10.5281/zenodo.1"
+        with raises(ValidationError):
+            model_id.deserialize("10.5281/zenodo.2")
+
+        # the index is shared, not copied per field
+        assert get_bioimageio_ids("model") is get_bioimageio_ids("model")
+
+        collection.refresh()
+        with raises(ValidationError):
+            model_id.deserialize("10.5281/zenodo.2")
+
+        assert any_id.deserialize("10.5281/zenodo.2") == "10.5281/zenodo.2"
+        assert get_bioimageio_ids("dataset") == {"10.5281/zenodo.2"}
+
+    def test_skips_validation_without_collection(self, monkeypatch):
+        from bioimageio.spec.shared import _resolve_source
+
+        collection = _resolve_source.LazyRemoteJson("https://example.com/fake_collection.json")
+        monkeypatch.setattr(_resolve_source, "_resolve_json_from_url", lambda url, **kwargs: (None, "offline"))
+        monkeypatch.setattr(_resolve_source, "bioimageio_collection", collection)
+        monkeypatch.setattr(_resolve_source, "_collection_index", _resolve_source._CollectionIndex(-1, None, None))
+        assert fields.BioImageIO_ID(resource_type="model").deserialize("unknown") == "unknown"
@@ -0,0 +1,27 @@
+import importlib.util
+import json
+import pathlib
+
+
+def test_generate_json_specs_offline(monkeypatch, tmp_path):
+    from bioimageio.spec.shared import _resolve_source
+
+    collection = _resolve_source.LazyRemoteJson("https://example.com/fake_collection.json")
+    monkeypatch.setattr(_resolve_source, "_resolve_json_from_url", lambda url, **kwargs: (None, "offline"))
+    monkeypatch.setattr(_resolve_source, "bioimageio_collection", collection)
+    monkeypatch.setattr(_resolve_source, "_collection_index", _resolve_source._CollectionIndex(-1, None, None))
+
+    script_path = pathlib.Path(__file__).parent / "../scripts/generate_json_specs.py"
+    spec = importlib.util.spec_from_file_location("generate_json_specs", script_path)
+    script = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(script)
+
+    script.generate_json_specs(tmp_path)
+    assert len(list(tmp_path.glob("*.json"))) == 8
+
+    model_spec = json.loads((tmp_path / "model_spec_0_4.json").read_text())
+    properties = model_spec["definitions"]["Model"]["properties"]
+    # ids change with the bioimage.io collection and are not part of the spec
+    assert "enum" not in properties["id"]
+    # the license ids are
+    assert "CC-BY-4.0" in properties["license"]["enum"]
@@ -1,3 +1,4 @@
+import copy
 import pathlib
 
 import pytest
@@ -42,3 +43,357 @@ def test_resolve_download_url(unet2d_nuclei_broad_latest):
     model = load_raw_resource_description(data)
     assert isinstance(model, Model04)
     assert isinstance(model.download_url, pathlib.Path)
+
+
+def test_schema_pool_reuses_schemas(unet2d_nuclei_broad_latest):
+    from bioimageio.spec import io_
+
+    io_._schema_pool.clear()
+    raw_rd = io_.load_raw_resource_description(unet2d_nuclei_broad_latest)
+    sub_spec = io_._get_spec_submodule("model", raw_rd.format_version)
+    with io_._schema_pool.schema("model", sub_spec) as schema:
+        with io_._schema_pool.schema("model", sub_spec) as other_schema:
+            assert other_schema is not schema  # a schema instance is not shared while in use
+
+    io_.serialize_raw_resource_description_to_dict(raw_rd)
+    with io_._schema_pool.schema("model", sub_spec) as reused_schema:
+        assert reused_schema is schema or reused_schema is other_schema
+
+
+def test_concurrent_load_and_serialize(unet2d_nuclei_broad_any_minor):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from bioimageio.spec import load_raw_resource_description, serialize_raw_resource_description_to_dict
+
+    assert yaml is not None
+    data = yaml.load(unet2d_nuclei_broad_any_minor)  # parse once; the yaml instance is not thread-safe
+    data["root_path"] = unet2d_nuclei_broad_any_minor.parent
+
+    def load_and_serialize(_):
+        return serialize_raw_resource_description_to_dict(load_raw_resource_description(copy.deepcopy(data)))
+
+    expected = load_and_serialize(None)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for serialized in executor.map(load_and_serialize, range(32)):
+            assert serialized == expected
+
+
+def test_prefetch_resources(unet2d_nuclei_broad_latest, monkeypatch, tmp_path):
+    from bioimageio.spec import io_, load_raw_resource_description
+
+    assert yaml is not None
+    data = yaml.load(unet2d_nuclei_broad_latest)
+    data["root_path"] = "https://example.com/unet2d"
+    raw_rd = load_raw_resource_description(data)
+
+    fetched = []
+
+    def resolve_source(uri, pbar=None, **kwargs):
+        fetched.append(str(uri))
+        t = pbar(total=10)
+        t.update(10)
+        t.close()
+        return tmp_path / uri.path.split("/")[-1]
+
+    class Progress:
+        total = 0
+        n = 0
+
+        def update(self, n):
+            self.n += n
+
+        def close(self):
+            pass
+
+    progress = Progress()
+    monkeypatch.setattr(io_, "resolve_source", resolve_source)
+    local_paths = io_.prefetch_resources(raw_rd, max_workers=4, pbar=lambda **kwargs: progress)
+    assert sorted(fetched) == sorted(local_paths)
+    assert len(set(fetched)) == len(fetched)
+    assert progress.total == progress.n == 10 * len(fetched)
+    for expected in (
+        str(raw_rd.weights["pytorch_state_dict"].source),
+        str(raw_rd.weights["pytorch_state_dict"].architecture.source_file),
+        str(raw_rd.test_inputs[0]),
+        str(raw_rd.documentation),
+    ):
+        assert expected in local_paths
+
+    fetched.clear()
+    local_paths = io_.prefetch_resources(raw_rd, weights_priority_order=["onnx"], pbar=lambda **kwargs: progress)
+    assert str(raw_rd.weights["onnx"].source) in local_paths
+    assert str(raw_rd.weights["pytorch_state_dict"].source) not in local_paths
+
+
+def test_packaged_resource_is_read_in_place(unet2d_nuclei_broad_base_path, isolated_cache, tmp_path):
+    import pathlib
+    import zipfile
+
+    from bioimageio.spec import load_raw_resource_description
+    from bioimageio.spec.shared import _zip_root, get_zip_root, resolve_source, source_available, sources_available
+    from bioimageio.spec.shared._resolve_source import _is_path
+    from bioimageio.spec.shared._zip_root import read_extraction_marker
+
+    package = tmp_path / "package.zip"
+    with zipfile.ZipFile(package, "w") as zf:
+        for name in ("rdf.yaml", "README.md", "cover0.png", "test_input.npy", "test_output.npy", "weights.pt"):
+            zf.write(unet2d_nuclei_broad_base_path / name, name)
+
+    raw_rd = load_raw_resource_description(package)
+    root = raw_rd.root_path
+    assert isinstance(root, pathlib.Path)
+    zip_root = get_zip_root(root)
+    assert zip_root is not None and zip_root.zip_path == package.resolve()
+    test_input = raw_rd.test_inputs[0]
+    expected = (unet2d_nuclei_broad_base_path / "test_input.npy").read_bytes()
+    assert zip_root.read_bytes("test_input.npy") == expected
+    with zip_root.open("test_input.npy") as f:
+        assert f.read() == expected
+
+    assert source_available(test_input, root)
+    assert sources_available([test_input, root / "missing.npy"], root) == [True, False]
+    assert read_extraction_marker(root)["extracted"] == {"rdf.yaml"}  # only the RDF is extracted on load
+    # checking if a source is a path does not extract it
+    assert _is_path(str(root / "test_output.npy"))
+    assert read_extraction_marker(root)["extracted"] == {"rdf.yaml"}
+
+    # only a resolved file is extracted
+    assert resolve_source(test_input, root).read_bytes() == expected
+    assert read_extraction_marker(root)["extracted"] == {"rdf.yaml", "test_input.npy"}
+    assert sorted(p.name for p in root.iterdir()) == [
+        _zip_root.EXTRACTION_COMPLETE_MARKER,
+        "rdf.yaml",
+        "test_input.npy",
+    ]
+
+    # weights of other formats are not extracted
+    raw_rd = load_raw_resource_description(package, weights_priority_order=["torchscript"])
+    assert raw_rd.root_path == root
+    assert read_extraction_marker(root)["extracted"] == {
+        "rdf.yaml",
+        "README.md",
+        "cover0.png",
+        "test_input.npy",
+        "test_output.npy",
+        "weights.pt",
+    }
+
+
+def test_packaged_collection(partner_collection, isolated_cache, tmp_path):
+    import zipfile
+
+    from bioimageio.spec import load_raw_resource_description
+    from bioimageio.spec.collection.v0_2.utils import resolve_collection_entries
+
+    collection_path = partner_collection.parent
+    package = tmp_path / "collection.zip"
+    with zipfile.ZipFile(package, "w") as zf:
+        for path in collection_path.glob("**/*"):
+            if path.is_file():
+                zf.write(path, path.relative_to(collection_path).as_posix())
+
+    # relative rdf_source entries are resolved from the package
+    entries = resolve_collection_entries(load_raw_resource_description(package))
+    expected = resolve_collection_entries(load_raw_resource_description(partner_collection))
+    assert [error for _, error in entries] == [None]
+    assert entries[0][0].id == expected[0][0].id
+    assert entries[0][0].name == expected[0][0].name
+
+
+def test_selective_extraction(unet2d_nuclei_broad_base_path, isolated_cache, tmp_path):
+    import zipfile
+
+    from bioimageio.spec import io_
+
+    cache = isolated_cache
+    package = tmp_path / "package.zip"
+    names = [
+        "rdf.yaml",
+        "README.md",
+        "cover0.png",
+        "test_input.npy",
+        "test_output.npy",
+        "weights.pt",
+        "weights.onnx",
+        "unet2d.py",
+        "environment.yaml",
+    ]
+    with zipfile.ZipFile(package, "w") as zf:
+        for name in names:
+            zf.write(unet2d_nuclei_broad_base_path / name, name)
+
+    common = {"rdf.yaml", "README.md", "cover0.png", "test_input.npy", "test_output.npy"}
+    package_path = io_.extract_resource_package(package, weights_priority_order=["torchscript"])[2]
+    extracted = {p.name for p in package_path.iterdir()} - {io_.EXTRACTION_COMPLETE_MARKER}
+    assert extracted == common | {"weights.pt"}
+
+    # members selected later are added to the same extraction
+    assert io_.extract_resource_package(package, member_filter=lambda name: name.endswith(".onnx"))[2] == package_path
+    extracted = {p.name for p in package_path.iterdir()} - {io_.EXTRACTION_COMPLETE_MARKER}
+    assert extracted == common | {"weights.pt", "weights.onnx"}
+
+    assert io_.extract_resource_package(package)[2] == package_path
+    assert {p.name for p in package_path.iterdir()} - {io_.EXTRACTION_COMPLETE_MARKER} == set(names)
+
+    raw_rd = io_.load_raw_resource_description(package, weights_priority_order=["onnx", "torchscript"])
+    assert list(raw_rd.weights) == ["onnx"]
+    assert raw_rd.root_path == package_path  # loaded packages share the extraction
+
+
+def test_write_resource_package(local_server, local_transport, isolated_cache, tmp_path):
+    import hashlib
+    import zipfile
+
+    from bioimageio.spec import write_resource_package
+
+    cache = isolated_cache
+    sha_a = local_server.add_large_file("https://example.com/a.bin", 1024**2, seed=1)
+    sha_b = local_server.add_large_file("https://example.com/b.bin", 2 * 1024**2, seed=2)
+    local_server.bandwidth = 16 * 1024**2
+    (tmp_path / "README.md").write_text("# packaged")
+    rdf = tmp_path / "rdf.yaml"
+    rdf.write_text(
+        "format_version: 0.2.3\n"
+        "type: rdf\n"
+        "name: packaged\n"
+        "description: remote attachments\n"
+        "documentation: README.md\n"
+        "attachments:\n"
+        "  files: [README.md, https://example.com/a.bin, https://example.com/b.bin]\n"
+    )
+
+    class Progress:
+        total = 0
+        n = 0
+
+        def update(self, n):
+            self.n += n
+
+        def close(self):
+            pass
+
+    progress = Progress()
+    out = tmp_path / "package.zip"
+    sha256s = write_resource_package(rdf, out, max_workers=2, pbar=lambda **kwargs: progress)
+    assert progress.total == progress.n == 3 * 1024**2
+    assert set(sha256s) == {"rdf.yaml", "README.md", "a.bin", "b.bin"}
+    assert sha256s["a.bin"] == sha_a
+    assert sha256s["b.bin"] == sha_b
+    with zipfile.ZipFile(out) as zf:
+        assert sorted(zf.namelist()) == sorted(sha256s)
+        for name, sha in sha256s.items():
+            assert hashlib.sha256(zf.read(name)).hexdigest() == sha
+
+    # remote files are streamed into the package without being cached
+    assert cache.get_entries() == []
+
+
+def test_write_resource_package_buffers_only_out_of_order_members(
+    local_server, local_transport, isolated_cache, monkeypatch, tmp_path
+):
+    import hashlib
+    import zipfile
+    from tempfile import SpooledTemporaryFile
+
+    from bioimageio.spec import io_, write_resource_package
+
+    buffers = []
+
+    class Buffer(SpooledTemporaryFile):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.written = 0
+            buffers.append(self)
+
+        def write(self, data):
+            self.written += len(data)
+            return super().write(data)
+
+    monkeypatch.setattr(io_, "SpooledTemporaryFile", Buffer)
+    sha_a = local_server.add_large_file("https://example.com/a.bin", 4 * 1024**2, seed=1)
+    local_server.add_file("https://example.com/b.bin", b"small")
+    local_server.bandwidth = 16 * 1024**2
+    rdf = tmp_path / "rdf.yaml"
+    rdf.write_text(
+        "format_version: 0.2.3\n"
+        "type: rdf\n"
+        "name: packaged\n"
+        "description: remote attachments\n"
+        "attachments:\n"
+        "  files: [https://example.com/a.bin, https://example.com/b.bin]\n"
+    )
+    out = tmp_path / "package.zip"
+    sha256s = write_resource_package(rdf, out, compression=zipfile.ZIP_STORED)
+    assert sha256s["a.bin"] == sha_a
+    with zipfile.ZipFile(out) as zf:
+        assert zf.read("b.bin") == b"small"
+        assert hashlib.sha256(zf.read("a.bin")).hexdigest() == sha_a
+
+    # a.bin is written to the package as it arrives, b.bin (ready before a.bin) is buffered
+    assert sum(buffer.written for buffer in buffers) < 1024**2
+    assert all(buffer.closed for buffer in buffers)
+
+    # all buffers are closed if packaging fails
+    buffers.clear()
+    rdf.write_text(rdf.read_text().replace("https://example.com/b.bin", "https://example.com/missing.bin"))
+    with pytest.raises(RuntimeError, match="missing.bin"):
+        write_resource_package(rdf, out, compression=zipfile.ZIP_STORED)
+
+    assert not out.exists()
+    assert all(buffer.closed for buffer in buffers)
+
+
+def test_write_reproducible_resource_package(
+    unet2d_nuclei_broad_latest, local_server, local_transport, isolated_cache, tmp_path
+):
+    import hashlib
+    import shutil
+    import zipfile
+
+    from bioimageio.spec import load_raw_resource_description, write_resource_package
+
+    # serve the remote parent weights locally (with a matching sha256)
+    parent_url = "https://zenodo.org/record/3446812/files/unet2d_weights.torch"
+    local_server.add_file(parent_url, b"parent weights")
+    model_dir = tmp_path / "model"
+    shutil.copytree(unet2d_nuclei_broad_latest.parent, model_dir)
+    rdf = model_dir / unet2d_nuclei_broad_latest.name
+    rdf.write_text(
+        rdf.read_text().replace(
+            "e4d3885bccbe41cbf6c1d825f3cd2b707c7021ead5593156007e407a16b27cf2",
+            hashlib.sha256(b"parent weights").hexdigest(),
+        )
+    )
+
+    package = tmp_path / "package.zip"
+    sha256s = write_resource_package(rdf, package, weights_priority_order=["torchscript"])
+    rewritten = tmp_path / "rewritten.zip"
+    assert write_resource_package(rdf, rewritten, weights_priority_order=["torchscript"], max_workers=1) == sha256s
+    assert package.read_bytes() == rewritten.read_bytes()
+
+    with zipfile.ZipFile(package) as zf:
+        assert zf.testzip() is None
+        names = zf.namelist()
+        assert names == list(sha256s)
+        assert names[0] == "rdf.yaml" and names[1:] == sorted(names[1:])
+        assert zf.getinfo("weights.pt").compress_type == zipfile.ZIP_STORED
+        assert zf.getinfo("cover0.png").compress_type == zipfile.ZIP_STORED
+        assert zf.getinfo("rdf.yaml").compress_type == zipfile.ZIP_DEFLATED
+        assert zf.getinfo("test_input.npy").compress_type == zipfile.ZIP_DEFLATED
+        for info in zf.infolist():
+            assert info.date_time == (1980, 1, 1, 0, 0, 0)
+            assert hashlib.sha256(zf.read(info)).hexdigest() == sha256s[info.filename]
+
+    raw_rd = load_raw_resource_description(package)
+    assert list(raw_rd.weights) == ["torchscript"]
+
+    # a single compression method for all members
+    stored = tmp_path / "stored.zip"
+    write_resource_package(rdf, stored, compression=zipfile.ZIP_STORED)
+    with zipfile.ZipFile(stored) as zf:
+        assert {info.compress_type for info in zf.infolist()} == {zipfile.ZIP_STORED}
+
+    with pytest.raises(NotImplementedError):
+        write_resource_package(rdf, tmp_path / "lzma.zip", compression=zipfile.ZIP_LZMA)
+
+    assert not (tmp_path / "lzma.zip").exists()
@@ -0,0 +1,105 @@
+import subprocess
+import sys
+
+import pytest
+
+# modules (or packages) that common import paths must not import
+NOT_IMPORTED = {
+    "import bioimageio.spec": (
+        "bioimageio.spec.io_",
+        "bioimageio.spec.shared",
+        "marshmallow",
+        "numpy",
+        "requests",
+        "ruamel",
+        "lxml",
+    ),
+    "from bioimageio.spec import load_raw_resource_description": (
+        "bioimageio.spec.commands",
+        "bioimageio.spec.partner",
+        "bioimageio.spec.model",
+        "bioimageio.spec.dataset",
+        "bioimageio.spec.collection",
+        "bioimageio.spec.rdf",
+        "requests",
+        "lxml",
+    ),
+}
+
+
+def run_python(code: str) -> str:
+    ret = subprocess.run(
+        [sys.executable, "-c", code], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, encoding="utf-8"
+    )
+    assert ret.returncode == 0, ret.stdout
+    return ret.stdout.strip().split("\n")[-1]
+
+
+@pytest.mark.parametrize("code", list(NOT_IMPORTED))
+def test_import_does_not_import_heavy_modules(code):
+    loaded = run_python(f"import sys\n{code}\nprint(' '.join(sys.modules))").split()
+    for module in NOT_IMPORTED[code]:
+        assert not [m for m in loaded if m == module or m.startswith(f"{module}.")], module
+
+
+def test_import_does_not_import_rdf_type_submodules():
+    loaded = run_python(
+        "import sys, bioimageio.spec; print(sorted(m for m in sys.modules if m.startswith('bioimageio')))"
+    )
+    assert loaded == "['bioimageio', 'bioimageio.spec', 'bioimageio.spec.v']"
+
+
+def test_loading_dataset_does_not_import_model_submodules(dataset_rdf):
+    loaded = run_python(
+        "import sys\n"
+        "from bioimageio.spec import load_raw_resource_description\n"
+        f"load_raw_resource_description({str(dataset_rdf)!r})\n"
+        "print(sorted(m for m in sys.modules if m.startswith('bioimageio')))"
+    )
+    assert "bioimageio.spec.dataset.v0_2.schema" in loaded
+    assert "bioimageio.spec.model" not in loaded
+    assert "bioimageio.spec.collection" not in loaded
+
+
+def test_get_format_version_module_imports_on_first_access():
+    from bioimageio.spec.shared.common import get_format_version_module
+
+    model_v0_3 = get_format_version_module("model", "0.3.6")
+    assert model_v0_3.__name__ == "bioimageio.spec.model.v0_3"
+    assert model_v0_3.schema.Model.__module__ == "bioimageio.spec.model.v0_3.schema"
+
+    with pytest.raises(ValueError):
+        get_format_version_module("model", "0.1")
+
+
+def test_lazy_members():
+    import bioimageio.spec
+    from bioimageio.spec.io_ import load_raw_resource_description
+
+    assert bioimageio.spec.load_raw_resource_description is load_raw_resource_description
+    assert "validate" in dir(bioimageio.spec)
+    with pytest.raises(AttributeError):
+        bioimageio.spec.does_not_exist
+
+
+def test_cli_help_does_not_import_commands():
+    loaded = run_python(
+        "import sys\n"
+        "from bioimageio.spec.__main__ import app\n"
+        "try:\n"
+        "    app(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(sorted(m for m in sys.modules if m.split('.')[0] in ('bioimageio', 'numpy', 'lxml', 'requests')))"
+    )
+    for module in ("bioimageio.spec.commands", "bioimageio.spec.partner", "numpy", "lxml", "requests"):
+        assert repr(module) not in loaded
+
+
+def test_raw_nodes_do_not_import_source_resolution():
+    loaded = run_python(
+        "import sys, bioimageio.spec.model.raw_nodes\n"
+        "print(sorted(m for m in sys.modules if m.startswith('bioimageio')))"
+    )
+    assert "bioimageio.spec.shared._resolve_source" not in loaded
+    assert "bioimageio.spec.shared.fields" not in loaded
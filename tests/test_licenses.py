@@ -1,3 +1,6 @@
+import pytest
+from marshmallow import ValidationError
+
 from bioimageio.spec.shared import LICENSES
 
 
@@ -5,3 +8,27 @@ def test_licenses_read_and_reformatted():
     """Make sure LICENSES is dict of dicts"""
     assert isinstance(LICENSES, dict)
     assert all(isinstance(v, dict) for k, v in LICENSES.items())
+
+
+def test_license_index_matches_license_data():
+    """Make sure the precomputed license index is up-to-date with the full license data"""
+    from bioimageio.spec.shared import get_license_ids, get_license_info
+
+    assert set(get_license_ids()) == set(LICENSES)
+    for license_id, data in LICENSES.items():
+        info = get_license_info(license_id)
+        assert info is not None
+        assert info.name == data["name"]
+        assert info.is_deprecated == data.get("isDeprecatedLicenseId", False)
+        assert info.is_fsf_libre == data.get("isFsfLibre", False)
+
+    assert get_license_info("not-a-license") is None
+
+
+def test_license_validator_is_lazy():
+    from bioimageio.spec.shared import field_validators, get_license_ids
+
+    validator = field_validators.LazyOneOf(get_license_ids)
+    assert validator("MIT") == "MIT"
+    with pytest.raises(ValidationError):
+        validator("not-a-license")
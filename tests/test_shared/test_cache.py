@@ -0,0 +1,784 @@
+import hashlib
+
+import pytest
+
+from bioimageio.spec.shared._http import http_client
+from bioimageio.spec.shared.common import CacheWarning
+from bioimageio.spec.shared.raw_nodes import URI
+
+
+class FakeResponse:
+    def __init__(self, content: bytes, headers=None, status_code: int = 200):
+        self.content = content
+        from requests.structures import CaseInsensitiveDict
+
+        self.headers = CaseInsensitiveDict({"content-length": str(len(content)), **(headers or {})})
+        self.status_code = status_code
+
+    def raise_for_status(self):
+        pass
+
+    def close(self):
+        pass
+
+    def iter_content(self, block_size):
+        for i in range(0, len(self.content), block_size):
+            yield self.content[i : i + block_size]
+
+
+@pytest.fixture
+def cache(isolated_cache):
+    return isolated_cache
+
+
+def _download(url, **kwargs):
+    from bioimageio.spec.shared._resolve_source import _download_url
+
+    return _download_url(URI(uri_string=url), **kwargs)
+
+
+def test_tests_do_not_use_the_default_cache():
+    from bioimageio.spec.shared import _cache, _resolve_source, _zip_root
+    from bioimageio.spec.shared.common import BIOIMAGEIO_CACHE_PATH
+
+    for module in (_resolve_source, _zip_root):
+        assert module.cache_manager is not _cache.cache_manager
+        assert module.cache_manager.path != BIOIMAGEIO_CACHE_PATH
+
+
+def test_identical_files_are_stored_once(monkeypatch, cache):
+    content = b"weights" * 1000
+    sha256 = hashlib.sha256(content).hexdigest()
+    requested = []
+
+    def get(url, **kwargs):
+        requested.append(url)
+        return FakeResponse(content)
+
+    monkeypatch.setattr(http_client, "get", get)
+
+    a = _download("https://example.com/a/weights.pt")
+    assert a.name == "weights.pt"
+    assert a.read_bytes() == content
+    assert a.parent == cache.get_file_dir(sha256)
+
+    # same content from another url is only fetched if its digest is not known beforehand
+    b = _download("https://example.org/b/weights.pt")
+    assert b == a
+    c = _download("https://example.org/c/model.pt", sha256=sha256)
+    assert c.parent == a.parent
+    assert c.name == "model.pt"
+    assert requested == ["https://example.com/a/weights.pt", "https://example.org/b/weights.pt"]
+
+    # cached file is reused
+    assert _download("https://example.com/a/weights.pt", cache_policy="cache-first") == a
+    assert len(requested) == 2
+
+
+def test_sha256_mismatch(monkeypatch, cache):
+    from bioimageio.spec.shared import _cache
+
+    monkeypatch.setattr(http_client, "get", lambda url, **kwargs: FakeResponse(b"changed content"))
+
+    url = "https://example.com/weights.pt"
+    _cache.register_expected_sha256(url, hashlib.sha256(b"original content").hexdigest())
+    with pytest.raises(RuntimeError, match="does not match expected sha256"):
+        _download(url)
+
+    assert not list(cache.tmp_dir.iterdir())  # no leftover partial download
+
+
+def test_corrupted_cached_file_is_downloaded_again(monkeypatch, cache):
+    import os
+
+    requested = []
+
+    def get(url, **kwargs):
+        requested.append(url)
+        return FakeResponse(b"content")
+
+    monkeypatch.setattr(http_client, "get", get)
+
+    path = _download("https://example.com/file.txt")
+    path.write_bytes(b"truncated")
+    os.utime(path, ns=(0, 0))
+    with pytest.warns(CacheWarning, match="corrupted"):
+        path = _download("https://example.com/file.txt")
+
+    assert path.read_bytes() == b"content"
+    assert len(requested) == 2
+
+
+def test_expected_sha256_is_registered_on_load(cache, unet2d_nuclei_broad_latest):
+    from bioimageio.spec import load_raw_resource_description
+    from bioimageio.spec.shared import _cache
+    from bioimageio.spec.shared.common import yaml
+
+    data = yaml.load(unet2d_nuclei_broad_latest)
+    data["root_path"] = "https://example.com/unet2d"
+    raw_rd = load_raw_resource_description(data)
+    weights = raw_rd.weights["pytorch_state_dict"]
+    assert isinstance(weights.source, URI)
+    assert _cache.get_expected_sha256(str(weights.source)) == weights.sha256
+    assert _cache.get_expected_sha256(str(weights.architecture.source_file)) == weights.architecture_sha256
+
+
+def test_resolve_source_list_with_sha256(monkeypatch, cache):
+    from bioimageio.spec.shared import resolve_source
+
+    monkeypatch.setattr(http_client, "get", lambda url, **kwargs: FakeResponse(url.encode()))
+    urls = ["https://example.com/a.pt", "https://example.com/b.pt"]
+    sha256 = hashlib.sha256(urls[0].encode()).hexdigest()
+    paths = resolve_source([URI(uri_string=url) for url in urls], sha256=[sha256, None])
+    assert [p.read_bytes() for p in paths] == [url.encode() for url in urls]
+    with pytest.raises(RuntimeError, match="does not match expected sha256"):
+        resolve_source([URI(uri_string="https://example.com/c.pt")], sha256=[hashlib.sha256(b"other").hexdigest()])
+
+    with pytest.raises(TypeError, match="one sha256 per source"):
+        resolve_source([URI(uri_string=urls[0])], sha256=sha256)
+
+
+def test_conflicting_expected_sha256(monkeypatch, cache):
+    from bioimageio.spec.shared import _cache, resolve_source
+
+    content = b"weights"
+    monkeypatch.setattr(http_client, "get", lambda url, **kwargs: FakeResponse(content))
+    monkeypatch.setattr(_cache, "EXPECTED_SHA256_MAX_URLS", 2)
+    url = "https://example.com/weights.pt"
+    sha256 = hashlib.sha256(content).hexdigest()
+    _cache.register_expected_sha256(url, sha256)
+    with pytest.warns(UserWarning, match="Different sha256"):
+        _cache.register_expected_sha256(url, "0" * 64)
+
+    # neither of the conflicting digests is used implicitly
+    assert _cache.get_expected_sha256(url) is None
+    with pytest.raises(RuntimeError, match="does not match expected sha256"):
+        resolve_source(URI(uri_string=url), sha256="0" * 64)
+
+    assert resolve_source(URI(uri_string=url), sha256=sha256).read_bytes() == content
+
+    # the registry is bounded
+    _cache.register_expected_sha256("https://example.com/a", sha256)
+    _cache.register_expected_sha256("https://example.com/b", sha256)
+    assert list(_cache._expected_sha256) == ["https://example.com/a", "https://example.com/b"]
+
+
+def test_revalidation(monkeypatch, cache):
+    import requests
+
+    requests_headers = []
+    response_headers = {"ETag": '"v1"', "Cache-Control": "no-cache"}
+
+    def get(url, headers, **kwargs):
+        requests_headers.append(headers)
+        if headers.get("If-None-Match") == response_headers["ETag"]:
+            return FakeResponse(b"", headers=response_headers, status_code=304)
+        else:
+            return FakeResponse(response_headers["ETag"].encode(), headers=response_headers)
+
+    monkeypatch.setattr(http_client, "get", get)
+    url = "https://example.com/collection.json"
+    path = _download(url)
+    assert path.read_bytes() == b'"v1"'
+
+    # unchanged: revalidated by conditional request
+    assert _download(url) == path
+    assert requests_headers[-1]["If-None-Match"] == '"v1"'
+
+    # changed: downloaded again
+    response_headers["ETag"] = '"v2"'
+    assert _download(url).read_bytes() == b'"v2"'
+
+    # cache-first: no request
+    n_requests = len(requests_headers)
+    assert _download(url, cache_policy="cache-first").read_bytes() == b'"v2"'
+    assert len(requests_headers) == n_requests
+
+    # network-only: unconditional request
+    _download(url, cache_policy="network-only")
+    assert "If-None-Match" not in requests_headers[-1]
+
+    # offline: cached file is used
+    def fail(url, **kwargs):
+        raise requests.ConnectionError("offline")
+
+    monkeypatch.setattr(http_client, "get", fail)
+    with pytest.warns(CacheWarning, match="Failed to revalidate"):
+        assert _download(url).read_bytes() == b'"v2"'
+
+    with pytest.raises(ValueError):
+        _download(url, cache_policy="invalid")
+
+
+def test_fresh_file_is_not_revalidated(monkeypatch, cache):
+    requested = []
+
+    def get(url, **kwargs):
+        requested.append(url)
+        return FakeResponse(b"content", headers={"Cache-Control": "public, max-age=300"})
+
+    monkeypatch.setattr(http_client, "get", get)
+    url = "https://example.com/rdf.yaml"
+    path = _download(url)
+    assert _download(url) == path
+    assert len(requested) == 1
+
+    # max_age overrides the server's freshness lifetime
+    _download(url, max_age=0)
+    assert len(requested) == 2
+
+
+def test_heuristic_freshness():
+    from bioimageio.spec.shared._cache import get_expires
+    from bioimageio.spec.shared.common import BIOIMAGEIO_CACHE_DEFAULT_TTL
+
+    now = 1e9
+    date = "Sun, 09 Sep 2001 01:46:40 GMT"  # == now
+    assert get_expires({"Cache-Control": "max-age=60", "Expires": "0"}, now) == now + 60
+    assert get_expires({"Cache-Control": "no-cache"}, now) == now
+    assert get_expires({"Date": date, "Expires": "Sun, 09 Sep 2001 01:56:40 GMT"}, now) == now + 600
+    assert get_expires({"Expires": "0"}, now) == now
+
+    # 10% of the time since last modified, limited by BIOIMAGEIO_CACHE_DEFAULT_TTL
+    assert get_expires({"Date": date, "Last-Modified": "Sun, 09 Sep 2001 01:30:00 GMT"}, now) == now + 100
+    assert get_expires({"Date": date, "Last-Modified": "Mon, 01 Jan 2001 00:00:00 GMT"}, now) == (
+        now + BIOIMAGEIO_CACHE_DEFAULT_TTL
+    )
+    # validator only
+    assert get_expires({"ETag": '"v1"'}, now) == now + BIOIMAGEIO_CACHE_DEFAULT_TTL
+
+
+def test_entries_without_cache_control_are_not_revalidated_immediately(monkeypatch, cache):
+    requested = []
+
+    def get(url, **kwargs):
+        requested.append(url)
+        return FakeResponse(b"content", headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2001 00:00:00 GMT"})
+
+    monkeypatch.setattr(http_client, "get", get)
+    url = "https://example.com/rdf.yaml"
+    path = _download(url)
+    assert _download(url) == path
+    assert len(requested) == 1
+
+
+def _add(cache, tmp_path, url: str, content: bytes):
+    file = tmp_path / "download.part"
+    file.write_bytes(content)
+    return cache.add(url, file, sha256=hashlib.sha256(content).hexdigest(), file_name=url.split("/")[-1])
+
+
+def test_lru_eviction(tmp_path):
+    from bioimageio.spec.shared._cache import CacheManager
+
+    cache = CacheManager(tmp_path / "cache", max_size=250, min_age=0)
+    a = _add(cache, tmp_path, "https://example.com/a", b"a" * 100)
+    b = _add(cache, tmp_path, "https://example.com/b", b"b" * 100)
+    assert cache.lookup("https://example.com/a", file_name="a") is not None  # 'a' is now more recently used than 'b'
+
+    c = _add(cache, tmp_path, "https://example.com/c", b"c" * 100)
+    assert a.exists() and c.exists()
+    assert not b.exists()
+    assert cache.lookup("https://example.com/b", file_name="b") is None
+    assert cache.size == 200
+    assert [e.origin_url for e in cache.get_entries()] == ["https://example.com/a", "https://example.com/c"]
+    assert not list((cache.path / "trash").iterdir())
+
+
+def test_recently_used_entries_are_not_evicted(tmp_path):
+    from bioimageio.spec.shared._cache import CacheManager
+
+    cache = CacheManager(tmp_path / "cache", max_size=150, min_age=600)
+    a = _add(cache, tmp_path, "https://example.com/a", b"a" * 100)
+    b = _add(cache, tmp_path, "https://example.com/b", b"b" * 100)
+    assert a.exists() and b.exists()
+    assert cache.evict() == 0
+
+    cache.min_age = 0
+    assert cache.evict() == 100
+    assert not a.exists() and b.exists()
+
+
+def test_lock_files_are_deleted_with_their_entry(tmp_path):
+    import os
+    import threading
+    import time
+
+    from bioimageio.spec.shared._cache import CacheManager
+
+    cache = CacheManager(tmp_path / "cache", max_size=150, min_age=0)
+    for url in ("https://example.com/a", "https://example.com/b"):
+        with cache.lock(url):
+            _add(cache, tmp_path, url, url[-1].encode() * 100)
+
+    assert cache.lookup("https://example.com/a", file_name="a") is None  # evicted
+    assert not cache.lock("https://example.com/a").path.exists()
+    b_lock = cache.lock("https://example.com/b")
+    assert b_lock.path.exists()
+
+    # the lock file of a held lock is kept
+    package = cache.path / "extracted_packages" / "abc"
+    package.mkdir(parents=True)
+    (package / "rdf.yaml").write_bytes(b"x")
+    package_lock = cache.lock("extracted_packages/abc")
+    with package_lock:
+        cache.track(package)
+        cache.remove(package)
+
+    assert package_lock.path.exists()
+    cache.track(package)
+    cache.remove(package)
+    assert not package_lock.path.exists()
+
+    # a waiter for a lock whose file is deleted meanwhile acquires the lock on a new lock file
+    waiter_lock = cache.lock("https://example.com/b")
+    with b_lock:
+        waiter = threading.Thread(target=waiter_lock.acquire)
+        waiter.start()
+        time.sleep(0.2)
+        os.remove(b_lock.path)  # as by `FileLock.remove` before the waiter got the lock
+
+    waiter.join(10)
+    assert b_lock.path.exists()
+    assert not b_lock.acquire(blocking=False)
+    waiter_lock.release()
+    assert b_lock.remove()
+    assert not b_lock.path.exists()
+
+
+def test_extracted_package_is_tracked(tmp_path):
+    from bioimageio.spec.shared._cache import CacheManager
+
+    cache = CacheManager(tmp_path / "cache", min_age=0)
+    package = cache.path / "extracted_packages" / "abc"
+    (package / "sub").mkdir(parents=True)
+    (package / "rdf.yaml").write_bytes(b"x" * 10)
+    (package / "sub" / "weights.pt").write_bytes(b"x" * 20)
+    cache.track(package, origin_url="https://example.com/package.zip")
+    assert cache.get_entries()[0][:2] == ("extracted_packages/abc", 30)
+
+    assert cache.evict(max_size=10) == 30
+    assert not package.exists()
+
+
+class InterruptedResponse(FakeResponse):
+    def iter_content(self, block_size):
+        import requests
+
+        yield self.content[: len(self.content) // 2]
+        raise requests.exceptions.ChunkedEncodingError("connection broken")
+
+
+def test_interrupted_download_is_resumed(monkeypatch, cache):
+    content = b"weights" * 1000
+    requests_headers = []
+
+    def get(url, headers=None, **kwargs):
+        requests_headers.append(dict(headers or {}))
+        if len(requests_headers) == 1:
+            return InterruptedResponse(content, headers={"ETag": '"v1"'})
+
+        start = int(headers["Range"][len("bytes=") : -1])
+        return FakeResponse(
+            content[start:],
+            headers={"ETag": '"v1"', "Content-Range": f"bytes {start}-{len(content) - 1}/{len(content)}"},
+            status_code=206,
+        )
+
+    monkeypatch.setattr(http_client, "get", get)
+    with pytest.warns(UserWarning, match="Retrying"):
+        path = _download("https://example.com/weights.pt")
+
+    assert path.read_bytes() == content
+    assert path.parent == cache.get_file_dir(hashlib.sha256(content).hexdigest())
+    assert len(requests_headers) == 2
+    assert requests_headers[1]["Range"] == f"bytes={len(content) // 2}-"
+    assert requests_headers[1]["If-Range"] == '"v1"'
+    assert not list(cache.tmp_dir.iterdir())
+
+
+def test_changed_file_is_not_resumed(monkeypatch, cache):
+    responses = [InterruptedResponse(b"old content", headers={"ETag": '"v1"'}), FakeResponse(b"new content")]
+    monkeypatch.setattr(http_client, "get", lambda url, **kwargs: responses.pop(0))  # If-Range mismatch -> 200
+    with pytest.warns(UserWarning, match="Retrying"):
+        path = _download("https://example.com/data.txt")
+
+    assert path.read_bytes() == b"new content"
+
+
+def test_download_retries(monkeypatch, cache):
+    import requests
+
+    def get(url, **kwargs):
+        raise requests.ConnectionError("offline")
+
+    monkeypatch.setattr(http_client, "get", get)
+    with pytest.warns(UserWarning, match="Retrying"), pytest.raises(RuntimeError, match="offline"):
+        _download("https://example.com/data.txt", retries=2)
+
+
+def test_concurrent_downloads_wait_for_one(monkeypatch, cache):
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+
+    requested = []
+
+    def get(url, **kwargs):
+        requested.append(url)
+        time.sleep(0.2)
+        return FakeResponse(b"content")
+
+    monkeypatch.setattr(http_client, "get", get)
+    with ThreadPoolExecutor(4) as executor:
+        paths = list(executor.map(lambda _: _download("https://example.com/data.txt"), range(4)))
+
+    assert len(requested) == 1
+    assert len(set(paths)) == 1
+    assert paths[0].read_bytes() == b"content"
+
+
+def _acquire_and_mark(lock_path, marker):
+    from bioimageio.spec.shared._cache import FileLock
+
+    with FileLock(lock_path):
+        marker.write_text("acquired")
+
+
+def test_file_lock_across_processes(tmp_path):
+    import multiprocessing
+    import time
+
+    from bioimageio.spec.shared._cache import FileLock
+
+    if "fork" not in multiprocessing.get_all_start_methods():
+        pytest.skip("requires fork")
+
+    lock_path = tmp_path / "locks" / "entry.lock"
+    marker = tmp_path / "marker"
+    with FileLock(lock_path):
+        process = multiprocessing.get_context("fork").Process(target=_acquire_and_mark, args=(lock_path, marker))
+        process.start()
+        time.sleep(0.5)
+        assert not marker.exists()
+
+    process.join(10)
+    assert marker.read_text() == "acquired"
+
+
+def test_concurrent_extraction(monkeypatch, cache):
+    import threading
+    import zipfile
+    from concurrent.futures import ThreadPoolExecutor
+
+    from bioimageio.spec import io_
+    from bioimageio.spec.shared import _zip_root
+
+    root = URI("https://example.com/package.zip")
+    monkeypatch.setattr(io_, "resolve_rdf_source", lambda source: ({"type": "rdf"}, "package", root))
+
+    # the (cached) download of the package
+    download = cache.get_file_dir("abc") / "package.zip"
+    download.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(download, "w") as zf:
+        zf.writestr("rdf.yaml", "type: rdf")
+        zf.writestr("data/file.txt", "x" * 1000)
+
+    resolved = []
+    resolved_lock = threading.Lock()
+
+    def resolve_source(uri, **kwargs):
+        with resolved_lock:
+            resolved.append(uri)
+
+        return download
+
+    monkeypatch.setattr(io_, "resolve_source", resolve_source)
+    extract_members = _zip_root.extract_members
+    extracted = []
+
+    def count_extract_members(zip_path, names, target):
+        extracted.extend(names)
+        extract_members(zip_path, names, target)
+
+    monkeypatch.setattr(_zip_root, "extract_members", count_extract_members)
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(lambda _: io_.extract_resource_package(root), range(4)))
+
+    assert resolved == [root] * 4  # the package's download is resolved (and revalidated) as any other remote file
+    assert sorted(extracted) == ["data/file.txt", "rdf.yaml"]  # but only extracted once
+    package_path = results[0][2]
+    assert all(r[2] == package_path for r in results)
+    assert (package_path / "data" / "file.txt").read_text() == "x" * 1000
+    assert download.exists()  # the download is kept in the cache
+    assert [e.key for e in cache.get_entries()] == [package_path.relative_to(cache.path).as_posix()]
+
+
+def test_extraction_is_keyed_by_package_fingerprint(cache, tmp_path):
+    import shutil
+    import zipfile
+
+    from bioimageio.spec import io_
+    from bioimageio.spec.shared._cache import compute_sha256
+
+    def write_package(path, content: str):
+        with zipfile.ZipFile(path, "w") as zf:
+            zf.writestr("rdf.yaml", "type: rdf\nname: package")
+            zf.writestr("data/file.txt", content)
+
+    package = tmp_path / "package.zip"
+    write_package(package, "a")
+    package_path = io_.extract_resource_package(package)[2]
+    assert (package_path / io_.EXTRACTION_COMPLETE_MARKER).exists()
+
+    # a copy of the package is not extracted again
+    copy = tmp_path / "copy.zip"
+    shutil.copy(package, copy)
+    (package_path / "sentinel").touch()
+    assert io_.extract_resource_package(copy)[2] == package_path
+    assert (package_path / "sentinel").exists()
+
+    # a package replaced at the same path is extracted anew
+    write_package(package, "b")
+    replaced_path = io_.extract_resource_package(package)[2]
+    assert replaced_path != package_path
+    assert (replaced_path / "data" / "file.txt").read_text() == "b"
+    assert (package_path / "data" / "file.txt").read_text() == "a"
+
+    # an incomplete extraction is replaced
+    (replaced_path / io_.EXTRACTION_COMPLETE_MARKER).unlink()
+    (replaced_path / "data" / "file.txt").write_text("partial")
+    assert io_.extract_resource_package(package)[2] == replaced_path
+    assert (replaced_path / "data" / "file.txt").read_text() == "b"
+
+    assert io_.extract_resource_package(package, full_hash=True)[2].name == compute_sha256(package)
+
+
+def test_zip_roots_are_bounded_and_only_trusted_in_the_cache(monkeypatch, cache, tmp_path):
+    import collections
+    import zipfile
+
+    from bioimageio.spec.shared import _zip_root
+
+    monkeypatch.setattr(_zip_root, "_zip_roots", collections.OrderedDict())
+    monkeypatch.setattr(_zip_root, "ZIP_ROOTS_MAX", 2)
+    roots = []
+    for i in range(3):
+        package = tmp_path / f"package{i}.zip"
+        with zipfile.ZipFile(package, "w") as zf:
+            zf.writestr("rdf.yaml", f"name: package{i}")
+
+        roots.append(_zip_root.ZipRoot(package))
+        roots[-1].materialize("rdf.yaml")
+
+    assert list(_zip_root._zip_roots) == [roots[1].path, roots[2].path]
+    # an evicted zip root in the cache is recovered from its extraction marker
+    assert _zip_root.get_zip_root(roots[0].path) == roots[0]
+    assert _zip_root.find_zip_member(roots[0].path / "rdf.yaml") == (roots[0], "rdf.yaml")
+
+    # an extraction marker elsewhere is ignored
+    untrusted = tmp_path / "untrusted"
+    untrusted.mkdir()
+    _zip_root._write_extraction_marker(untrusted, roots[0].zip_path, roots[0].members, set())
+    assert _zip_root.get_zip_root(untrusted) is None
+    assert _zip_root.find_zip_member(untrusted / "rdf.yaml") is None
+    assert not _zip_root.member_exists(untrusted / "rdf.yaml")
+
+
+def test_doi_resolution_is_remembered(monkeypatch, cache):
+    from bioimageio.spec.shared import _resolve_source
+
+    requested = []
+
+    def get(url, **kwargs):
+        requested.append(url)
+        response = FakeResponse(b"")
+        response.url = "https://example.com/model/rdf.yaml"
+        return response
+
+    monkeypatch.setattr(http_client, "get", get)
+    for _ in range(3):
+        assert _resolve_source._resolve_doi("10.1234/abc") == "https://example.com/model/rdf.yaml"
+
+    assert requested == ["https://doi.org/10.1234/abc?type=URL"]
+
+    # expired
+    monkeypatch.setattr(_resolve_source, "BIOIMAGEIO_DOI_TTL", 0)
+    _resolve_source._resolve_doi("10.1234/other")
+    _resolve_source._resolve_doi("10.1234/other")
+    assert len(requested) == 3
+
+
+def test_zenodo_record_listing_is_remembered(monkeypatch, cache):
+    from bioimageio.spec.shared import _resolve_source
+
+    requested = []
+
+    def get(url, **kwargs):
+        requested.append(url)
+        response = FakeResponse(b"")
+        response.json = lambda: {"entries": [{"key": "weights.pt"}, {"key": "model.yaml"}]}
+        return response
+
+    monkeypatch.setattr(http_client, "get", get)
+    api = "https://zenodo.org/api/records"
+    assert _resolve_source._get_zenodo_rdf_name(api, "123") == "model.yaml"
+    assert _resolve_source._get_zenodo_rdf_name(api, "123") == "model.yaml"
+    assert requested == [f"{api}/123/files"]
+
+    def fail(url, **kwargs):
+        raise ConnectionError("offline")
+
+    monkeypatch.setattr(http_client, "get", fail)
+    with pytest.warns(UserWarning, match="Could not list files"):
+        assert _resolve_source._get_zenodo_rdf_name(api, "456") == "rdf.yaml"
+
+
+def test_offline_mode(monkeypatch, cache, tmp_path):
+    from bioimageio.spec.shared import OfflineError, source_available
+
+    url = "https://example.com/a/weights.pt"
+    monkeypatch.setattr(http_client, "get", lambda url, **kwargs: FakeResponse(b"weights"))
+    cached = _download(url)
+
+    mirror = tmp_path / "mirror"
+    (mirror / "example.com" / "b").mkdir(parents=True)
+    (mirror / "example.com" / "b" / "rdf.yaml").write_text("name: mirrored")
+    monkeypatch.setattr(http_client, "offline", True)
+    monkeypatch.setattr(http_client, "mirror_path", mirror)
+
+    def get(url, **kwargs):
+        raise AssertionError("no request expected in offline mode")
+
+    monkeypatch.setattr(http_client, "get", get)
+    # served from the cache (even if a revalidation would be due) or the mirror tree
+    assert _download(url, max_age=0) == cached
+    assert _download("https://example.com/b/rdf.yaml").read_text() == "name: mirrored"
+    assert source_available(URI(uri_string="https://example.com/b/rdf.yaml"), tmp_path)
+    assert not source_available(URI(uri_string="https://example.com/missing.yaml"), tmp_path)
+    with pytest.raises(OfflineError, match="not available offline"):
+        _download("https://example.com/missing.yaml")
+
+    with pytest.raises(OfflineError):
+        http_client.request("GET", url)
+
+
+def test_cache_stats(monkeypatch, cache):
+    from bioimageio.spec.shared import get_cache_stats, reset_cache_stats
+
+    def get(url, headers, **kwargs):
+        if headers.get("If-None-Match") == '"v1"':
+            return FakeResponse(b"", headers={"ETag": '"v1"'}, status_code=304)
+        else:
+            return FakeResponse(b"weights", headers={"ETag": '"v1"'})
+
+    monkeypatch.setattr(http_client, "get", get)
+    reset_cache_stats()
+    url = "https://example.com/weights.pt"
+    _download(url)  # miss
+    _download(url, cache_policy="cache-first")  # hit
+    _download(url, max_age=0)  # revalidated hit
+    stats = get_cache_stats()
+    assert (stats.hits, stats.misses, stats.bytes_downloaded, stats.bytes_served) == (2, 1, 7, 14)
+    assert stats.download_time > 0
+    assert stats.extraction_time == 0
+
+    assert get_cache_stats().since(stats).hits == 0
+    reset_cache_stats()
+    assert get_cache_stats().hits == 0
+
+
+def test_collect_cache_stats(monkeypatch, cache):
+    import threading
+
+    from bioimageio.spec.shared import collect_cache_stats, get_cache_stats
+
+    monkeypatch.setattr(http_client, "get", lambda url, **kwargs: FakeResponse(b"weights"))
+    before = get_cache_stats()
+    with collect_cache_stats() as collected:
+        _download("https://example.com/a.pt")
+        # cache activity of other threads is not collected
+        other = threading.Thread(target=_download, args=("https://example.com/b.pt",))
+        other.start()
+        other.join()
+        with collect_cache_stats() as nested:
+            _download("https://example.com/a.pt", cache_policy="cache-first")
+
+    assert (collected.stats.hits, collected.stats.misses, collected.stats.bytes_downloaded) == (1, 1, 7)
+    assert (nested.stats.hits, nested.stats.misses) == (1, 0)
+    assert get_cache_stats().since(before).misses == 2
+
+
+def test_failing_urls_are_not_requested_again(monkeypatch, cache, tmp_path):
+    import time
+
+    import requests
+
+    from bioimageio.spec.shared import _resolve_source, source_available
+
+    monkeypatch.setattr(_resolve_source, "BIOIMAGEIO_FAILURE_TTL", 0.2)
+    requested = []
+
+    def get(url, **kwargs):
+        requested.append(url)
+        if "dead" in url:
+            raise requests.ConnectionError("unreachable")
+        elif "missing" in url:
+            raise requests.HTTPError("404", response=FakeResponse(b"", status_code=404))
+        else:
+            return FakeResponse(b"content")
+
+    monkeypatch.setattr(http_client, "get", get)
+
+    # hosts are skipped after several consecutive connection failures
+    dead = [f"https://dead.example.com/{name}.txt" for name in "abc"]
+    for url in dead:
+        with pytest.raises(RuntimeError, match="unreachable"):
+            _download(url, retries=0)
+    with pytest.raises(RuntimeError, match="host:dead.example.com .* Not retrying before"):
+        _download("https://dead.example.com/d.txt", retries=0)
+    assert not source_available(URI(uri_string="https://dead.example.com/e.txt"), tmp_path)
+    assert requested == dead
+    # host failures are not persisted
+    assert cache.get_failures("host:dead.example.com") == {}
+    # a failed url is skipped (also by other processes)
+    with pytest.raises(RuntimeError, match=f"{dead[0]} .* Not retrying before"):
+        _download(dead[0], retries=0)
+
+    # missing files are skipped, other files of the same host are not
+    with pytest.raises(RuntimeError):
+        _download("https://example.com/missing.txt", retries=0)
+    with pytest.raises(RuntimeError, match="Not retrying before"):
+        _download("https://example.com/missing.txt", retries=0)
+    _download("https://example.com/present.txt")
+    assert len(requested) == 5
+
+    # retried after the backoff time, which is doubled for every consecutive failure of a url
+    time.sleep(0.25)
+    with pytest.raises(RuntimeError, match="unreachable"):
+        _download(dead[1], retries=0)
+    failure = cache.get_failures(dead[1])[dead[1]]
+    assert failure.count == 2
+    assert 0.3 < failure.retry_after - time.time() <= 0.4
+    host_failure = _resolve_source._host_failures["dead.example.com"]
+    assert host_failure.count == 4
+    assert host_failure.retry_after - time.time() <= 0.2
+
+    # a single connection failure does not make a host unreachable
+    def flaky(url, **kwargs):
+        requested.append(url)
+        if url.endswith("flaky.txt"):
+            raise requests.ConnectionError("reset")
+        return FakeResponse(b"content")
+
+    monkeypatch.setattr(http_client, "get", flaky)
+    with pytest.raises(RuntimeError, match="reset"):
+        _download("https://flaky.example.com/flaky.txt", retries=0)
+    _download("https://flaky.example.com/other.txt")
+    assert "flaky.example.com" not in _resolve_source._host_failures
+
+    # a success clears the failure
+    monkeypatch.setattr(_resolve_source, "BIOIMAGEIO_FAILURE_TTL", 0.01)
+    cache.record_failure("https://example.com/missing.txt", "404", ttl=0, max_ttl=0)
+    monkeypatch.setattr(http_client, "get", lambda url, **kwargs: FakeResponse(b"content"))
+    _download("https://example.com/missing.txt")
+    assert cache.get_failures("https://example.com/missing.txt") == {}
@@ -0,0 +1,125 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from bioimageio.spec.shared.raw_nodes import URI
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_HEAD(self):
+        self.server.clients.add(self.client_address)
+        self.server.paths.append(self.path)
+        if self.path.startswith("/slow/"):
+            with self.server.lock:
+                self.server.concurrent += 1
+                self.server.max_concurrent = max(self.server.max_concurrent, self.server.concurrent)
+
+            time.sleep(0.1)
+            with self.server.lock:
+                self.server.concurrent -= 1
+
+            self.send_response(200)
+        elif self.path.startswith("/redirect/"):
+            n = int(self.path.split("/")[-1])
+            self.send_response(302)
+            self.send_header("Location", f"/redirect/{n - 1}" if n > 1 else "/rdf.yaml")
+        elif self.path == "/rdf.yaml":
+            self.send_response(200)
+        else:
+            self.send_response(404)
+
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.clients = set()
+    server.paths = []
+    server.lock = threading.Lock()
+    server.concurrent = server.max_concurrent = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    from bioimageio.spec.shared import _http, _resolve_source
+
+    client = _http.HttpClient(timeout=5, max_redirects=5)
+    monkeypatch.setattr(_resolve_source, "http_client", client)
+    monkeypatch.setattr(_resolve_source, "_url_available", {})
+    monkeypatch.setattr(_resolve_source, "_url_redirects", {})
+    yield client
+    client.close()
+
+
+def test_connections_are_reused(server, client, tmp_path):
+    from bioimageio.spec.shared._resolve_source import source_available
+
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    for _ in range(5):
+        assert source_available(URI(f"{url}/rdf.yaml"), tmp_path, max_age=0)
+        assert not source_available(URI(f"{url}/missing.yaml"), tmp_path, max_age=0)
+
+    assert source_available(URI(f"{url}/redirect/3"), tmp_path)
+    assert len(server.clients) == 1
+
+
+def test_too_many_redirects(server, client, tmp_path):
+    from bioimageio.spec.shared._resolve_source import source_available
+
+    assert not source_available(URI(f"http://127.0.0.1:{server.server_address[1]}/redirect/10"), tmp_path)
+
+
+def test_configure(client):
+    session = client.session
+    assert client.session is session
+    client.configure(max_redirects=7)
+    assert client.session is not session
+    assert client.session.max_redirects == 7
+
+
+def test_sources_available(server, client, tmp_path):
+    from bioimageio.spec.shared import sources_available
+
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    (tmp_path / "local.txt").touch()
+    sources = [
+        URI(f"{url}/rdf.yaml"),
+        URI(f"{url}/missing.yaml"),
+        URI(f"{url}/redirect/3"),
+        tmp_path / "local.txt",
+        tmp_path / "missing.txt",
+        URI("http://127.0.0.1:1/unreachable"),
+    ]
+    assert sources_available(sources, tmp_path) == [True, False, True, True, False, False]
+
+    # results are reused
+    server.paths.clear()
+    assert sources_available(sources[:3], tmp_path) == [True, False, True]
+    assert server.paths == []
+
+    # redirects are memoized
+    assert sources_available([URI(f"{url}/redirect/3")], tmp_path, max_age=0) == [True]
+    assert server.paths == ["/rdf.yaml"]
+
+
+def test_sources_available_per_host_limit(server, client, tmp_path):
+    from bioimageio.spec.shared import sources_available
+
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    sources = [URI(f"{url}/slow/{i}") for i in range(8)]
+    assert all(sources_available(sources, tmp_path, max_workers=8, per_host_limit=2))
+    assert server.max_concurrent == 2
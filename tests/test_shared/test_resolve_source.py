@@ -1,4 +1,6 @@
 import os
+import subprocess
+import sys
 from pathlib import Path
 from typing import Optional
 
@@ -7,7 +9,7 @@ import pytest
 from bioimageio.spec.shared.raw_nodes import URI
 
 
-def mock_download(uri: URI, output: Optional[os.PathLike] = None, pbar=None):
+def mock_download(uri: URI, output: Optional[os.PathLike] = None, pbar=None, **kwargs):
     return Path(__file__).resolve()
 
 
@@ -20,13 +22,66 @@ def mock_download(uri: URI, output: Optional[os.PathLike] = None, pbar=None):
         URI("https://example.com/fake"),
     ],
 )
-def test_get_resolved_source_path(src):
-    from bioimageio.spec.shared import get_resolved_source_path
+def test_get_resolved_source_path(src, monkeypatch):
+    from bioimageio.spec.shared import _resolve_source, get_resolved_source_path
 
-    import bioimageio.spec
-
-    bioimageio.spec.shared._resolve_source._download_url = mock_download
+    monkeypatch.setattr(_resolve_source, "_download_url", mock_download)
     res = get_resolved_source_path(src, root_path=Path(__file__).parent)
     assert isinstance(res, Path)
     assert res.exists()
     assert res == Path(__file__).resolve()
+
+
+def test_lazy_remote_json_fetches_on_first_access_only(monkeypatch):
+    from bioimageio.spec.shared import _resolve_source
+
+    calls = []
+
+    def mock_resolve_json_from_url(url, *, max_age=None, **kwargs):
+        calls.append(max_age)
+        return {"n": len(calls)}, None
+
+    monkeypatch.setattr(_resolve_source, "_resolve_json_from_url", mock_resolve_json_from_url)
+    remote = _resolve_source.LazyRemoteJson("https://example.com/fake.json", ttl=3600)
+    assert not remote.fetched
+    assert not calls
+
+    assert remote.get() == ({"n": 1}, None)
+    assert remote.get() == ({"n": 1}, None)
+    assert calls == [3600]
+
+    assert remote.refresh() == ({"n": 2}, None)
+    assert calls == [3600, 0]
+    assert remote.version == 2
+
+
+def test_lazy_remote_json_keeps_data_if_refresh_fails(monkeypatch):
+    from bioimageio.spec.shared import _resolve_source
+
+    responses = [({"a": 1}, None), (None, "offline")]
+    monkeypatch.setattr(_resolve_source, "_resolve_json_from_url", lambda url, **kwargs: responses.pop(0))
+    remote = _resolve_source.LazyRemoteJson("https://example.com/fake.json", ttl=0)
+    assert remote.get() == ({"a": 1}, None)
+    with pytest.warns(UserWarning, match="offline"):
+        assert remote.get() == ({"a": 1}, None)
+
+
+def test_import_does_not_access_network():
+    code = """
+import socket, sys, time
+
+def no_network(*args, **kwargs):
+    raise AssertionError("network access on import")
+
+socket.getaddrinfo = socket.create_connection = socket.socket.connect = no_network
+
+t0 = time.perf_counter()
+import bioimageio.spec
+from bioimageio.spec.shared import bioimageio_collection, bioimageio_site_config
+print(f"import bioimageio.spec took {time.perf_counter() - t0:.3f}s")
+sys.exit(bioimageio_collection.fetched or bioimageio_site_config.fetched)
+"""
+    ret = subprocess.run(
+        [sys.executable, "-c", code], stdout=subprocess.PIPE, stderr=subprocess.STDOUT, encoding="utf-8"
+    )
+    assert ret.returncode == 0, ret.stdout
@@ -0,0 +1,58 @@
+import time
+
+from bioimageio.spec.shared.raw_nodes import URI
+
+
+def test_example_spec_from_local_server(local_server, local_transport, isolated_cache, unet2d_nuclei_broad_url):
+    from bioimageio.spec import load_raw_resource_description
+
+    raw_rd = load_raw_resource_description(unet2d_nuclei_broad_url)
+    assert raw_rd.name == "UNet 2D Nuclei Broad"
+    assert ("GET", unet2d_nuclei_broad_url.replace("https:/", "")) in local_server.requests
+
+
+def test_zenodo_doi(local_server, local_transport, isolated_cache, unet2d_nuclei_broad_latest):
+    from bioimageio.spec.shared import resolve_rdf_source
+
+    local_server.add_zenodo_record("1234", {"rdf.yaml": unet2d_nuclei_broad_latest.resolve()})
+    data, source_name, root = resolve_rdf_source("10.5281/zenodo.1234")
+    assert data["name"] == "UNet 2D Nuclei Broad"
+    assert ("GET", "/zenodo.org/api/records/1234/files/rdf.yaml/content") in local_server.requests
+    assert ("GET", "/zenodo.org/api/records/1234/files") not in local_server.requests
+
+    # the record's files are only listed to find an RDF with another name
+    local_server.add_zenodo_record("5678", {"model.yaml": unet2d_nuclei_broad_latest.resolve()})
+    data, source_name, root = resolve_rdf_source("10.5281/zenodo.5678")
+    assert data["name"] == "UNet 2D Nuclei Broad"
+    assert ("GET", "/zenodo.org/api/records/5678/files") in local_server.requests
+    assert ("GET", "/zenodo.org/api/records/5678/files/model.yaml/content") in local_server.requests
+
+
+def test_doi_redirect(local_server, local_transport, isolated_cache):
+    from bioimageio.spec.shared import resolve_rdf_source
+
+    local_server.add_file("https://example.com/rdf.yaml", b"name: remote\n")
+    local_server.add_doi("10.1234/remote", "https://example.com/rdf.yaml")
+    data, source_name, root = resolve_rdf_source("10.1234/remote")
+    assert data == {"name": "remote"}
+
+
+def test_large_file_with_limited_bandwidth(local_server, local_transport, isolated_cache, tmp_path):
+    from bioimageio.spec.shared import source_available
+    from bioimageio.spec.shared._resolve_source import _download_url
+
+    url = "https://example.com/weights.pt"
+    sha256 = local_server.add_large_file(url, 2 * 1024**2)
+    local_server.bandwidth = 8 * 1024**2
+    local_server.latency = 0.05
+    assert source_available(URI(uri_string=url), tmp_path)
+
+    start = time.perf_counter()
+    path = _download_url(URI(uri_string=url), sha256=sha256)
+    assert time.perf_counter() - start >= 0.25
+    assert path.stat().st_size == 2 * 1024**2
+
+    # served from the cache
+    local_server.requests.clear()
+    assert _download_url(URI(uri_string=url), sha256=sha256) == path
+    assert local_server.requests == []